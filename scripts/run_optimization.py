@@ -19,7 +19,8 @@ logger = get_logger("run_optimization")
 
 
 def main():
-    setup_logging()
+    # Thousands of backtests run here; per-trade INFO logs only add overhead
+    setup_logging(level="WARNING")
     parser = argparse.ArgumentParser(description="Optimize strategy parameters")
     parser.add_argument("--csv", type=str, help="Path to CSV file with OHLCV bars")
     parser.add_argument("--bars", type=int, default=2000, help="Number of synthetic bars")
@@ -9,7 +9,15 @@ Usage: python -m scripts.seed_demo
 import random
 from datetime import UTC, datetime, timedelta
 
-from src.core.database import get_duckdb_connection, get_sqlite_engine, init_duckdb, init_sqlite_db
+from src.core.database import (
+    INDICATOR_CACHE_COLUMNS,
+    DuckDBBatchWriter,
+    dedupe_duckdb_table,
+    get_duckdb_connection,
+    get_sqlite_engine,
+    init_duckdb,
+    init_sqlite_db,
+)
 from src.core.logging import get_logger, setup_logging
 from src.core.models import Direction, EquitySnapshot, Trade, TradeStatus
 from src.indicators.calculator import IndicatorCalculator
@@ -46,28 +54,28 @@ def main():
 
     # Compute and store indicators
     calc = IndicatorCalculator()
-    indicator_count = 0
+    writer = DuckDBBatchWriter(conn, "indicator_cache", INDICATOR_CACHE_COLUMNS)
+    rows = []
     for bar in bars:
         snapshot = calc.update(bar)
         if snapshot:
-            try:
-                conn.execute(
-                    """INSERT OR REPLACE INTO indicator_cache
-                       (timestamp, symbol, timeframe, vwap, bb_upper, bb_middle, bb_lower,
-                        keltner_upper, keltner_middle, keltner_lower, rsi_14, atr_14,
-                        ema_9, ema_21, volume_profile_poc)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    [
-                        snapshot.timestamp, snapshot.symbol, snapshot.timeframe,
-                        snapshot.vwap, snapshot.bb_upper, snapshot.bb_middle, snapshot.bb_lower,
-                        snapshot.keltner_upper, snapshot.keltner_middle, snapshot.keltner_lower,
-                        snapshot.rsi_14, snapshot.atr_14, snapshot.ema_9, snapshot.ema_21,
-                        snapshot.volume_profile_poc,
-                    ],
-                )
-                indicator_count += 1
-            except Exception as e:
-                print(f"Error storing indicator: {e}")
+            rows.append((
+                snapshot.timestamp, snapshot.symbol, snapshot.timeframe,
+                snapshot.vwap, snapshot.bb_upper, snapshot.bb_middle, snapshot.bb_lower,
+                snapshot.keltner_upper, snapshot.keltner_middle, snapshot.keltner_lower,
+                snapshot.rsi_14, snapshot.atr_14, snapshot.ema_9, snapshot.ema_21,
+                snapshot.volume_profile_poc,
+            ))
+    indicator_count = 0
+    try:
+        for row in rows:
+            writer.add(row)
+        writer.flush()
+        indicator_count = len(rows)
+        # Re-running the seed replaces earlier snapshots
+        dedupe_duckdb_table(conn, "indicator_cache")
+    except Exception as e:
+        print(f"Error storing indicators: {e}")
 
     print(f"Stored {indicator_count} indicator snapshots")
 
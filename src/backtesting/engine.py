@@ -93,12 +93,15 @@ class BacktestEngine:
                 order_mgr.process_signals(pending_risk_results)
                 pending_risk_results = []
 
-            # Phase 2: Check open positions for exits on this bar
+            # Phase 2: Check open positions for exits on this bar (also
+            # updates the daily tracker's unrealized P&L)
             closed_trades = order_mgr.on_bar(bar)
             results.trades.extend(closed_trades)
 
             # Phase 3: Compute indicators + regime
             snapshot = indicator_calc.update(bar)
+            if snapshot is not None:
+                order_mgr.set_atr(snapshot.atr_14)
             if regime_detector is not None:
                 regime_detector.on_1m_bar(bar)
 
@@ -113,10 +116,6 @@ class BacktestEngine:
                 r for r in risk_results if r.decision != RiskDecision.REJECTED
             ]
 
-            # Update unrealized P&L
-            unrealized = order_mgr.get_total_unrealized_pnl()
-            risk_mgr.daily_tracker.update_unrealized(unrealized)
-
             results.bars_processed += 1
 
         # Force-close any remaining open positions at last bar's close
@@ -75,11 +75,14 @@ class OptunaOptimizer:
         starting_equity: float = 10000.0,
         n_trials: int = 300,
         risk_config: dict | None = None,
+        n_jobs: int = 1,
     ) -> None:
         self.bars = bars
         self.starting_equity = starting_equity
         self.n_trials = n_trials
         self.risk_config = risk_config
+        # Optuna runs trials on this many threads; only n_jobs=1 is reproducible
+        self.n_jobs = n_jobs
 
     def _objective(self, trial: optuna.Trial) -> float:
         """Single trial: suggest params, run backtest, return score."""
@@ -118,7 +121,12 @@ class OptunaOptimizer:
             direction="maximize",
             sampler=optuna.samplers.TPESampler(seed=42),
         )
-        study.optimize(self._objective, n_trials=self.n_trials, show_progress_bar=False)
+        study.optimize(
+            self._objective,
+            n_trials=self.n_trials,
+            n_jobs=self.n_jobs,
+            show_progress_bar=False,
+        )
 
         logger.info(
             "optimization_complete",
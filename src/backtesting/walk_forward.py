@@ -9,10 +9,11 @@ Default: 6-month IS / 2-month OOS, rolling forward by OOS window size.
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 
 from src.backtesting.engine import BacktestEngine
-from src.backtesting.optimizer import OptunaOptimizer
+from src.backtesting.optimizer import OptunaOptimizer, composite_objective
 from src.backtesting.results import BacktestResults
 from src.core.logging import get_logger
 from src.core.models import Bar
@@ -62,7 +63,11 @@ class WalkForwardReport:
 
 
 class WalkForwardAnalyzer:
-    """Rolling walk-forward optimization and validation."""
+    """Rolling walk-forward optimization and validation.
+
+    Folds are independent, so with ``n_jobs`` > 1 they run in a process
+    pool; each fold's search is seeded, so the report matches a serial run.
+    """
 
     def __init__(
         self,
@@ -72,6 +77,7 @@ class WalkForwardAnalyzer:
         trials_per_fold: int = 100,
         starting_equity: float = 10000.0,
         risk_config: dict | None = None,
+        n_jobs: int = 1,
     ) -> None:
         self.bars = bars
         self.is_bars = is_bars
@@ -79,81 +85,38 @@ class WalkForwardAnalyzer:
         self.trials_per_fold = trials_per_fold
         self.starting_equity = starting_equity
         self.risk_config = risk_config
+        self.n_jobs = n_jobs
 
     def run(self) -> WalkForwardReport:
         """Execute walk-forward analysis across all folds."""
         report = WalkForwardReport()
-        total_bars = len(self.bars)
         fold_size = self.is_bars + self.oos_bars
-        fold_num = 0
-
-        start = 0
-        while start + fold_size <= total_bars:
-            fold_num += 1
-            is_end = start + self.is_bars
-            oos_end = is_end + self.oos_bars
-
-            is_data = self.bars[start:is_end]
-            oos_data = self.bars[is_end:oos_end]
-
-            logger.info(
-                "walk_forward_fold",
-                fold=fold_num,
-                is_bars=len(is_data),
-                oos_bars=len(oos_data),
-            )
 
-            # Optimize on in-sample
-            optimizer = OptunaOptimizer(
-                bars=is_data,
-                starting_equity=self.starting_equity,
-                n_trials=self.trials_per_fold,
-                risk_config=self.risk_config,
+        # Roll forward by OOS window
+        fold_args = [
+            (
+                fold_num,
+                self.bars[start:start + self.is_bars],
+                self.bars[start + self.is_bars:start + fold_size],
+                self.trials_per_fold,
+                self.starting_equity,
+                self.risk_config,
             )
-            best_params, is_score = optimizer.optimize()
-
-            # Validate on out-of-sample
-            config = StrategyConfig(name="mean_reversion", params=best_params)
-            try:
-                strategy = MeanReversionStrategy(config=config)
-            except (AssertionError, ValueError):
-                fold = WalkForwardFold(
-                    fold_number=fold_num,
-                    is_bars=len(is_data),
-                    oos_bars=len(oos_data),
-                    best_params=best_params,
-                    is_score=is_score,
-                )
-                report.folds.append(fold)
-                start += self.oos_bars
-                continue
-
-            engine = BacktestEngine(
-                strategies=[strategy],
-                starting_equity=self.starting_equity,
-                risk_config=self.risk_config,
+            for fold_num, start in enumerate(
+                range(0, len(self.bars) - fold_size + 1, self.oos_bars), start=1
             )
-            oos_results = engine.run(oos_data)
-
-            from src.backtesting.optimizer import composite_objective
-            oos_score = composite_objective(oos_results)
-
-            fold = WalkForwardFold(
-                fold_number=fold_num,
-                is_bars=len(is_data),
-                oos_bars=len(oos_data),
-                best_params=best_params,
-                is_score=is_score,
-                oos_results=oos_results,
-                oos_score=oos_score,
-            )
-            report.folds.append(fold)
+        ]
 
-            if oos_results.metrics:
-                report.total_oos_trades += oos_results.metrics.total_trades
-                report.total_oos_pnl += oos_results.metrics.net_pnl
+        if self.n_jobs > 1 and len(fold_args) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.n_jobs, len(fold_args))) as pool:
+                report.folds = list(pool.map(_run_fold, fold_args))
+        else:
+            report.folds = [_run_fold(args) for args in fold_args]
 
-            start += self.oos_bars  # Roll forward by OOS window
+        for fold in report.folds:
+            if fold.oos_results is not None and fold.oos_results.metrics:
+                report.total_oos_trades += fold.oos_results.metrics.total_trades
+                report.total_oos_pnl += fold.oos_results.metrics.net_pnl
 
         if report.folds:
             report.avg_is_score = sum(f.is_score for f in report.folds) / len(report.folds)
@@ -167,3 +130,59 @@ class WalkForwardAnalyzer:
         )
 
         return report
+
+
+def _run_fold(
+    args: tuple[int, list[Bar], list[Bar], int, float, dict | None],
+) -> WalkForwardFold:
+    """Optimize one fold in-sample and validate it out-of-sample.
+
+    Module-level, with its inputs in one tuple, so a process pool can run it.
+    """
+    fold_num, is_data, oos_data, trials_per_fold, starting_equity, risk_config = args
+
+    logger.info(
+        "walk_forward_fold",
+        fold=fold_num,
+        is_bars=len(is_data),
+        oos_bars=len(oos_data),
+    )
+
+    # Optimize on in-sample
+    optimizer = OptunaOptimizer(
+        bars=is_data,
+        starting_equity=starting_equity,
+        n_trials=trials_per_fold,
+        risk_config=risk_config,
+    )
+    best_params, is_score = optimizer.optimize()
+
+    # Validate on out-of-sample
+    config = StrategyConfig(name="mean_reversion", params=best_params)
+    try:
+        strategy = MeanReversionStrategy(config=config)
+    except (AssertionError, ValueError):
+        return WalkForwardFold(
+            fold_number=fold_num,
+            is_bars=len(is_data),
+            oos_bars=len(oos_data),
+            best_params=best_params,
+            is_score=is_score,
+        )
+
+    engine = BacktestEngine(
+        strategies=[strategy],
+        starting_equity=starting_equity,
+        risk_config=risk_config,
+    )
+    oos_results = engine.run(oos_data)
+
+    return WalkForwardFold(
+        fold_number=fold_num,
+        is_bars=len(is_data),
+        oos_bars=len(oos_data),
+        best_params=best_params,
+        is_score=is_score,
+        oos_results=oos_results,
+        oos_score=composite_objective(oos_results),
+    )
@@ -0,0 +1,26 @@
+"""Optional numba JIT decorator.
+
+Exports ``njit`` as ``numba.njit`` when numba is installed (the
+``performance`` extra) and as a pass-through decorator otherwise, so
+kernel modules can always decorate with ``@njit(...)``.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def deco(f):
+            return f
+
+        return deco
+
+__all__ = ["HAS_NUMBA", "njit"]
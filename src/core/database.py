@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+from concurrent.futures import Executor
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -21,6 +23,9 @@ from sqlalchemy import (
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from src.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger("database")
 
 
 class Base(DeclarativeBase):
@@ -163,14 +168,32 @@ class DrawdownTrackRow(Base):
 
 
 def _set_wal_mode(dbapi_conn, connection_record):
-    """Enable WAL mode for SQLite on every connection."""
+    """Enable WAL mode and tuned PRAGMAs for SQLite on every connection."""
     cursor = dbapi_conn.cursor()
+    # WAL + synchronous=NORMAL: commits append to the WAL and only sync at
+    # checkpoints. A power loss can drop the last few commits, but never
+    # corrupts the database; fine for journal rows, and it takes the
+    # fsync off every signal/trade write.
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA synchronous=NORMAL")
     cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA cache_size=-64000")  # 64MB page cache
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+    cursor.execute("PRAGMA wal_autocheckpoint=1000")  # pages
     cursor.close()
 
 
+def configure_sqlite_engine(engine) -> None:
+    """Apply the WAL PRAGMAs to new connections of an engine made elsewhere.
+
+    Engines from get_sqlite_engine already have them; connections opened
+    before the call are left as they are.
+    """
+    if not event.contains(engine, "connect", _set_wal_mode):
+        event.listen(engine, "connect", _set_wal_mode)
+
+
 def get_sqlite_engine(db_url: str | None = None):
     """Create SQLite engine with WAL mode enabled."""
     url = db_url or settings.db.sqlite_url
@@ -179,7 +202,7 @@ def get_sqlite_engine(db_url: str | None = None):
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
     engine = create_engine(url, echo=False)
-    event.listen(engine, "connect", _set_wal_mode)
+    configure_sqlite_engine(engine)
     return engine
 
 
@@ -207,7 +230,11 @@ def get_duckdb_connection(db_path: Path | None = None) -> duckdb.DuckDBPyConnect
 
 
 def init_duckdb(conn: duckdb.DuckDBPyConnection | None = None) -> None:
-    """Create DuckDB market data tables."""
+    """Create DuckDB market data tables.
+
+    No primary keys: inserts stay append-only and skip per-row conflict
+    checks. See DUCKDB_TABLE_KEYS for each table's logical key.
+    """
     conn = conn or get_duckdb_connection()
 
     conn.execute("""
@@ -220,8 +247,7 @@ def init_duckdb(conn: duckdb.DuckDBPyConnection | None = None) -> None:
             close DOUBLE NOT NULL,
             volume BIGINT NOT NULL,
             vwap DOUBLE,
-            trade_count INTEGER,
-            PRIMARY KEY (timestamp, symbol)
+            trade_count INTEGER
         )
     """)
 
@@ -234,8 +260,7 @@ def init_duckdb(conn: duckdb.DuckDBPyConnection | None = None) -> None:
             low DOUBLE NOT NULL,
             close DOUBLE NOT NULL,
             volume BIGINT NOT NULL,
-            vwap DOUBLE,
-            PRIMARY KEY (timestamp, symbol)
+            vwap DOUBLE
         )
     """)
 
@@ -255,7 +280,158 @@ def init_duckdb(conn: duckdb.DuckDBPyConnection | None = None) -> None:
             atr_14 DOUBLE,
             ema_9 DOUBLE,
             ema_21 DOUBLE,
-            volume_profile_poc DOUBLE,
-            PRIMARY KEY (timestamp, symbol, timeframe)
+            volume_profile_poc DOUBLE
         )
     """)
+
+
+# Column order used when writing rows to the DuckDB tables above
+BARS_1M_COLUMNS = (
+    "timestamp", "symbol", "open", "high", "low", "close", "volume", "vwap", "trade_count",
+)
+BARS_5M_COLUMNS = ("timestamp", "symbol", "open", "high", "low", "close", "volume", "vwap")
+INDICATOR_CACHE_COLUMNS = (
+    "timestamp", "symbol", "timeframe", "vwap", "bb_upper", "bb_middle", "bb_lower",
+    "keltner_upper", "keltner_middle", "keltner_lower", "rsi_14", "atr_14",
+    "ema_9", "ema_21", "volume_profile_poc",
+)
+
+
+# Logical key of each market data table. Tables are append-only; duplicate
+# keys are cleared periodically by dedupe_duckdb_table.
+DUCKDB_TABLE_KEYS = {
+    "bars_1m": ("timestamp", "symbol"),
+    "bars_5m": ("timestamp", "symbol"),
+    "indicator_cache": ("timestamp", "symbol", "timeframe"),
+}
+
+
+class DuckDBBatchWriter:
+    """Buffers rows for one DuckDB table and appends them in batches.
+
+    Each flush writes its rows in one transaction as multi-row
+    ``VALUES (...), (...)`` statements, so DuckDB parses and plans once per
+    chunk rather than once per row. Statements are cached per row count.
+    ``add`` flushes on its own once ``flush_every`` rows are pending.
+
+    Market data tables are append-only (see dedupe_duckdb_table). Tables
+    created with a primary key by older versions reject duplicates, so a
+    batch that hits one is retried as INSERT OR REPLACE, keeping only the
+    last queued row per key (DuckDB rejects a key twice in one statement).
+
+    With an ``executor`` (a single-worker pool), flushes are handed to it
+    and run on its thread through a cursor of their own, so callers on the
+    market data path never wait on DuckDB; write errors are logged there.
+    """
+
+    def __init__(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        table: str,
+        columns: tuple[str, ...],
+        flush_every: int = 64,
+        executor: Executor | None = None,
+    ) -> None:
+        # A DuckDB connection must not be shared across threads; a cursor
+        # is an independent connection to the same database
+        self.conn = conn.cursor() if executor is not None else conn
+        self.table = table
+        self.flush_every = flush_every
+        self.executor = executor
+        self._target = f"{table} ({', '.join(columns)}) VALUES "
+        self._row_placeholders = "(" + ", ".join("?" * len(columns)) + ")"
+        self._key_indices = tuple(
+            columns.index(key) for key in DUCKDB_TABLE_KEYS.get(table, ())
+        )
+        # Rows per statement, keeping the bound parameter count under 1000
+        self._chunk_rows = max(1, 999 // len(columns))
+        self._sql_cache: dict[tuple[bool, int], str] = {}
+        self._rows: list[tuple] = []
+        # Rows are queued on the bar path but may be flushed from a
+        # scheduler thread
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, row: tuple) -> None:
+        """Queue one row, flushing when the batch is full."""
+        with self._lock:
+            self._rows.append(row)
+            full = len(self._rows) >= self.flush_every
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all queued rows in one transaction. Returns rows written.
+
+        Queued rows are dropped if the write fails; the error propagates
+        (or is logged, when writing on the executor).
+        """
+        with self._lock:
+            if not self._rows:
+                return 0
+            rows, self._rows = self._rows, []
+        if self.executor is not None:
+            self.executor.submit(self._write_logged, rows)
+        else:
+            self._write_rows(rows)
+        return len(rows)
+
+    def _write_rows(self, rows: list[tuple]) -> None:
+        try:
+            self._write(rows, upsert=False)
+        except duckdb.ConstraintException:
+            self._write(self._last_per_key(rows), upsert=True)
+
+    def _last_per_key(self, rows: list[tuple]) -> list[tuple]:
+        """Drop all but the last queued row for each table key."""
+        idx = self._key_indices
+        if not idx:
+            return rows
+        latest = {tuple(row[i] for i in idx): row for row in rows}
+        if len(latest) == len(rows):
+            return rows
+        return list(latest.values())
+
+    def _write_logged(self, rows: list[tuple]) -> None:
+        try:
+            self._write_rows(rows)
+        except Exception as e:
+            logger.error("duckdb_write_failed", table=self.table, rows=len(rows), error=str(e))
+
+    def _sql(self, upsert: bool, n_rows: int) -> str:
+        """INSERT statement with n_rows row placeholders (cached)."""
+        key = (upsert, n_rows)
+        sql = self._sql_cache.get(key)
+        if sql is None:
+            verb = "INSERT OR REPLACE INTO " if upsert else "INSERT INTO "
+            sql = verb + self._target + ", ".join([self._row_placeholders] * n_rows)
+            self._sql_cache[key] = sql
+        return sql
+
+    def _write(self, rows: list[tuple], upsert: bool) -> None:
+        step = self._chunk_rows
+        self.conn.begin()
+        try:
+            for i in range(0, len(rows), step):
+                chunk = rows[i:i + step]
+                params = [value for row in chunk for value in row]
+                self.conn.execute(self._sql(upsert, len(chunk)), params)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+
+def dedupe_duckdb_table(conn: duckdb.DuckDBPyConnection, table: str) -> int:
+    """Drop duplicate rows by the table's key, keeping the latest write.
+
+    Returns the number of rows deleted.
+    """
+    keys = ", ".join(DUCKDB_TABLE_KEYS[table])
+    result = conn.execute(
+        f"""DELETE FROM {table}
+            WHERE rowid NOT IN (SELECT max(rowid) FROM {table} GROUP BY {keys})"""
+    ).fetchone()
+    return result[0] if result else 0
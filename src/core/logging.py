@@ -33,8 +33,19 @@ def _safe_log_output():
         return open(os.devnull, "w", encoding="utf-8")  # noqa: SIM115
 
 
-def setup_logging() -> None:
-    """Configure structlog for JSON or console output."""
+# Active minimum level, mirrored here so hot paths can skip building
+# log kwargs entirely when the record would be filtered anyway.
+_min_level: int = logging.INFO
+
+
+def setup_logging(level: str | None = None) -> None:
+    """Configure structlog for JSON or console output.
+
+    level overrides LOG_LEVEL (e.g. "WARNING" for quiet backtest runs).
+    """
+    global _min_level
+    _min_level = logging.getLevelName((level or settings.log.level).upper())
+
     shared_processors = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
@@ -53,9 +64,7 @@ def setup_logging() -> None:
             structlog.processors.format_exc_info,
             renderer,
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            logging.getLevelName(settings.log.level)
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(_min_level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(file=_safe_log_output()),
         cache_logger_on_first_use=False,
@@ -69,3 +78,13 @@ setup_logging()
 def get_logger(name: str) -> structlog.BoundLogger:
     """Get a named logger instance."""
     return structlog.get_logger(name)
+
+
+def info_enabled() -> bool:
+    """True if INFO records are emitted under the current configuration."""
+    return _min_level <= logging.INFO
+
+
+def debug_enabled() -> bool:
+    """True if DEBUG records are emitted under the current configuration."""
+    return _min_level <= logging.DEBUG
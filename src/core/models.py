@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from enum import Enum
+from typing import NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer
 
 
 class Direction(str, Enum):
@@ -13,6 +14,10 @@ class Direction(str, Enum):
     SHORT = "SHORT"
 
 
+# +1 for LONG, -1 for SHORT: favorable move = (new - old) * sign
+DIRECTION_SIGN = {Direction.LONG: 1.0, Direction.SHORT: -1.0}
+
+
 class OrderStatus(str, Enum):
     PENDING = "PENDING"
     SUBMITTED = "SUBMITTED"
@@ -110,6 +115,19 @@ class Signal(BaseModel):
     market_context: IndicatorSnapshot | None = None
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
+    # (snapshot, its JSON dump); one signal is persisted once per account
+    _context_dump: tuple[IndicatorSnapshot, dict] | None = PrivateAttr(default=None)
+
+    def market_context_dict(self) -> dict | None:
+        """market_context as a JSON-ready dict, dumped once per snapshot."""
+        snapshot = self.market_context
+        if snapshot is None:
+            return None
+        cached = self._context_dump
+        if cached is None or cached[0] is not snapshot:
+            cached = self._context_dump = (snapshot, snapshot.model_dump(mode="json"))
+        return cached[1]
+
 
 class RiskResult(BaseModel):
     """Result of risk manager evaluation."""
@@ -146,14 +164,21 @@ class Trade(BaseModel):
     ai_review: str | None = None
     notes: str | None = None
 
+    _dir_sign: float = PrivateAttr(default=1.0)
+
+    def model_post_init(self, __context) -> None:
+        self._dir_sign = DIRECTION_SIGN[self.direction]
+
+    @property
+    def dir_sign(self) -> float:
+        """+1.0 for LONG, -1.0 for SHORT (fixed at construction)."""
+        return self._dir_sign
+
     def calculate_pnl(self, tick_value: float = 1.25) -> None:
         """Calculate P&L when trade is closed."""
         if self.exit_price is None:
             return
-        if self.direction == Direction.LONG:
-            self.pnl_ticks = (self.exit_price - self.entry_price) / 0.25
-        else:
-            self.pnl_ticks = (self.entry_price - self.exit_price) / 0.25
+        self.pnl_ticks = (self.exit_price - self.entry_price) * self._dir_sign / 0.25
         self.pnl_dollars = (self.pnl_ticks * tick_value * self.quantity) - self.commission
 
     def calculate_risk_reward(self) -> None:
@@ -180,40 +205,62 @@ class Position(BaseModel):
     trailing_activated: bool = False
     scale_out_done: bool = False
     original_quantity: int | None = None
+    # Most favorable closes seen so far (start at entry)
+    high_water: float | None = None
+    low_water: float | None = None
+
+    def model_post_init(self, __context) -> None:
+        if self.high_water is None:
+            self.high_water = self.trade.entry_price
+        if self.low_water is None:
+            self.low_water = self.trade.entry_price
 
     def update_price(self, price: float, tick_value: float = 1.25) -> None:
         """Update position with latest price."""
         self.current_price = price
-        if self.trade.direction == Direction.LONG:
-            pnl_ticks = (price - self.trade.entry_price) / 0.25
-        else:
-            pnl_ticks = (self.trade.entry_price - price) / 0.25
+        pnl_ticks = (price - self.trade.entry_price) * self.trade.dir_sign / 0.25
         self.unrealized_pnl = pnl_ticks * tick_value * self.trade.quantity
 
     def should_stop_out(self) -> bool:
         """Check if current price has hit stop loss."""
         stop = self.trailing_stop or self.trade.stop_loss
-        if self.trade.direction == Direction.LONG:
-            return self.current_price <= stop
-        return self.current_price >= stop
+        return (self.current_price - stop) * self.trade.dir_sign <= 0
 
     def should_take_profit(self) -> bool:
         """Check if current price has hit take profit."""
         if self.trade.take_profit is None:
             return False
-        if self.trade.direction == Direction.LONG:
-            return self.current_price >= self.trade.take_profit
-        return self.current_price <= self.trade.take_profit
+        return (self.current_price - self.trade.take_profit) * self.trade.dir_sign >= 0
+
+
+class RejectDetails(NamedTuple):
+    """Details of a rejected signal, kept as a tuple until serialized."""
+
+    strategy: str
+    direction: str
+    entry: float
+    stop: float
+    reason: str
 
 
 class RiskEvent(BaseModel):
     """A risk rule trigger event."""
 
     event_type: str
-    details: dict
+    details: dict | RejectDetails
     severity: Severity
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
+    @field_serializer("details")
+    def _serialize_details(self, details: dict | RejectDetails) -> dict:
+        return self.details_dict()
+
+    def details_dict(self) -> dict:
+        """Details as a plain dict, for JSON storage and logging."""
+        if isinstance(self.details, RejectDetails):
+            return self.details._asdict()
+        return self.details
+
 
 class EquitySnapshot(BaseModel):
     """Account equity at a point in time."""
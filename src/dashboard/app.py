@@ -9,19 +9,24 @@ from __future__ import annotations
 import json
 from datetime import datetime, time, timedelta
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 import duckdb
 import pandas as pd
 import plotly.graph_objects as go
-import pytz
 import streamlit as st
 from plotly.subplots import make_subplots
 from sqlalchemy import text
 
 from src.config import MES_SPEC, RISK_DEFAULTS, settings
-from src.core.database import get_duckdb_connection, get_session, get_sqlite_engine
+from src.core.database import (
+    DUCKDB_TABLE_KEYS,
+    get_duckdb_connection,
+    get_session,
+    get_sqlite_engine,
+)
 
-ET = pytz.timezone("America/New_York")
+ET = ZoneInfo("America/New_York")
 
 
 # -- Page Config --
@@ -57,12 +62,25 @@ def _load_accounts() -> list[dict]:
         return [{"account_id": "default", "name": "Default", "equity": 50000.0}]
 
 
+def _latest_per_key(table: str) -> str:
+    """QUALIFY clause keeping the newest row per key.
+
+    The market data tables are append-only and deduped nightly, so rows
+    rewritten during the day are still duplicated until then.
+    """
+    keys = ", ".join(DUCKDB_TABLE_KEYS[table])
+    return f"QUALIFY row_number() OVER (PARTITION BY {keys} ORDER BY rowid DESC) = 1"
+
+
 def load_bars(conn: duckdb.DuckDBPyConnection, timeframe: str = "1m", limit: int = 200) -> pd.DataFrame:
     """Load recent bars from DuckDB."""
     table = f"bars_{timeframe}"
     try:
         df = conn.execute(
-            f"SELECT * FROM {table} WHERE symbol = ? ORDER BY timestamp DESC LIMIT ?",
+            f"""SELECT * FROM {table}
+                WHERE symbol = ?
+                {_latest_per_key(table)}
+                ORDER BY timestamp DESC LIMIT ?""",
             [settings.trading.symbol, limit],
         ).fetchdf()
         if not df.empty:
@@ -76,9 +94,10 @@ def load_indicators(conn: duckdb.DuckDBPyConnection, timeframe: str = "1m", limi
     """Load recent indicator values from DuckDB."""
     try:
         df = conn.execute(
-            """SELECT * FROM indicator_cache
-               WHERE symbol = ? AND timeframe = ?
-               ORDER BY timestamp DESC LIMIT ?""",
+            f"""SELECT * FROM indicator_cache
+                WHERE symbol = ? AND timeframe = ?
+                {_latest_per_key("indicator_cache")}
+                ORDER BY timestamp DESC LIMIT ?""",
             [settings.trading.symbol, timeframe, limit],
         ).fetchdf()
         if not df.empty:
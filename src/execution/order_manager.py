@@ -7,10 +7,9 @@ handles trailing stops, and coordinates with executor for fills.
 from __future__ import annotations
 
 from src.config import MES_SPEC
-from src.core.logging import get_logger
+from src.core.logging import get_logger, info_enabled
 from src.core.models import (
     Bar,
-    Direction,
     Position,
     RiskDecision,
     RiskResult,
@@ -20,7 +19,7 @@ from src.core.models import (
 from src.execution.base_executor import BaseExecutor
 from src.journal.recorder import TradeRecorder
 from src.risk.manager import RiskManager
-from src.risk.stop_loss import update_trailing_stop
+from src.risk.stop_loss import trail_stop_by_distance
 
 logger = get_logger("order_manager")
 
@@ -35,13 +34,32 @@ class OrderManager:
         recorder: TradeRecorder | None = None,
         atr_for_trailing: float = 3.0,
         account_id: str = "default",
+        trailing_atr_multiple: float = 1.5,
     ) -> None:
         self.executor = executor
         self.risk_manager = risk_manager
         self.recorder = recorder
         self.atr_for_trailing = atr_for_trailing
+        self.trailing_atr_multiple = trailing_atr_multiple
         self.account_id = account_id
         self.open_positions: list[Position] = []
+        # Running sum of open positions' unrealized P&L, maintained by delta
+        self._total_unrealized = 0.0
+
+        # Trail distance in price units, refreshed only when ATR changes
+        self._trail_offset = atr_for_trailing * trailing_atr_multiple
+        # Set when ATR contracts so in-range positions get re-evaluated once
+        self._trail_tightened = False
+
+    def set_atr(self, atr: float | None) -> None:
+        """Update the ATR used for trailing stops (call once per new snapshot)."""
+        if atr is None or atr <= 0 or atr == self.atr_for_trailing:
+            return
+        offset = atr * self.trailing_atr_multiple
+        if offset < self._trail_offset:
+            self._trail_tightened = True
+        self.atr_for_trailing = atr
+        self._trail_offset = offset
 
     def process_signals(self, risk_results: list[RiskResult]) -> list[Trade]:
         """Process approved risk results into open trades."""
@@ -60,35 +78,66 @@ class OrderManager:
     def on_bar(self, bar: Bar) -> list[Trade]:
         """Check all open positions against new bar for exits.
 
-        Updates prices, checks stop-loss, take-profit, trailing stops.
+        Updates prices, checks stop-loss, take-profit, trailing stops, and
+        pushes the open unrealized P&L to the risk manager's daily tracker.
         Returns list of closed trades.
+
+        Each position is handled in a single pass: trade fields are read
+        once into locals and every direction-dependent comparison is done
+        against the trade's direction sign.
         """
         closed_trades: list[Trade] = []
         remaining: list[Position] = []
+        close = bar.close
+        tightened = self._trail_tightened
 
         for position in self.open_positions:
-            position.update_price(bar.close)
-
-            # Update trailing stop
-            self._update_trailing_stop(position, bar)
-
-            # Check exit conditions
-            if position.should_stop_out():
-                stop = position.trailing_stop or position.trade.stop_loss
-                trade = self._close_position(position, stop, "stop_loss")
-                closed_trades.append(trade)
-            elif self._should_scale_out(position, bar):
-                self._execute_scale_out(position, bar)
-                remaining.append(position)
-            elif position.should_take_profit():
-                trade = self._close_position(
-                    position, position.trade.take_profit, "take_profit"
-                )
-                closed_trades.append(trade)
+            t = position.trade
+            sign = t.dir_sign
+            entry = t.entry_price
+
+            # Mark to market
+            prev_pnl = position.unrealized_pnl
+            position.current_price = close
+            position.unrealized_pnl = (close - entry) * sign / 0.25 * 1.25 * t.quantity
+            self._total_unrealized += position.unrealized_pnl - prev_pnl
+
+            # Trailing stop: only a new favorable extreme (or a contracted
+            # trail distance) can move it, so in-range bars skip the update
+            if sign > 0:
+                new_extreme = close > position.high_water
+                if new_extreme:
+                    position.high_water = close
+            else:
+                new_extreme = close < position.low_water
+                if new_extreme:
+                    position.low_water = close
+            if new_extreme or tightened:
+                self._update_trailing_stop(position, close)
+
+            # Combined exit check
+            stop = position.trailing_stop or t.stop_loss
+            tp = t.take_profit
+            if (close - stop) * sign <= 0:
+                closed_trades.append(self._close_position(position, stop, "stop_loss"))
+            elif tp is not None and (close - tp) * sign >= 0:
+                if not position.scale_out_done and t.quantity > 1:
+                    self._execute_scale_out(position, bar)
+                    remaining.append(position)
+                else:
+                    closed_trades.append(
+                        self._close_position(position, tp, "take_profit")
+                    )
             else:
                 remaining.append(position)
 
         self.open_positions = remaining
+        if not remaining:
+            self._total_unrealized = 0.0  # Drop accumulated rounding drift
+        self._trail_tightened = False
+
+        # Feed the running total straight into daily loss-limit tracking
+        self.risk_manager.daily_tracker.update_unrealized(self._total_unrealized)
         return closed_trades
 
     def force_close_all(self, current_price: float) -> list[Trade]:
@@ -98,11 +147,12 @@ class OrderManager:
             trade = self._close_position(position, current_price, "force_close")
             closed.append(trade)
         self.open_positions = []
+        self._total_unrealized = 0.0
         return closed
 
     def get_total_unrealized_pnl(self) -> float:
         """Sum of unrealized P&L across all open positions."""
-        return sum(p.unrealized_pnl for p in self.open_positions)
+        return self._total_unrealized
 
     def _open_position(self, risk_result: RiskResult) -> Position | None:
         """Execute entry and create Position."""
@@ -118,13 +168,14 @@ class OrderManager:
         self.open_positions.append(position)
         self.risk_manager.record_position_opened()
 
-        logger.info(
-            "position_opened",
-            account=self.account_id,
-            direction=trade.direction.value,
-            entry=trade.entry_price,
-            qty=trade.quantity,
-        )
+        if info_enabled():
+            logger.info(
+                "position_opened",
+                account=self.account_id,
+                direction=trade.direction.value,
+                entry=trade.entry_price,
+                qty=trade.quantity,
+            )
 
         return position
 
@@ -133,74 +184,39 @@ class OrderManager:
     ) -> Trade:
         """Execute exit, update risk manager, record trade."""
         trade = self.executor.execute_exit(position, exit_price, reason)
+        self._total_unrealized -= position.unrealized_pnl
 
         self.risk_manager.record_position_closed(trade.pnl_dollars or 0.0)
 
         if self.recorder:
             self.recorder.record_trade(trade)
 
-        logger.info(
-            "position_closed",
-            account=self.account_id,
-            direction=trade.direction.value,
-            pnl=trade.pnl_dollars,
-            reason=reason,
-        )
+        if info_enabled():
+            logger.info(
+                "position_closed",
+                account=self.account_id,
+                direction=trade.direction.value,
+                pnl=trade.pnl_dollars,
+                reason=reason,
+            )
 
         return trade
 
-    def _update_trailing_stop(self, position: Position, bar: Bar) -> None:
-        """Update trailing stop using ATR."""
+    def _update_trailing_stop(self, position: Position, close: float) -> None:
+        """Update trailing stop using the precomputed ATR trail distance."""
         current_stop = position.trailing_stop or position.trade.stop_loss
-        new_stop, activated = update_trailing_stop(
+        new_stop, activated = trail_stop_by_distance(
             entry_price=position.trade.entry_price,
-            current_price=bar.close,
+            current_price=close,
             current_stop=current_stop,
             direction=position.trade.direction,
-            atr=self.atr_for_trailing,
+            trail_distance=self._trail_offset,
         )
 
         if activated:
             position.trailing_stop = new_stop
             position.trailing_activated = True
 
-    def _should_scale_out(self, position: Position, bar: Bar) -> bool:
-        """Check if position should scale out at primary target.
-
-        Scale-out conditions:
-        - Signal had take_profit_primary set
-        - Position quantity > 1 (can't split a 1-lot)
-        - Scale-out hasn't been done yet
-        - Price has reached primary target
-        """
-        if position.scale_out_done:
-            return False
-        if position.trade.quantity <= 1:
-            return False
-
-        signal = getattr(position.trade, '_signal', None)
-        # Access primary target from the trade's original signal via the take_profit_primary
-        # We store it on the trade as a note when the signal has dual targets
-        primary = self._get_primary_target(position)
-        if primary is None:
-            return False
-
-        if position.trade.direction == Direction.LONG:
-            return bar.close >= primary
-        return bar.close <= primary
-
-    def _get_primary_target(self, position: Position) -> float | None:
-        """Get the primary take-profit target from the trade's notes or take_profit field.
-
-        When scale-out is available, take_profit is the primary and
-        take_profit on the trade may be updated to the secondary after scale-out.
-        """
-        # For scale-out, the trade's take_profit starts as the primary target.
-        # If the position hasn't scaled out yet, take_profit IS the primary.
-        if not position.scale_out_done and position.trade.quantity > 1:
-            return position.trade.take_profit
-        return None
-
     def _execute_scale_out(self, position: Position, bar: Bar) -> None:
         """Close half the position at primary target, move stop to breakeven."""
         primary = position.trade.take_profit
@@ -220,20 +236,18 @@ class OrderManager:
         position.trailing_activated = True
 
         # Record partial P&L
-        if position.trade.direction == Direction.LONG:
-            pnl_ticks = (primary - position.trade.entry_price) / 0.25
-        else:
-            pnl_ticks = (position.trade.entry_price - primary) / 0.25
+        pnl_ticks = (primary - position.trade.entry_price) * position.trade.dir_sign / 0.25
         pnl_dollars = pnl_ticks * 1.25 * scale_qty
 
         self.risk_manager.daily_tracker.record_trade_closed(pnl_dollars)
 
-        logger.info(
-            "scale_out",
-            account=self.account_id,
-            direction=position.trade.direction.value,
-            qty_closed=scale_qty,
-            qty_remaining=position.trade.quantity,
-            price=primary,
-            pnl=pnl_dollars,
-        )
+        if info_enabled():
+            logger.info(
+                "scale_out",
+                account=self.account_id,
+                direction=position.trade.direction.value,
+                qty_closed=scale_qty,
+                qty_remaining=position.trade.quantity,
+                price=primary,
+                pnl=pnl_dollars,
+            )
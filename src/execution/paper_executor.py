@@ -10,8 +10,15 @@ import random
 from datetime import UTC, datetime
 
 from src.config import MES_SPEC, settings
-from src.core.logging import get_logger
-from src.core.models import Direction, Position, RiskResult, Trade, TradeStatus
+from src.core.logging import get_logger, info_enabled
+from src.core.models import (
+    DIRECTION_SIGN,
+    Direction,
+    Position,
+    RiskResult,
+    Trade,
+    TradeStatus,
+)
 from src.execution.base_executor import BaseExecutor
 
 logger = get_logger("paper_executor")
@@ -74,15 +81,16 @@ class PaperExecutor(BaseExecutor):
             signal_confidence=signal.confidence,
         )
 
-        logger.info(
-            "paper_entry",
-            account=self.account_id,
-            direction=signal.direction.value,
-            entry=fill_price,
-            stop=signal.stop_loss,
-            target=signal.take_profit,
-            qty=risk_result.position_size,
-        )
+        if info_enabled():
+            logger.info(
+                "paper_entry",
+                account=self.account_id,
+                direction=signal.direction.value,
+                entry=fill_price,
+                stop=signal.stop_loss,
+                target=signal.take_profit,
+                qty=risk_result.position_size,
+            )
 
         return trade
 
@@ -102,14 +110,15 @@ class PaperExecutor(BaseExecutor):
         trade.calculate_pnl()
         trade.calculate_risk_reward()
 
-        logger.info(
-            "paper_exit",
-            account=self.account_id,
-            direction=trade.direction.value,
-            exit=fill_price,
-            pnl=trade.pnl_dollars,
-            reason=reason,
-        )
+        if info_enabled():
+            logger.info(
+                "paper_exit",
+                account=self.account_id,
+                direction=trade.direction.value,
+                exit=fill_price,
+                pnl=trade.pnl_dollars,
+                reason=reason,
+            )
 
         return trade
 
@@ -124,17 +133,11 @@ class PaperExecutor(BaseExecutor):
         slip_ticks = max(0, random.gauss(self.slippage_mean, self.slippage_std))
         slip_price = slip_ticks * self.tick_size
 
-        # Determine direction of slippage (always adverse)
-        if is_entry:
-            if direction == Direction.LONG:
-                price += slip_price  # Worse fill for long entry
-            else:
-                price -= slip_price  # Worse fill for short entry
-        else:
-            if direction == Direction.LONG:
-                price -= slip_price  # Worse fill for long exit
-            else:
-                price += slip_price  # Worse fill for short exit
+        # Adverse side: with the trade on entry, against it on exit
+        sign = DIRECTION_SIGN[direction]
+        if not is_entry:
+            sign = -sign
+        price += sign * slip_price
 
         return self._round_to_tick(price)
 
@@ -49,12 +49,32 @@ class IndicatorCalculator:
         self._vwap_cum_vol: float = 0.0
         self._vwap_cum_tp_vol: float = 0.0
         self._vwap_session_date: str | None = None
+        # Kahan compensation terms for the running VWAP sums
+        self._vwap_vol_comp: float = 0.0
+        self._vwap_tp_comp: float = 0.0
+
+        # Last processed bar (timestamp + OHLCV) and its result, for
+        # suppressing repeated deliveries of the same bar
+        self._last_bar_key: tuple | None = None
+        self._last_snapshot: IndicatorSnapshot | None = None
+
+        # pandas-ta output column names (lower, mid, upper); fixed for a
+        # given configuration, so resolved from the first result and reused
+        self._bb_cols: tuple[str, str, str] | None = None
+        self._kc_cols: tuple[str, str, str] | None = None
 
     def update(self, bar: Bar) -> IndicatorSnapshot | None:
         """Add a new bar and compute all indicators.
 
-        Returns None if not enough data yet.
+        Returns None if not enough data yet. A bar identical to the previous
+        one (same timestamp and OHLCV) returns the cached result unchanged.
         """
+        key = (bar.timestamp, bar.open, bar.high, bar.low, bar.close, bar.volume)
+        if key == self._last_bar_key:
+            return self._last_snapshot
+        self._last_bar_key = key
+        self._last_snapshot = None
+
         self._bars.append(bar)
         if len(self._bars) > self._max_bars:
             self._bars = self._bars[-self._max_bars:]
@@ -78,6 +98,7 @@ class IndicatorCalculator:
             ema_21=self._compute_ema(df, self.ema_slow),
         )
 
+        self._last_snapshot = snapshot
         return snapshot
 
     def reset_vwap(self) -> None:
@@ -85,6 +106,10 @@ class IndicatorCalculator:
         self._vwap_cum_vol = 0.0
         self._vwap_cum_tp_vol = 0.0
         self._vwap_session_date = None
+        self._vwap_vol_comp = 0.0
+        self._vwap_tp_comp = 0.0
+        self._last_bar_key = None
+        self._last_snapshot = None
 
     def _to_dataframe(self) -> pd.DataFrame:
         """Convert bar buffer to a pandas DataFrame."""
@@ -106,10 +131,17 @@ class IndicatorCalculator:
             self._vwap_cum_vol = 0.0
             self._vwap_cum_tp_vol = 0.0
             self._vwap_session_date = session_date
+            self._vwap_vol_comp = 0.0
+            self._vwap_tp_comp = 0.0
 
+        # Compensated sums keep rounding error bounded over long sessions
         typical_price = (bar.high + bar.low + bar.close) / 3
-        self._vwap_cum_tp_vol += typical_price * bar.volume
-        self._vwap_cum_vol += bar.volume
+        self._vwap_cum_tp_vol, self._vwap_tp_comp = _kahan_add(
+            self._vwap_cum_tp_vol, self._vwap_tp_comp, typical_price * bar.volume
+        )
+        self._vwap_cum_vol, self._vwap_vol_comp = _kahan_add(
+            self._vwap_cum_vol, self._vwap_vol_comp, float(bar.volume)
+        )
 
         if self._vwap_cum_vol == 0:
             return None
@@ -123,16 +155,17 @@ class IndicatorCalculator:
             if bbands is None or bbands.empty:
                 return {"bb_upper": None, "bb_middle": None, "bb_lower": None}
 
-            cols = bbands.columns.tolist()
             # pandas-ta names: BBL_20_2.0, BBM_20_2.0, BBU_20_2.0
-            lower_col = [c for c in cols if c.startswith("BBL")]
-            mid_col = [c for c in cols if c.startswith("BBM")]
-            upper_col = [c for c in cols if c.startswith("BBU")]
+            if self._bb_cols is None:
+                self._bb_cols = _resolve_columns(bbands.columns, ("BBL", "BBM", "BBU"))
+                if self._bb_cols is None:
+                    return {"bb_upper": None, "bb_middle": None, "bb_lower": None}
+            lower_col, mid_col, upper_col = self._bb_cols
 
             return {
-                "bb_lower": _last_value(bbands[lower_col[0]]) if lower_col else None,
-                "bb_middle": _last_value(bbands[mid_col[0]]) if mid_col else None,
-                "bb_upper": _last_value(bbands[upper_col[0]]) if upper_col else None,
+                "bb_lower": _last_value(bbands[lower_col]),
+                "bb_middle": _last_value(bbands[mid_col]),
+                "bb_upper": _last_value(bbands[upper_col]),
             }
         except Exception as e:
             logger.error("bbands_calc_error", error=str(e))
@@ -149,15 +182,16 @@ class IndicatorCalculator:
             if kc is None or kc.empty:
                 return {"keltner_upper": None, "keltner_middle": None, "keltner_lower": None}
 
-            cols = kc.columns.tolist()
-            lower_col = [c for c in cols if c.startswith("KCL")]
-            mid_col = [c for c in cols if c.startswith("KCB")]
-            upper_col = [c for c in cols if c.startswith("KCU")]
+            if self._kc_cols is None:
+                self._kc_cols = _resolve_columns(kc.columns, ("KCL", "KCB", "KCU"))
+                if self._kc_cols is None:
+                    return {"keltner_upper": None, "keltner_middle": None, "keltner_lower": None}
+            lower_col, mid_col, upper_col = self._kc_cols
 
             return {
-                "keltner_lower": _last_value(kc[lower_col[0]]) if lower_col else None,
-                "keltner_middle": _last_value(kc[mid_col[0]]) if mid_col else None,
-                "keltner_upper": _last_value(kc[upper_col[0]]) if upper_col else None,
+                "keltner_lower": _last_value(kc[lower_col]),
+                "keltner_middle": _last_value(kc[mid_col]),
+                "keltner_upper": _last_value(kc[upper_col]),
             }
         except Exception as e:
             logger.error("keltner_calc_error", error=str(e))
@@ -205,3 +239,19 @@ def _last_value(series: pd.Series) -> float | None:
     if pd.isna(val):
         return None
     return float(val)
+
+
+def _resolve_columns(
+    columns: pd.Index, prefixes: tuple[str, str, str]
+) -> tuple[str, str, str] | None:
+    """First column starting with each prefix, or None if any is missing."""
+    found = tuple(next((c for c in columns if c.startswith(p)), None) for p in prefixes)
+    return None if None in found else found
+
+
+def _kahan_add(total: float, comp: float, value: float) -> tuple[float, float]:
+    """Add value to a Kahan-compensated running sum. Returns (total, comp)."""
+    y = value - comp
+    t = total + y
+    comp = (t - total) - y
+    return t, comp
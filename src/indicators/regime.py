@@ -11,12 +11,11 @@ into 5-min bars internally.
 
 from __future__ import annotations
 
+import math
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 
-import pandas as pd
-import pandas_ta as ta
-
 from src.core.logging import get_logger
 from src.core.models import Bar
 
@@ -73,9 +72,38 @@ class RegimeDetector:
         self.kc_period = kc_period
         self.kc_atr_multiple = kc_atr_multiple
 
-        self._5m_bars: list[Bar] = []
-        self._1m_buffer: list[Bar] = []
-        self._max_5m_bars = max(adx_period, bb_period, kc_period) + 50
+        # Running 1m -> 5m aggregate (reset after every 5th bar)
+        self._agg_n = 0
+        self._agg_open = 0.0
+        self._agg_high = 0.0
+        self._agg_low = 0.0
+        self._agg_vol = 0
+        # Bars needed before classification runs at all
+        self._min_5m_bars = max(adx_period, bb_period, kc_period) + 1
+        self._5m_bars = 0
+
+        # Incremental squeeze state: rolling Welford mean/M2 of closes for
+        # the Bollinger bands, SMA-seeded EMAs of close and true range for
+        # the Keltner channel
+        self._bb_window: deque[float] = deque(maxlen=bb_period)
+        self._bb_mean = 0.0
+        self._bb_m2 = 0.0
+        self._kc_alpha = 2.0 / (kc_period + 1)
+        self._kc_mid: float | None = None
+        self._kc_range: float | None = None
+        self._kc_close_seed: list[float] = []
+        self._kc_range_seed: list[float] = []
+        self._prev_close: float | None = None
+
+        # Incremental Wilder ADX state: smoothed TR/+DM/-DM, then ADX seeded
+        # from the average of the first adx_period DX values
+        self._adx_bars = 0  # Bars with a previous bar to diff against
+        self._adx_tr = 0.0
+        self._adx_pdm = 0.0
+        self._adx_ndm = 0.0
+        self._adx_val = 0.0
+        self._prev_high = 0.0
+        self._prev_low = 0.0
 
         self._state = RegimeState()
         self._candidate_regime: MarketRegime | None = None
@@ -87,29 +115,37 @@ class RegimeDetector:
 
     def on_5m_bar(self, bar: Bar) -> RegimeState:
         """Process a 5-minute bar and update regime classification."""
-        self._5m_bars.append(bar)
-        if len(self._5m_bars) > self._max_5m_bars:
-            self._5m_bars = self._5m_bars[-self._max_5m_bars:]
-
+        self._5m_bars += 1
+        self._update_adx_state(bar)  # Reads _prev_close, so before squeeze
+        self._update_squeeze_state(bar)
         self._update_regime()
         return self._state
 
     def on_1m_bar(self, bar: Bar) -> RegimeState:
         """Aggregate 1-min bars into 5-min bars internally."""
-        self._1m_buffer.append(bar)
-
-        if len(self._1m_buffer) >= 5:
-            bars_to_aggregate = self._1m_buffer[:5]
-            self._1m_buffer = self._1m_buffer[5:]
-
+        if self._agg_n == 0:
+            self._agg_open = bar.open
+            self._agg_high = bar.high
+            self._agg_low = bar.low
+            self._agg_vol = bar.volume
+        else:
+            if bar.high > self._agg_high:
+                self._agg_high = bar.high
+            if bar.low < self._agg_low:
+                self._agg_low = bar.low
+            self._agg_vol += bar.volume
+        self._agg_n += 1
+
+        if self._agg_n == 5:
+            self._agg_n = 0
             bar_5m = Bar(
-                timestamp=bars_to_aggregate[-1].timestamp,
+                timestamp=bar.timestamp,
                 symbol=bar.symbol,
-                open=bars_to_aggregate[0].open,
-                high=max(b.high for b in bars_to_aggregate),
-                low=min(b.low for b in bars_to_aggregate),
-                close=bars_to_aggregate[-1].close,
-                volume=sum(b.volume for b in bars_to_aggregate),
+                open=self._agg_open,
+                high=self._agg_high,
+                low=self._agg_low,
+                close=bar.close,
+                volume=self._agg_vol,
             )
             return self.on_5m_bar(bar_5m)
 
@@ -117,20 +153,11 @@ class RegimeDetector:
 
     def _update_regime(self) -> None:
         """Classify regime using ADX + squeeze, with hysteresis."""
-        min_required = max(self.adx_period, self.bb_period, self.kc_period) + 1
-        if len(self._5m_bars) < min_required:
+        if self._5m_bars < self._min_5m_bars:
             return
 
-        df = pd.DataFrame({
-            "open": [b.open for b in self._5m_bars],
-            "high": [b.high for b in self._5m_bars],
-            "low": [b.low for b in self._5m_bars],
-            "close": [b.close for b in self._5m_bars],
-            "volume": [b.volume for b in self._5m_bars],
-        })
-
-        adx_val = self._compute_adx(df)
-        squeeze = self._check_squeeze(df)
+        adx_val = self._current_adx()
+        squeeze = self._check_squeeze()
 
         self._state.adx = adx_val
         self._state.squeeze_active = squeeze
@@ -146,6 +173,10 @@ class RegimeDetector:
         else:
             raw_regime = MarketRegime.TRANSITIONAL
 
+        # Steady state: regime unchanged and no switch pending
+        if raw_regime == self._state.regime and self._candidate_regime is None:
+            return
+
         # Apply hysteresis: require HYSTERESIS_BARS consecutive bars
         if raw_regime != self._state.regime:
             if raw_regime == self._candidate_regime:
@@ -169,52 +200,116 @@ class RegimeDetector:
             self._candidate_regime = None
             self._candidate_count = 0
 
-    def _compute_adx(self, df: pd.DataFrame) -> float | None:
-        """Compute ADX from 5-min bar dataframe."""
-        try:
-            adx_df = ta.adx(df["high"], df["low"], df["close"], length=self.adx_period)
-            if adx_df is None or adx_df.empty:
-                return None
-            adx_col = [c for c in adx_df.columns if c.startswith("ADX_")]
-            if not adx_col:
-                return None
-            val = adx_df[adx_col[0]].iloc[-1]
-            return float(val) if pd.notna(val) else None
-        except Exception as e:
-            logger.error("adx_calc_error", error=str(e))
+    def _update_adx_state(self, bar: Bar) -> None:
+        """Fold one 5-min bar into the Wilder ADX recurrences."""
+        prev_close = self._prev_close
+        high = bar.high
+        low = bar.low
+        if prev_close is not None:
+            n = self.adx_period
+            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+            up = high - self._prev_high
+            down = self._prev_low - low
+            pdm = up if (up > down and up > 0.0) else 0.0
+            ndm = down if (down > up and down > 0.0) else 0.0
+
+            self._adx_bars += 1
+            i = self._adx_bars
+            if i <= n:
+                # Seed the smoothed values with the first n-bar average
+                self._adx_tr += tr / n
+                self._adx_pdm += pdm / n
+                self._adx_ndm += ndm / n
+            else:
+                self._adx_tr = (self._adx_tr * (n - 1) + tr) / n
+                self._adx_pdm = (self._adx_pdm * (n - 1) + pdm) / n
+                self._adx_ndm = (self._adx_ndm * (n - 1) + ndm) / n
+
+            if i >= n:
+                dx = 0.0
+                tr_s = self._adx_tr
+                if tr_s > 0.0:
+                    pdi = 100.0 * self._adx_pdm / tr_s
+                    ndi = 100.0 * self._adx_ndm / tr_s
+                    if pdi + ndi > 0.0:
+                        dx = 100.0 * abs(pdi - ndi) / (pdi + ndi)
+                # DX is available from bar n; ADX seeds on the first n DX values
+                if i - n < n:
+                    self._adx_val += dx / n
+                else:
+                    self._adx_val = (self._adx_val * (n - 1) + dx) / n
+        self._prev_high = high
+        self._prev_low = low
+
+    def _current_adx(self) -> float | None:
+        """Latest ADX, or None until 2 * adx_period bars have been seen."""
+        if self._adx_bars < 2 * self.adx_period - 1:
             return None
-
-    def _check_squeeze(self, df: pd.DataFrame) -> bool:
-        """Check if BB is inside KC (squeeze = ranging/consolidation)."""
-        try:
-            bbands = ta.bbands(df["close"], length=self.bb_period, std=self.bb_std)
-            kc = ta.kc(
-                df["high"], df["low"], df["close"],
-                length=self.kc_period, scalar=self.kc_atr_multiple,
+        return self._adx_val
+
+    def _update_squeeze_state(self, bar: Bar) -> None:
+        """Fold one 5-min bar into the Bollinger/Keltner running state."""
+        close = bar.close
+
+        # Bollinger: rolling Welford update (replace oldest once full)
+        window = self._bb_window
+        n = len(window)
+        mean = self._bb_mean
+        if n == self.bb_period:
+            old = window[0]
+            window.append(close)
+            delta = close - old
+            new_mean = mean + delta / n
+            self._bb_m2 += delta * (close - new_mean + old - mean)
+        else:
+            window.append(close)
+            delta = close - mean
+            new_mean = mean + delta / (n + 1)
+            self._bb_m2 += delta * (close - new_mean)
+        self._bb_mean = new_mean
+
+        # Keltner: EMA basis of close, EMA band of true range
+        alpha = self._kc_alpha
+        if self._kc_mid is None:
+            self._kc_close_seed.append(close)
+            if len(self._kc_close_seed) == self.kc_period:
+                self._kc_mid = sum(self._kc_close_seed) / self.kc_period
+                self._kc_close_seed = []
+        else:
+            self._kc_mid += alpha * (close - self._kc_mid)
+
+        prev_close = self._prev_close
+        if prev_close is not None:
+            tr = max(
+                bar.high - bar.low,
+                abs(bar.high - prev_close),
+                abs(bar.low - prev_close),
             )
+            if self._kc_range is None:
+                self._kc_range_seed.append(tr)
+                if len(self._kc_range_seed) == self.kc_period:
+                    self._kc_range = sum(self._kc_range_seed) / self.kc_period
+                    self._kc_range_seed = []
+            else:
+                self._kc_range += alpha * (tr - self._kc_range)
+        self._prev_close = close
 
-            if bbands is None or kc is None:
-                return False
-
-            bb_upper_col = [c for c in bbands.columns if c.startswith("BBU")]
-            bb_lower_col = [c for c in bbands.columns if c.startswith("BBL")]
-            kc_upper_col = [c for c in kc.columns if c.startswith("KCU")]
-            kc_lower_col = [c for c in kc.columns if c.startswith("KCL")]
-
-            if not all([bb_upper_col, bb_lower_col, kc_upper_col, kc_lower_col]):
-                return False
-
-            bb_u = bbands[bb_upper_col[0]].iloc[-1]
-            bb_l = bbands[bb_lower_col[0]].iloc[-1]
-            kc_u = kc[kc_upper_col[0]].iloc[-1]
-            kc_l = kc[kc_lower_col[0]].iloc[-1]
-
-            if any(pd.isna(v) for v in [bb_u, bb_l, kc_u, kc_l]):
-                return False
+    def _check_squeeze(self) -> bool:
+        """Check if BB is inside KC (squeeze = ranging/consolidation)."""
+        if (
+            len(self._bb_window) < self.bb_period
+            or self._kc_mid is None
+            or self._kc_range is None
+        ):
+            return False
 
-            # Squeeze: BB inside KC
-            return bb_u < kc_u and bb_l > kc_l
+        std = math.sqrt(max(self._bb_m2 / self.bb_period, 0.0))
+        bb_width = self.bb_std * std
+        kc_width = self.kc_atr_multiple * self._kc_range
 
-        except Exception as e:
-            logger.error("squeeze_calc_error", error=str(e))
-            return False
+        # Squeeze: BB inside KC
+        bb_u = self._bb_mean + bb_width
+        bb_l = self._bb_mean - bb_width
+        kc_u = self._kc_mid + kc_width
+        kc_l = self._kc_mid - kc_width
+        return bb_u < kc_u and bb_l > kc_l
@@ -0,0 +1,51 @@
+"""Numba-compiled loops for TradeAnalyzer.
+
+Both kernels walk a float64 P&L array in trade order. numba is optional;
+src.core._njit.HAS_NUMBA tells callers whether they are compiled.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from src.core._njit import njit
+
+
+@njit(cache=True)
+def streaks(pnl: np.ndarray) -> tuple[int, int, int]:
+    """Returns (max_winning_streak, max_losing_streak, current_streak)."""
+    max_win = 0
+    max_lose = 0
+    current = 0
+    for i in range(pnl.shape[0]):
+        value = pnl[i]
+        if value > 0.0:
+            current = current + 1 if current > 0 else 1
+            if current > max_win:
+                max_win = current
+        elif value < 0.0:
+            current = current - 1 if current < 0 else -1
+            if -current > max_lose:
+                max_lose = -current
+        else:
+            current = 0
+    return max_win, max_lose, current
+
+
+@njit(cache=True)
+def max_drawdown(pnl: np.ndarray) -> tuple[float, float]:
+    """Returns (max_drawdown_dollars, max_drawdown_pct) of the cumulative P&L."""
+    cumulative = 0.0
+    peak = 0.0
+    max_dd = 0.0
+    max_dd_pct = 0.0
+    for i in range(pnl.shape[0]):
+        cumulative += pnl[i]
+        if cumulative > peak:
+            peak = cumulative
+        dd = peak - cumulative
+        if dd > max_dd:
+            max_dd = dd
+            if peak > 0.0:
+                max_dd_pct = dd / peak
+    return max_dd, max_dd_pct
@@ -5,7 +5,14 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 
+import numpy as np
+
+from src.core._njit import HAS_NUMBA
 from src.core.models import Trade, TradeStatus
+from src.journal._analyzer_kernels import max_drawdown, streaks
+
+# Annualization factor for the default 252 trading days
+_SQRT_252 = math.sqrt(252.0)
 
 
 @dataclass
@@ -35,6 +42,30 @@ class PerformanceMetrics:
     avg_trade_duration_minutes: float = 0.0
 
 
+def _project(trades: list[Trade]) -> dict[str, np.ndarray]:
+    """Column arrays for the analyzer, built in one pass over the trades.
+
+    Keys: ``pnl``, ``rr`` and ``duration_min``; missing values are NaN.
+    """
+    n = len(trades)
+    pnl = np.empty(n, dtype=np.float64)
+    rr = np.full(n, np.nan)
+    duration = np.full(n, np.nan)
+    for i, t in enumerate(trades):
+        pnl[i] = t.pnl_dollars
+        if t.risk_reward_actual is not None:
+            rr[i] = t.risk_reward_actual
+        if t.entry_time and t.exit_time:
+            duration[i] = (t.exit_time - t.entry_time).total_seconds() / 60.0
+    return {"pnl": pnl, "rr": rr, "duration_min": duration}
+
+
+def _nanmean(values: np.ndarray) -> float:
+    """Mean of the non-NaN entries, or 0.0 when there are none."""
+    present = values[~np.isnan(values)]
+    return float(present.mean()) if present.size else 0.0
+
+
 class TradeAnalyzer:
     """Computes performance metrics from a list of trades."""
 
@@ -47,26 +78,28 @@ class TradeAnalyzer:
 
         metrics = PerformanceMetrics(total_trades=len(closed))
 
-        # Classify trades
-        winners = [t for t in closed if t.pnl_dollars > 0]
-        losers = [t for t in closed if t.pnl_dollars < 0]
-        breakeven = [t for t in closed if t.pnl_dollars == 0]
+        # Project the trades into column arrays once; everything below reads those
+        columns = _project(closed)
+        pnl = columns["pnl"]
+        win_pnl = pnl[pnl > 0]
+        lose_pnl = pnl[pnl < 0]
 
-        metrics.winners = len(winners)
-        metrics.losers = len(losers)
-        metrics.breakeven = len(breakeven)
+        # Classify trades
+        metrics.winners = int(win_pnl.size)
+        metrics.losers = int(lose_pnl.size)
+        metrics.breakeven = metrics.total_trades - metrics.winners - metrics.losers
         metrics.win_rate = metrics.winners / metrics.total_trades if metrics.total_trades > 0 else 0.0
 
         # P&L
-        metrics.gross_profit = sum(t.pnl_dollars for t in winners)
-        metrics.gross_loss = sum(t.pnl_dollars for t in losers)  # Negative number
+        metrics.gross_profit = float(win_pnl.sum())
+        metrics.gross_loss = float(lose_pnl.sum())  # Negative number
         metrics.net_pnl = metrics.gross_profit + metrics.gross_loss
 
         # Averages
-        metrics.avg_winner = metrics.gross_profit / len(winners) if winners else 0.0
-        metrics.avg_loser = metrics.gross_loss / len(losers) if losers else 0.0
-        metrics.max_winner = max((t.pnl_dollars for t in winners), default=0.0)
-        metrics.max_loser = min((t.pnl_dollars for t in losers), default=0.0)
+        metrics.avg_winner = metrics.gross_profit / metrics.winners if metrics.winners else 0.0
+        metrics.avg_loser = metrics.gross_loss / metrics.losers if metrics.losers else 0.0
+        metrics.max_winner = float(win_pnl.max(initial=0.0))
+        metrics.max_loser = float(lose_pnl.min(initial=0.0))
 
         # Profit factor
         if metrics.gross_loss != 0:
@@ -75,30 +108,21 @@ class TradeAnalyzer:
             metrics.profit_factor = float("inf")
 
         # Risk:reward
-        rr_values = [t.risk_reward_actual for t in closed if t.risk_reward_actual is not None]
-        metrics.avg_risk_reward = sum(rr_values) / len(rr_values) if rr_values else 0.0
+        metrics.avg_risk_reward = _nanmean(columns["rr"])
 
         # Drawdown
-        metrics.max_drawdown, metrics.max_drawdown_pct = self._compute_max_drawdown(closed)
+        metrics.max_drawdown, metrics.max_drawdown_pct = self._compute_max_drawdown(pnl)
 
         # Sharpe
-        pnl_series = [t.pnl_dollars for t in closed]
-        metrics.sharpe_ratio = self._compute_sharpe(pnl_series)
+        metrics.sharpe_ratio = self._compute_sharpe(pnl)
 
         # Streaks
         metrics.winning_streak, metrics.losing_streak, metrics.current_streak = (
-            self._compute_streaks(closed)
+            self._compute_streaks(pnl)
         )
 
         # Duration
-        durations = []
-        for t in closed:
-            if t.entry_time and t.exit_time:
-                delta = (t.exit_time - t.entry_time).total_seconds() / 60.0
-                durations.append(delta)
-        metrics.avg_trade_duration_minutes = (
-            sum(durations) / len(durations) if durations else 0.0
-        )
+        metrics.avg_trade_duration_minutes = _nanmean(columns["duration_min"])
 
         return metrics
 
@@ -137,64 +161,59 @@ class TradeAnalyzer:
 
         return drawdowns
 
-    def _compute_max_drawdown(self, trades: list[Trade]) -> tuple[float, float]:
-        """Compute max drawdown in dollars and percentage."""
-        if not trades:
+    def _compute_max_drawdown(self, pnl: np.ndarray) -> tuple[float, float]:
+        """Compute max drawdown in dollars and percentage from a P&L array."""
+        if pnl.size == 0:
             return 0.0, 0.0
-
-        cumulative = 0.0
-        peak = 0.0
-        max_dd = 0.0
-        max_dd_pct = 0.0
-
-        for trade in trades:
-            cumulative += trade.pnl_dollars
-            if cumulative > peak:
-                peak = cumulative
-            dd = peak - cumulative
-            if dd > max_dd:
-                max_dd = dd
-                if peak > 0:
-                    max_dd_pct = dd / peak
-
+        if HAS_NUMBA:
+            return max_drawdown(pnl)
+
+        cumulative = np.cumsum(pnl)
+        # Peak starts at flat (0.0), so an opening loss counts as drawdown
+        peak = np.maximum.accumulate(np.maximum(cumulative, 0.0))
+        dd = peak - cumulative
+        idx = int(dd.argmax())
+        max_dd = float(dd[idx])
+        max_dd_pct = max_dd / float(peak[idx]) if peak[idx] > 0 else 0.0
         return max_dd, max_dd_pct
 
     def _compute_sharpe(
-        self, pnl_series: list[float], periods_per_year: float = 252.0
+        self, pnl_series: np.ndarray, periods_per_year: float = 252.0
     ) -> float | None:
         """Annualized Sharpe ratio from trade P&L series."""
-        if len(pnl_series) < 2:
+        pnl = np.asarray(pnl_series, dtype=np.float64)
+        if pnl.size < 2:
             return None
 
-        mean_pnl = sum(pnl_series) / len(pnl_series)
-        variance = sum((p - mean_pnl) ** 2 for p in pnl_series) / (len(pnl_series) - 1)
-        std_pnl = math.sqrt(variance)
-
+        std_pnl = float(pnl.std(ddof=1))
         if std_pnl == 0:
             return None
 
-        return (mean_pnl / std_pnl) * math.sqrt(periods_per_year)
+        scale = _SQRT_252 if periods_per_year == 252.0 else math.sqrt(periods_per_year)
+        return float(pnl.mean()) / std_pnl * scale
 
-    def _compute_streaks(self, trades: list[Trade]) -> tuple[int, int, int]:
+    def _compute_streaks(self, pnl: np.ndarray) -> tuple[int, int, int]:
         """Returns (max_winning_streak, max_losing_streak, current_streak).
 
         current_streak: positive = winning, negative = losing.
         """
-        if not trades:
+        if pnl.size == 0:
             return 0, 0, 0
+        if HAS_NUMBA:
+            return streaks(pnl)
 
         max_win_streak = 0
         max_lose_streak = 0
         current = 0
 
-        for trade in trades:
-            if trade.pnl_dollars > 0:
+        for value in pnl.tolist():
+            if value > 0:
                 if current > 0:
                     current += 1
                 else:
                     current = 1
                 max_win_streak = max(max_win_streak, current)
-            elif trade.pnl_dollars < 0:
+            elif value < 0:
                 if current < 0:
                     current -= 1
                 else:
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from datetime import UTC, datetime
 
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
 from src.core.database import (
     DailySummaryRow,
     EquitySnapshotRow,
@@ -24,12 +29,35 @@ logger = get_logger("journal.recorder")
 
 
 class TradeRecorder:
-    """Records trades and generates daily summaries."""
+    """Records trades and generates daily summaries.
+
+    Journal rows share one long-lived session. Trades commit as they are
+    recorded, since callers keep their IDs; risk events and equity
+    snapshots are committed in batches (every ``flush_every`` rows or
+    ``flush_interval_s`` seconds, whichever comes first, or with the next
+    trade) instead of one transaction per row. Call ``flush()`` to
+    commit staged rows immediately. After ``close()`` nothing more is
+    written, so close it only once every producer has stopped.
+    """
 
-    def __init__(self, sqlite_engine=None) -> None:
+    def __init__(
+        self,
+        sqlite_engine=None,
+        flush_every: int = 32,
+        flush_interval_s: float = 1.0,
+    ) -> None:
         self.sqlite_engine = sqlite_engine
+        self.flush_every = flush_every
+        self.flush_interval_s = flush_interval_s
         self._today_trades: list[Trade] = []
 
+        self._session: Session | None = None
+        self._closed = False
+        self._pending = 0
+        self._last_commit = time.monotonic()
+        # Scheduler jobs run on worker threads; the shared session is not thread-safe
+        self._lock = threading.RLock()
+
     def record_trade(self, trade: Trade) -> int | None:
         """Persist a closed trade to SQLite. Returns the trade ID."""
         self._today_trades.append(trade)
@@ -38,12 +66,8 @@ class TradeRecorder:
             return None
 
         try:
-            session = get_session(self.sqlite_engine)
-            row = self._trade_to_row(trade)
-            session.add(row)
-            session.commit()
-            trade_id = row.id
-            session.close()
+            with self._lock:
+                trade_id = self._insert_trade(trade)
             logger.info("trade_recorded", trade_id=trade_id, account=trade.account_id,
                         pnl=trade.pnl_dollars)
             return trade_id
@@ -57,17 +81,15 @@ class TradeRecorder:
             return
 
         try:
-            session = get_session(self.sqlite_engine)
             row = RiskEventRow(
                 account_id=account_id,
                 event_type=event.event_type,
-                details=event.details,
+                details=event.details_dict(),
                 severity=event.severity.value,
                 created_at=event.timestamp,
             )
-            session.add(row)
-            session.commit()
-            session.close()
+            with self._lock:
+                self._stage(row)
         except Exception as e:
             logger.error("risk_event_record_failed", error=str(e))
 
@@ -77,7 +99,6 @@ class TradeRecorder:
             return
 
         try:
-            session = get_session(self.sqlite_engine)
             row = EquitySnapshotRow(
                 account_id=snapshot.account_id,
                 equity=snapshot.equity,
@@ -85,9 +106,8 @@ class TradeRecorder:
                 realized_pnl_today=snapshot.realized_pnl_today,
                 snapshot_time=snapshot.timestamp,
             )
-            session.add(row)
-            session.commit()
-            session.close()
+            with self._lock:
+                self._stage(row)
         except Exception as e:
             logger.error("equity_snapshot_failed", error=str(e))
 
@@ -98,48 +118,58 @@ class TradeRecorder:
         if date is None:
             date = datetime.now(UTC).strftime("%Y-%m-%d")
 
-        trades = [t for t in self._today_trades if t.account_id == account_id]
-        if not trades:
-            return None
+        # One pass over today's trades: filter, win/loss sums and drawdown
+        total = 0
+        wins_n = 0
+        wins_sum = 0.0
+        loss_n = 0
+        loss_sum = 0.0
+        cumulative = 0.0
+        peak = 0.0
+        max_dd = 0.0
+        for t in self._today_trades:
+            if t.account_id != account_id:
+                continue
+            pnl = t.pnl_dollars
+            if t.status != TradeStatus.CLOSED or pnl is None:
+                continue
 
-        closed = [t for t in trades if t.status == TradeStatus.CLOSED and t.pnl_dollars is not None]
-        if not closed:
-            return None
+            total += 1
+            if pnl > 0:
+                wins_n += 1
+                wins_sum += pnl
+            elif pnl < 0:
+                loss_n += 1
+                loss_sum += pnl
 
-        winners = [t for t in closed if t.pnl_dollars > 0]
-        losers = [t for t in closed if t.pnl_dollars < 0]
+            cumulative += pnl
+            if cumulative > peak:
+                peak = cumulative
+            elif peak - cumulative > max_dd:
+                max_dd = peak - cumulative
 
-        gross_pnl = sum(t.pnl_dollars for t in closed)
-        net_pnl = gross_pnl  # Commission already included in pnl_dollars
+        if total == 0:
+            return None
 
-        avg_winner = sum(t.pnl_dollars for t in winners) / len(winners) if winners else 0.0
-        avg_loser = sum(t.pnl_dollars for t in losers) / len(losers) if losers else 0.0
+        gross_pnl = wins_sum + loss_sum
+        net_pnl = gross_pnl  # Commission already included in pnl_dollars
 
-        gross_loss = abs(sum(t.pnl_dollars for t in losers))
-        profit_factor = (sum(t.pnl_dollars for t in winners) / gross_loss) if gross_loss > 0 else 0.0
+        avg_winner = wins_sum / wins_n if wins_n else 0.0
+        avg_loser = loss_sum / loss_n if loss_n else 0.0
 
-        # Max drawdown
-        cumulative = 0.0
-        peak = 0.0
-        max_dd = 0.0
-        for t in closed:
-            cumulative += t.pnl_dollars
-            if cumulative > peak:
-                peak = cumulative
-            dd = peak - cumulative
-            if dd > max_dd:
-                max_dd = dd
+        gross_loss = abs(loss_sum)
+        profit_factor = (wins_sum / gross_loss) if gross_loss > 0 else 0.0
 
         row = DailySummaryRow(
             date=date,
             account_id=account_id,
-            total_trades=len(closed),
-            winners=len(winners),
-            losers=len(losers),
-            gross_pnl=sum(t.pnl_dollars for t in winners) + sum(t.pnl_dollars for t in losers),
+            total_trades=total,
+            winners=wins_n,
+            losers=loss_n,
+            gross_pnl=gross_pnl,
             net_pnl=net_pnl,
             max_drawdown=max_dd,
-            win_rate=len(winners) / len(closed) if closed else 0.0,
+            win_rate=wins_n / total,
             avg_winner=avg_winner,
             avg_loser=avg_loser,
             profit_factor=profit_factor,
@@ -147,10 +177,9 @@ class TradeRecorder:
 
         if self.sqlite_engine is not None:
             try:
-                session = get_session(self.sqlite_engine)
-                session.merge(row)
-                session.commit()
-                session.close()
+                with self._lock:
+                    self._get_session().merge(row)
+                    self._commit()
             except Exception as e:
                 logger.error("daily_summary_failed", error=str(e))
 
@@ -167,6 +196,7 @@ class TradeRecorder:
                 trades = [t for t in trades if t.account_id == account_id]
             return trades
 
+        self.flush()
         try:
             session = get_session(self.sqlite_engine)
             query = session.query(TradeRow).filter(TradeRow.entry_time.like(f"{date}%"))
@@ -182,31 +212,109 @@ class TradeRecorder:
 
     def reset_daily(self) -> None:
         """Clear in-memory daily trade buffer."""
+        self.flush()
         self._today_trades.clear()
 
-    def _trade_to_row(self, trade: Trade) -> TradeRow:
-        return TradeRow(
-            account_id=trade.account_id,
-            strategy=trade.strategy,
-            symbol=trade.symbol,
-            direction=trade.direction.value,
-            entry_price=trade.entry_price,
-            exit_price=trade.exit_price,
-            stop_loss=trade.stop_loss,
-            take_profit=trade.take_profit,
-            quantity=trade.quantity,
-            entry_time=trade.entry_time,
-            exit_time=trade.exit_time,
-            status=trade.status.value,
-            pnl_ticks=trade.pnl_ticks,
-            pnl_dollars=trade.pnl_dollars,
-            risk_reward_actual=trade.risk_reward_actual,
-            commission=trade.commission,
-            slippage_ticks=trade.slippage_ticks,
-            signal_confidence=trade.signal_confidence,
-            ai_review=trade.ai_review,
-            notes=trade.notes,
-        )
+    def flush(self) -> None:
+        """Commit any staged journal rows."""
+        with self._lock:
+            if self._session is None or self._pending == 0:
+                return
+            try:
+                self._commit()
+            except Exception as e:
+                logger.error("journal_flush_failed", error=str(e))
+
+    def close(self) -> None:
+        """Flush staged rows and release the shared session."""
+        self.flush()
+        with self._lock:
+            self._closed = True
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _get_session(self) -> Session:
+        if self._session is None:
+            # A fresh session would stage rows that nothing ever commits
+            if self._closed:
+                raise RuntimeError("trade recorder is closed")
+            self._session = get_session(self.sqlite_engine)
+        return self._session
+
+    def _stage(self, row) -> None:
+        """Add an ORM row to the current batch (caller holds ``self._lock``)."""
+        self._get_session().add(row)
+        self._row_staged()
+
+    def _insert_trade(self, trade: Trade) -> int:
+        """INSERT and commit a trade, with any staged rows; returns its ID.
+
+        Uses a Core insert rather than the ORM so the row skips the
+        identity map and unit-of-work flush (caller holds ``self._lock``).
+        """
+        session = self._get_session()
+        try:
+            result = session.execute(insert(TradeRow).values(**self._trade_to_values(trade)))
+        except Exception:
+            # A failed INSERT poisons the transaction, dropping the batch
+            self._rollback(session)
+            raise
+        trade_id = result.inserted_primary_key[0]
+        self._commit()
+        return trade_id
+
+    def _row_staged(self) -> None:
+        """Count a staged row and commit once the batch is full or old enough."""
+        self._pending += 1
+        if (
+            self._pending >= self.flush_every
+            or time.monotonic() - self._last_commit >= self.flush_interval_s
+        ):
+            self._commit()
+
+    def _commit(self) -> None:
+        session = self._get_session()
+        try:
+            session.commit()
+        except Exception:
+            self._rollback(session)
+            raise
+        finally:
+            self._pending = 0
+            self._last_commit = time.monotonic()
+
+    def _rollback(self, session: Session) -> None:
+        """Roll back the open transaction, logging the staged rows it drops."""
+        session.rollback()
+        if self._pending:
+            logger.error("journal_batch_dropped", rows=self._pending)
+        self._pending = 0
+
+    def _trade_to_values(self, trade: Trade) -> dict:
+        """Column values for a TradeRow insert."""
+        return {
+            "account_id": trade.account_id,
+            "strategy": trade.strategy,
+            "symbol": trade.symbol,
+            "direction": trade.direction.value,
+            "entry_price": trade.entry_price,
+            "exit_price": trade.exit_price,
+            "stop_loss": trade.stop_loss,
+            "take_profit": trade.take_profit,
+            "quantity": trade.quantity,
+            "entry_time": trade.entry_time,
+            "exit_time": trade.exit_time,
+            "status": trade.status.value,
+            "pnl_ticks": trade.pnl_ticks,
+            "pnl_dollars": trade.pnl_dollars,
+            "risk_reward_actual": trade.risk_reward_actual,
+            "commission": trade.commission,
+            "slippage_ticks": trade.slippage_ticks,
+            "signal_confidence": trade.signal_confidence,
+            "ai_review": trade.ai_review,
+            "notes": trade.notes,
+        }
 
     def _row_to_trade(self, row: TradeRow) -> Trade:
         return Trade(
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import time
+from collections.abc import AsyncIterator
+
 import httpx
+import orjson
 
 from src.config import settings
 from src.core.logging import get_logger
@@ -11,6 +15,74 @@ from src.journal.analyzer import PerformanceMetrics
 
 logger = get_logger("llm.client")
 
+_TRADE_REVIEW_SYSTEM = (
+    "You are a professional day trading coach reviewing MES micro futures trades. "
+    "Analyze what went right or wrong, and give specific, actionable feedback. "
+    "Be concise (3-5 sentences)."
+)
+
+_DAILY_SUMMARY_SYSTEM = (
+    "You are a professional trading coach reviewing a day's performance. "
+    "Identify patterns, mistakes, and areas for improvement. "
+    "Be direct and constructive. Keep it under 200 words."
+)
+
+# Optional lines ({rr_line}, {confidence_line}) carry their own newline
+# so they vanish entirely when the value is missing.
+_TRADE_REVIEW_TEMPLATE = (
+    "Trade Review:\n"
+    "  Direction: {direction}\n"
+    "  Entry: {entry:.2f}\n"
+    "  Exit: {exit}\n"
+    "  Stop: {stop:.2f}\n"
+    "  Target: {target}\n"
+    "  P&L: {pnl}\n"
+    "{rr_line}"
+    "  Quantity: {quantity}\n"
+    "  Strategy: {strategy}\n"
+    "{confidence_line}"
+    "\nWhat went right or wrong? What should I do differently next time?"
+)
+
+_DAILY_SUMMARY_TEMPLATE = (
+    "Daily Trading Summary:\n"
+    "  Total Trades: {total_trades}\n"
+    "  Win Rate: {win_rate:.1%}\n"
+    "  Net P&L: ${net_pnl:.2f}\n"
+    "  Profit Factor: {profit_factor:.2f}\n"
+    "  Max Drawdown: ${max_drawdown:.2f}\n"
+    "  Avg Winner: ${avg_winner:.2f}\n"
+    "  Avg Loser: ${avg_loser:.2f}\n"
+    "  Winning Streak: {winning_streak}\n"
+    "  Losing Streak: {losing_streak}\n"
+    "\n"
+    "Trades:\n"
+    "{trades}"
+    "\nIdentify patterns, mistakes, and suggestions for improvement."
+)
+
+
+def _fmt_optional(value: float | None, spec: str, missing: str) -> str:
+    """Format value with spec, or return missing when it is unset/zero."""
+    return format(value, spec) if value else missing
+
+
+def _fmt_pnl(value: float | None) -> str:
+    return f"${value:.2f}" if value is not None else "N/A"
+
+
+async def _iter_json_lines(response: httpx.Response) -> AsyncIterator[dict]:
+    """Parse an NDJSON body straight from bytes (no per-line str decode)."""
+    pending = b""
+    async for data in response.aiter_bytes():
+        pending += data
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield orjson.loads(line)
+    if pending.strip():
+        yield orjson.loads(pending)
+
 
 class OllamaClient:
     """Async client for Ollama API."""
@@ -20,103 +92,123 @@ class OllamaClient:
         host: str | None = None,
         model: str | None = None,
         timeout: float = 60.0,
+        availability_ttl: float = 30.0,
     ) -> None:
         self.host = host or settings.ollama.host
         self.model = model or settings.ollama.model
         self.timeout = timeout
+        # One pooled client for all calls so keep-alive connections are reused
+        self._client: httpx.AsyncClient | None = None
+
+        # Last /api/tags result, reused for availability_ttl seconds
+        self.availability_ttl = availability_ttl
+        self._avail_cached: bool | None = None
+        self._avail_ts = 0.0
+
+    async def __aenter__(self) -> OllamaClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.host,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def generate(self, prompt: str, system: str | None = None) -> str:
-        """Send a prompt to Ollama and return the response text."""
+        """Send a prompt to Ollama and return the full response text."""
+        return "".join([token async for token in self.generate_stream(prompt, system)])
+
+    async def generate_stream(
+        self, prompt: str, system: str | None = None
+    ) -> AsyncIterator[str]:
+        """Send a prompt to Ollama and yield response text as it is generated."""
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
         }
         if system:
             payload["system"] = system
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.host}/api/generate",
-                json=payload,
-            )
+        client = self._get_client()
+        async with client.stream("POST", "/api/generate", json=payload) as response:
             response.raise_for_status()
-            data = response.json()
-            return data.get("response", "")
+            # Ollama streams one JSON object per line until "done" is true
+            async for chunk in _iter_json_lines(response):
+                token = chunk.get("response")
+                if token:
+                    yield token
+                if chunk.get("done"):
+                    break
 
     async def review_trade(self, trade: Trade) -> str:
         """Generate an AI review of a completed trade."""
         prompt = self._build_trade_review_prompt(trade)
-        system = (
-            "You are a professional day trading coach reviewing MES micro futures trades. "
-            "Analyze what went right or wrong, and give specific, actionable feedback. "
-            "Be concise (3-5 sentences)."
-        )
-        return await self.generate(prompt, system=system)
+        return await self.generate(prompt, system=_TRADE_REVIEW_SYSTEM)
 
     async def generate_daily_summary(
         self, trades: list[Trade], metrics: PerformanceMetrics
     ) -> str:
         """Generate an AI daily trading summary."""
         prompt = self._build_daily_summary_prompt(trades, metrics)
-        system = (
-            "You are a professional trading coach reviewing a day's performance. "
-            "Identify patterns, mistakes, and areas for improvement. "
-            "Be direct and constructive. Keep it under 200 words."
-        )
-        return await self.generate(prompt, system=system)
+        return await self.generate(prompt, system=_DAILY_SUMMARY_SYSTEM)
 
     async def is_available(self) -> bool:
-        """Check if Ollama is running and the model is loaded."""
+        """Check if Ollama is running and the model is loaded.
+
+        The result is cached for ``availability_ttl`` seconds.
+        """
+        now = time.monotonic()
+        if self._avail_cached is not None and now - self._avail_ts < self.availability_ttl:
+            return self._avail_cached
+
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.host}/api/tags")
-                response.raise_for_status()
-                data = response.json()
-                models = [m.get("name", "") for m in data.get("models", [])]
-                return any(self.model in m for m in models)
+            response = await self._get_client().get("/api/tags", timeout=5.0)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            models = [m.get("name", "") for m in data.get("models", [])]
+            available = any(self.model in m for m in models)
         except Exception:
-            return False
+            available = False
+
+        self._avail_cached = available
+        self._avail_ts = now
+        return available
 
     def _build_trade_review_prompt(self, trade: Trade) -> str:
-        parts = [
-            f"Trade Review:",
-            f"  Direction: {trade.direction.value}",
-            f"  Entry: {trade.entry_price:.2f}",
-            f"  Exit: {trade.exit_price:.2f}" if trade.exit_price else "  Exit: (open)",
-            f"  Stop: {trade.stop_loss:.2f}",
-            f"  Target: {trade.take_profit:.2f}" if trade.take_profit else "  Target: none",
-            f"  P&L: ${trade.pnl_dollars:.2f}" if trade.pnl_dollars is not None else "  P&L: N/A",
-            f"  R:R Actual: {trade.risk_reward_actual:.2f}" if trade.risk_reward_actual else "",
-            f"  Quantity: {trade.quantity}",
-            f"  Strategy: {trade.strategy}",
-            f"  Confidence: {trade.signal_confidence:.2f}" if trade.signal_confidence else "",
-        ]
-
-        parts.append("\nWhat went right or wrong? What should I do differently next time?")
-        return "\n".join(p for p in parts if p)
+        rr = trade.risk_reward_actual
+        confidence = trade.signal_confidence
+        return _TRADE_REVIEW_TEMPLATE.format_map({
+            "direction": trade.direction.value,
+            "entry": trade.entry_price,
+            "exit": _fmt_optional(trade.exit_price, ".2f", "(open)"),
+            "stop": trade.stop_loss,
+            "target": _fmt_optional(trade.take_profit, ".2f", "none"),
+            "pnl": _fmt_pnl(trade.pnl_dollars),
+            "rr_line": f"  R:R Actual: {rr:.2f}\n" if rr else "",
+            "quantity": trade.quantity,
+            "strategy": trade.strategy,
+            "confidence_line": f"  Confidence: {confidence:.2f}\n" if confidence else "",
+        })
 
     def _build_daily_summary_prompt(
         self, trades: list[Trade], metrics: PerformanceMetrics
     ) -> str:
-        parts = [
-            f"Daily Trading Summary:",
-            f"  Total Trades: {metrics.total_trades}",
-            f"  Win Rate: {metrics.win_rate:.1%}",
-            f"  Net P&L: ${metrics.net_pnl:.2f}",
-            f"  Profit Factor: {metrics.profit_factor:.2f}",
-            f"  Max Drawdown: ${metrics.max_drawdown:.2f}",
-            f"  Avg Winner: ${metrics.avg_winner:.2f}",
-            f"  Avg Loser: ${metrics.avg_loser:.2f}",
-            f"  Winning Streak: {metrics.winning_streak}",
-            f"  Losing Streak: {metrics.losing_streak}",
-            "",
-            "Trades:",
-        ]
-
-        for i, t in enumerate(trades[:10], 1):
-            pnl = f"${t.pnl_dollars:.2f}" if t.pnl_dollars is not None else "N/A"
-            parts.append(f"  {i}. {t.direction.value} entry={t.entry_price:.2f} P&L={pnl}")
-
-        parts.append("\nIdentify patterns, mistakes, and suggestions for improvement.")
-        return "\n".join(parts)
+        trade_lines = "".join(
+            f"  {i}. {t.direction.value} entry={t.entry_price:.2f} P&L={_fmt_pnl(t.pnl_dollars)}\n"
+            for i, t in enumerate(trades[:10], 1)
+        )
+        return _DAILY_SUMMARY_TEMPLATE.format_map({**vars(metrics), "trades": trade_lines})
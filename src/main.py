@@ -9,18 +9,23 @@ from __future__ import annotations
 import asyncio
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from src.config import MES_SPEC, settings
 from src.core.account_manager import AccountManager
 from src.core.database import (
+    DUCKDB_TABLE_KEYS,
+    INDICATOR_CACHE_COLUMNS,
+    DuckDBBatchWriter,
+    dedupe_duckdb_table,
     get_duckdb_connection,
     get_sqlite_engine,
     init_duckdb,
     init_sqlite_db,
 )
-from src.core.logging import get_logger, setup_logging
-from src.core.models import Bar, EquitySnapshot, RiskDecision
+from src.core.logging import debug_enabled, get_logger, setup_logging
+from src.core.models import Bar, EquitySnapshot, RiskDecision, Trade
 from src.execution.base_executor import BaseExecutor
 from src.execution.copy_trader import CopyTradeManager
 from src.execution.order_manager import OrderManager
@@ -41,6 +46,10 @@ from src.tradovate.rest_client import TradovateRestClient
 
 logger = get_logger("main")
 
+# Concurrent trade reviews sent to Ollama, and how many may wait in line
+_AI_REVIEW_WORKERS = 2
+_AI_REVIEW_QUEUE_SIZE = 64
+
 
 class TradingApp:
     """Main application orchestrator with multi-account prop firm support."""
@@ -49,6 +58,14 @@ class TradingApp:
         # Core infrastructure
         self.sqlite_engine = get_sqlite_engine()
         self.duckdb_conn = get_duckdb_connection()
+        # DuckDB batch writes run here, off the market data callback path
+        self.duckdb_writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="duckdb-writer"
+        )
+        # Signal journal writes, so bar processing never waits on SQLite
+        self.sqlite_writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sqlite-writer"
+        )
         self.health = HealthMonitor()
 
         # Load accounts
@@ -73,12 +90,17 @@ class TradingApp:
 
         # Indicators
         self.indicator_calc = IndicatorCalculator()
+        self.indicator_writer = DuckDBBatchWriter(
+            self.duckdb_conn, "indicator_cache", INDICATOR_CACHE_COLUMNS,
+            flush_every=5, executor=self.duckdb_writer,
+        )
 
         # Aggregator: 5s bars -> 1m/5m bars
         self.aggregator = BarAggregator(
             duckdb_conn=self.duckdb_conn,
             on_1m_bar=self._on_1m_bar,
             on_5m_bar=self._on_5m_bar,
+            write_executor=self.duckdb_writer,
         )
 
         # Strategy
@@ -146,10 +168,16 @@ class TradingApp:
             strategies=[self.strategy],
             risk_manager=None,
             sqlite_engine=self.sqlite_engine,
+            executor=self.sqlite_writer,
         )
 
-        # LLM
+        # LLM: closed trades queue for review by a small pool of workers,
+        # so a burst of exits cannot fan out into many concurrent requests
         self.ollama_client = OllamaClient()
+        self._ai_review_queue: asyncio.Queue[Trade] = asyncio.Queue(
+            maxsize=_AI_REVIEW_QUEUE_SIZE
+        )
+        self._ai_review_workers: list[asyncio.Task] = []
 
         # Scheduler (multi-account daily trackers)
         daily_trackers = {
@@ -161,6 +189,10 @@ class TradingApp:
             health_monitor=self.health,
             trade_recorder=self.trade_recorder,
             equity_getter=self._get_equity_snapshots,
+            market_data_flush=self.indicator_writer.flush,
+            market_data_dedupe=self._dedupe_market_data,
+            risk_event_flush=self._flush_risk_events,
+            signal_flush=self.signal_generator.flush,
         )
 
         # Dashboard subprocess
@@ -189,6 +221,12 @@ class TradingApp:
         # Start scheduler
         self.scheduler.start()
 
+        # Start AI trade review workers
+        self._ai_review_workers = [
+            asyncio.create_task(self._ai_review_worker())
+            for _ in range(_AI_REVIEW_WORKERS)
+        ]
+
         # Connect to Tradovate
         connected = await self.tv_provider.connect()
         if connected:
@@ -201,7 +239,7 @@ class TradingApp:
         self._start_dashboard()
 
         # Run health check
-        status = self.health.check_all()
+        status = await self.health.check_all_async(ollama_host=settings.ollama.host)
         logger.info("health_check_complete", status=status.overall_status.value)
 
         # Main event loop
@@ -217,6 +255,15 @@ class TradingApp:
         """Gracefully shut down all systems."""
         logger.info("app_shutting_down")
 
+        # Drain the producers first: the last partial bar runs the whole
+        # pipeline and may still journal signals, trades and rejections
+        self.aggregator.flush()
+        try:
+            self.indicator_writer.flush()
+        except Exception as e:
+            logger.error("indicator_store_failed", error=str(e))
+        self.scheduler.stop()
+
         # Force-close any open positions on all accounts
         for account_id, om in self.order_managers.items():
             if om.open_positions:
@@ -229,21 +276,30 @@ class TradingApp:
         for account_id in self.risk_managers:
             self.trade_recorder.generate_daily_summary(account_id=account_id)
 
-        # Stop scheduler
-        self.scheduler.stop()
-
-        # Flush any pending bars
-        self.aggregator.flush()
+        # Nothing journals past this point; hand the last rows to SQLite
+        self._flush_risk_events()
+        self.trade_recorder.close()
+        self.signal_generator.close()
 
         # Disconnect Tradovate
         await self.tv_provider.disconnect()
         await self.tv_auth.close()
 
+        # Stop AI review workers, then close the pooled LLM HTTP client
+        for task in self._ai_review_workers:
+            task.cancel()
+        await asyncio.gather(*self._ai_review_workers, return_exceptions=True)
+        await self.ollama_client.close()
+        await self.health.aclose()
+
         # Stop dashboard
         if self._dashboard_proc:
             self._dashboard_proc.terminate()
 
-        # Close DB connections
+        # Wait for queued DuckDB and signal writes, then close DB connections
+        self.duckdb_writer.shutdown(wait=True)
+        self.sqlite_writer.shutdown(wait=True)
+        self.health.close()
         self.duckdb_conn.close()
         self.sqlite_engine.dispose()
 
@@ -261,13 +317,15 @@ class TradingApp:
         2. Generate raw signals from strategies
         3. Evaluate each signal against each account's risk manager
         4. Execute approved signals via per-account order managers
-        5. Check all positions for exits
+        5. Check all positions for exits (also updates daily unrealized P&L)
         6. Update drawdown tracking per account
         """
         # 1. Compute indicators
         snapshot = self.indicator_calc.update(bar)
         if snapshot:
             self._store_indicator_snapshot(snapshot)
+            for om in self.order_managers.values():
+                om.set_atr(snapshot.atr_14)
 
         # 2. Generate raw signals
         signals = self.signal_generator.generate_signals(bar, snapshot)
@@ -294,8 +352,7 @@ class TradingApp:
         # 6. Update equity and drawdown tracking per account
         for account_id, rm in self.risk_managers.items():
             om = self.order_managers[account_id]
-            unrealized = om.get_total_unrealized_pnl()
-            rm.daily_tracker.update_unrealized(unrealized)
+            unrealized = om.get_total_unrealized_pnl()  # Already fed to daily_tracker
 
             # Update Apex drawdown tracking
             if rm.apex_drawdown:
@@ -308,11 +365,24 @@ class TradingApp:
         # 7. AI review for closed trades
         for account_id, trades in all_closed.items():
             for trade in trades:
-                asyncio.create_task(self._ai_review_trade(trade))
+                try:
+                    self._ai_review_queue.put_nowait(trade)
+                except asyncio.QueueFull:
+                    logger.warning("ai_review_queue_full", account=account_id)
 
     def _on_5m_bar(self, bar: Bar) -> None:
         """Handle completed 5-minute bar."""
-        logger.info("bar_5m", close=bar.close, volume=bar.volume)
+        if debug_enabled():
+            logger.debug("bar_5m", close=bar.close, volume=bar.volume)
+
+    async def _ai_review_worker(self) -> None:
+        """Review queued closed trades one at a time."""
+        while True:
+            trade = await self._ai_review_queue.get()
+            try:
+                await self._ai_review_trade(trade)
+            finally:
+                self._ai_review_queue.task_done()
 
     async def _ai_review_trade(self, trade) -> None:
         """Request AI review for a closed trade."""
@@ -342,23 +412,34 @@ class TradingApp:
             ))
         return snapshots
 
+    def _flush_risk_events(self) -> None:
+        """Journal the risk rejections buffered by each account's risk manager."""
+        for account_id, rm in self.risk_managers.items():
+            for event in rm.drain_events():
+                self.trade_recorder.record_risk_event(event, account_id=account_id)
+
+    def _dedupe_market_data(self) -> None:
+        """Drop duplicate rows from the append-only DuckDB tables."""
+        # Scheduler jobs run on worker threads; use a cursor per call
+        conn = self.duckdb_conn.cursor()
+        try:
+            for table in DUCKDB_TABLE_KEYS:
+                removed = dedupe_duckdb_table(conn, table)
+                if removed:
+                    logger.info("market_data_deduped", table=table, rows=removed)
+        finally:
+            conn.close()
+
     def _store_indicator_snapshot(self, snapshot) -> None:
-        """Store computed indicators in DuckDB."""
+        """Queue computed indicators for DuckDB (written in batches)."""
         try:
-            self.duckdb_conn.execute(
-                """INSERT OR REPLACE INTO indicator_cache
-                   (timestamp, symbol, timeframe, vwap, bb_upper, bb_middle, bb_lower,
-                    keltner_upper, keltner_middle, keltner_lower, rsi_14, atr_14,
-                    ema_9, ema_21, volume_profile_poc)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                [
-                    snapshot.timestamp, snapshot.symbol, snapshot.timeframe,
-                    snapshot.vwap, snapshot.bb_upper, snapshot.bb_middle, snapshot.bb_lower,
-                    snapshot.keltner_upper, snapshot.keltner_middle, snapshot.keltner_lower,
-                    snapshot.rsi_14, snapshot.atr_14, snapshot.ema_9, snapshot.ema_21,
-                    snapshot.volume_profile_poc,
-                ],
-            )
+            self.indicator_writer.add((
+                snapshot.timestamp, snapshot.symbol, snapshot.timeframe,
+                snapshot.vwap, snapshot.bb_upper, snapshot.bb_middle, snapshot.bb_lower,
+                snapshot.keltner_upper, snapshot.keltner_middle, snapshot.keltner_lower,
+                snapshot.rsi_14, snapshot.atr_14, snapshot.ema_9, snapshot.ema_21,
+                snapshot.volume_profile_poc,
+            ))
         except Exception as e:
             logger.error("indicator_store_failed", error=str(e))
 
@@ -385,9 +466,16 @@ class TradingApp:
 
 
 def main():
-    """Entry point."""
+    """Entry point. Runs on uvloop when it is installed (performance extra)."""
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+
     app = TradingApp()
-    asyncio.run(app.start())
+    asyncio.run(app.start(), loop_factory=loop_factory)
 
 
 if __name__ == "__main__":
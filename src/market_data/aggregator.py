@@ -1,16 +1,19 @@
 """Bar aggregation: 5-second bars -> 1m/5m/15m OHLCV bars.
 
 Collects incoming 5-second bars from IB and aggregates them into
-standard timeframe bars, storing results in DuckDB.
+standard timeframe bars, storing results in DuckDB. Completed bars are
+buffered and written in one batch per 5-minute bar (or on flush()).
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from concurrent.futures import Executor
+from datetime import datetime
 from typing import Callable
 
 import duckdb
 
+from src.core.database import BARS_1M_COLUMNS, BARS_5M_COLUMNS, DuckDBBatchWriter
 from src.core.logging import get_logger
 from src.core.models import Bar
 
@@ -25,39 +28,60 @@ class BarAggregator:
         duckdb_conn: duckdb.DuckDBPyConnection,
         on_1m_bar: Callable[[Bar], None] | None = None,
         on_5m_bar: Callable[[Bar], None] | None = None,
+        max_buffered_bars: int = 64,
+        write_executor: Executor | None = None,
     ) -> None:
         self.conn = duckdb_conn
         self.on_1m_bar = on_1m_bar
         self.on_5m_bar = on_5m_bar
 
+        # Buffered DuckDB writes, flushed together once per 5m bar; the
+        # size cap only matters if 5m bars stop completing (data gaps).
+        # With write_executor the flushes run off the bar callback path.
+        self._bars_1m = DuckDBBatchWriter(
+            duckdb_conn, "bars_1m", BARS_1M_COLUMNS,
+            flush_every=max_buffered_bars, executor=write_executor,
+        )
+        self._bars_5m = DuckDBBatchWriter(
+            duckdb_conn, "bars_5m", BARS_5M_COLUMNS,
+            flush_every=max_buffered_bars, executor=write_executor,
+        )
+
         # Working state for 1m bar accumulation
         self._current_1m: _BarBuilder | None = None
-        # Accumulate 1m bars for 5m aggregation
-        self._pending_1m_bars: list[Bar] = []
+        self._current_1m_bucket = 0  # Epoch minute of _current_1m
+        # Working state for 5m bar accumulation from completed 1m bars
+        self._current_5m: _BarBuilder | None = None
+        self._current_5m_bucket = 0  # Epoch 5-minute period of _current_5m
 
     def on_bar(self, bar: Bar) -> None:
         """Process an incoming 5-second bar."""
-        minute_start = bar.timestamp.replace(second=0, microsecond=0)
+        ts = bar.timestamp
+        # Compare integer minute buckets; only a new minute builds a datetime
+        minute_bucket = int(ts.timestamp()) // 60
 
         if self._current_1m is None:
-            self._current_1m = _BarBuilder(minute_start, bar.symbol)
+            self._current_1m = _BarBuilder(ts.replace(second=0, microsecond=0), bar.symbol)
+            self._current_1m_bucket = minute_bucket
 
         # Check if we've crossed into a new minute
-        if minute_start > self._current_1m.period_start:
+        elif minute_bucket > self._current_1m_bucket:
             completed = self._current_1m.build()
             if completed:
                 self._emit_1m_bar(completed)
-            self._current_1m = _BarBuilder(minute_start, bar.symbol)
+            self._current_1m = _BarBuilder(ts.replace(second=0, microsecond=0), bar.symbol)
+            self._current_1m_bucket = minute_bucket
 
         self._current_1m.update(bar)
 
     def flush(self) -> None:
-        """Flush any pending partial bar (e.g., at session end)."""
+        """Flush any pending partial bar and buffered writes (e.g., at session end)."""
         if self._current_1m is not None:
             completed = self._current_1m.build()
             if completed:
                 self._emit_1m_bar(completed)
             self._current_1m = None
+        self._write_buffered()
 
     def _emit_1m_bar(self, bar: Bar) -> None:
         """Handle a completed 1-minute bar."""
@@ -66,61 +90,65 @@ class BarAggregator:
         if self.on_1m_bar:
             self.on_1m_bar(bar)
 
-        # Accumulate for 5m aggregation
-        self._pending_1m_bars.append(bar)
-        if len(self._pending_1m_bars) >= 5:
-            self._try_emit_5m_bar()
-
-    def _try_emit_5m_bar(self) -> None:
-        """Check if we have 5 consecutive 1m bars for a 5m bar."""
-        if len(self._pending_1m_bars) < 5:
-            return
-
-        first = self._pending_1m_bars[0]
-        five_min_start = first.timestamp.replace(
-            minute=(first.timestamp.minute // 5) * 5, second=0, microsecond=0
-        )
-
-        # Check if the 5th bar completes the 5-minute period
-        last = self._pending_1m_bars[-1]
-        expected_end = five_min_start + timedelta(minutes=5)
-        last_minute = last.timestamp.replace(second=0, microsecond=0)
-
-        if last_minute >= expected_end - timedelta(minutes=1):
-            bar_5m = _aggregate_bars(self._pending_1m_bars[:5], five_min_start)
-            if bar_5m:
-                self._store_5m_bar(bar_5m)
-                if self.on_5m_bar:
-                    self.on_5m_bar(bar_5m)
-            self._pending_1m_bars = self._pending_1m_bars[5:]
+        # Fold into the running 5m bar; a new 5m period closes out any
+        # partial one left by a gap in the feed
+        ts = bar.timestamp
+        epoch_minute = int(ts.timestamp()) // 60
+        bucket = epoch_minute // 5
+        current = self._current_5m
+        if current is not None and bucket != self._current_5m_bucket:
+            self._emit_5m_bar(current)
+            current = None
+        if current is None:
+            five_min_start = ts.replace(
+                minute=(ts.minute // 5) * 5, second=0, microsecond=0
+            )
+            current = self._current_5m = _BarBuilder(five_min_start, bar.symbol)
+            self._current_5m_bucket = bucket
+        current.update(bar)
+
+        # The last minute of the period completes the 5m bar
+        if epoch_minute % 5 == 4:
+            self._emit_5m_bar(current)
+
+    def _emit_5m_bar(self, builder: _BarBuilder) -> None:
+        """Handle a completed 5-minute bar and write buffered bars."""
+        self._current_5m = None
+        bar_5m = builder.build()
+        if bar_5m:
+            self._store_5m_bar(bar_5m)
+            if self.on_5m_bar:
+                self.on_5m_bar(bar_5m)
+        self._write_buffered()
 
     def _store_1m_bar(self, bar: Bar) -> None:
-        """Insert a 1-minute bar into DuckDB."""
+        """Queue a 1-minute bar for DuckDB."""
         try:
-            self.conn.execute(
-                """INSERT OR REPLACE INTO bars_1m
-                   (timestamp, symbol, open, high, low, close, volume, vwap, trade_count)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                [
-                    bar.timestamp, bar.symbol, bar.open, bar.high,
-                    bar.low, bar.close, bar.volume, bar.vwap, bar.trade_count,
-                ],
-            )
+            self._bars_1m.add((
+                bar.timestamp, bar.symbol, bar.open, bar.high,
+                bar.low, bar.close, bar.volume, bar.vwap, bar.trade_count,
+            ))
         except Exception as e:
             logger.error("duckdb_1m_insert_failed", error=str(e))
 
     def _store_5m_bar(self, bar: Bar) -> None:
-        """Insert a 5-minute bar into DuckDB."""
+        """Queue a 5-minute bar for DuckDB."""
         try:
-            self.conn.execute(
-                """INSERT OR REPLACE INTO bars_5m
-                   (timestamp, symbol, open, high, low, close, volume, vwap)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                [
-                    bar.timestamp, bar.symbol, bar.open, bar.high,
-                    bar.low, bar.close, bar.volume, bar.vwap,
-                ],
-            )
+            self._bars_5m.add((
+                bar.timestamp, bar.symbol, bar.open, bar.high,
+                bar.low, bar.close, bar.volume, bar.vwap,
+            ))
+        except Exception as e:
+            logger.error("duckdb_5m_insert_failed", error=str(e))
+
+    def _write_buffered(self) -> None:
+        """Write all buffered 1m and 5m bars to DuckDB."""
+        try:
+            self._bars_1m.flush()
+        except Exception as e:
+            logger.error("duckdb_1m_insert_failed", error=str(e))
+        try:
+            self._bars_5m.flush()
         except Exception as e:
             logger.error("duckdb_5m_insert_failed", error=str(e))
 
@@ -128,6 +156,8 @@ class BarAggregator:
 class _BarBuilder:
     """Accumulates ticks/sub-bars into a single OHLCV bar."""
 
+    __slots__ = ("period_start", "symbol", "open", "high", "low", "close", "volume", "count")
+
     def __init__(self, period_start: datetime, symbol: str = "MES") -> None:
         self.period_start = period_start
         self.symbol = symbol
@@ -142,8 +172,10 @@ class _BarBuilder:
         """Add a sub-bar's data."""
         if self.open is None:
             self.open = bar.open
-        self.high = max(self.high, bar.high)
-        self.low = min(self.low, bar.low)
+        if bar.high > self.high:
+            self.high = bar.high
+        if bar.low < self.low:
+            self.low = bar.low
         self.close = bar.close
         self.volume += bar.volume
         self.count += 1
@@ -162,17 +194,3 @@ class _BarBuilder:
             volume=self.volume,
         )
 
-
-def _aggregate_bars(bars: list[Bar], period_start: datetime) -> Bar | None:
-    """Aggregate multiple bars into one."""
-    if not bars:
-        return None
-    return Bar(
-        timestamp=period_start,
-        symbol=bars[0].symbol,
-        open=bars[0].open,
-        high=max(b.high for b in bars),
-        low=min(b.low for b in bars),
-        close=bars[-1].close,
-        volume=sum(b.volume for b in bars),
-    )
@@ -1,21 +1,30 @@
 """Historical data loader for backtesting and dashboard seeding.
 
-Supports loading from CSV files and from IB historical data requests.
+Supports loading from CSV files and storing bars, or column-wise bar
+DataFrames, into DuckDB.
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import duckdb
+import numpy as np
 import pandas as pd
 
+from src.core.database import (
+    BARS_1M_COLUMNS,
+    BARS_5M_COLUMNS,
+    dedupe_duckdb_table,
+)
 from src.core.logging import get_logger
 from src.core.models import Bar
 
 logger = get_logger("historical")
 
+_BAR_COLUMNS = {"1m": BARS_1M_COLUMNS, "5m": BARS_5M_COLUMNS}
+
 
 def load_csv_bars(
     file_path: str | Path,
@@ -36,22 +45,9 @@ def load_csv_bars(
         df = pd.read_csv(path)
         df.columns = [c.strip().lower() for c in df.columns]
 
-        if date_format:
-            df[timestamp_col] = pd.to_datetime(df[timestamp_col], format=date_format)
-        else:
-            df[timestamp_col] = pd.to_datetime(df[timestamp_col])
-
-        bars = []
-        for _, row in df.iterrows():
-            bars.append(Bar(
-                timestamp=row[timestamp_col].to_pydatetime(),
-                symbol=symbol,
-                open=float(row["open"]),
-                high=float(row["high"]),
-                low=float(row["low"]),
-                close=float(row["close"]),
-                volume=int(row["volume"]),
-            ))
+        df["timestamp"] = pd.to_datetime(df[timestamp_col], format=date_format)
+        df["symbol"] = symbol
+        bars = bars_from_frame(df)
 
         logger.info("csv_loaded", path=str(path), bars=len(bars))
         return bars
@@ -60,6 +56,95 @@ def load_csv_bars(
         return []
 
 
+def load_csv_to_duckdb(
+    conn: duckdb.DuckDBPyConnection,
+    file_path: str | Path,
+    timeframe: str = "1m",
+    symbol: str = "MES",
+    timestamp_col: str = "timestamp",
+) -> int:
+    """Load a CSV straight into DuckDB without building Bar objects.
+
+    Uses DuckDB's CSV reader, so the rows never pass through Python.
+    Expected columns as for load_csv_bars. Re-loading a file replaces its
+    earlier rows. Returns count of rows inserted.
+    """
+    path = Path(file_path)
+    if not path.exists():
+        logger.error("csv_not_found", path=str(path))
+        return 0
+
+    table = f"bars_{timeframe}"
+    select = f"""(timestamp, symbol, open, high, low, close, volume)
+        SELECT CAST("{timestamp_col}" AS TIMESTAMP), ?, open, high, low, close, volume
+        FROM read_csv_auto(?, header = true)"""
+    try:
+        count = _insert_select(conn, table, select, [symbol, str(path)])
+        dedupe_duckdb_table(conn, table)
+        logger.info("csv_loaded_to_duckdb", path=str(path), table=table, count=count)
+        return count
+    except Exception as e:
+        logger.error("csv_load_failed", path=str(path), error=str(e))
+        return 0
+
+
+def bars_to_frame(bars: list[Bar]) -> pd.DataFrame:
+    """Column-wise DataFrame of bars, one column per bars_1m field."""
+    return pd.DataFrame({
+        "timestamp": pd.DatetimeIndex([b.timestamp for b in bars]),
+        "symbol": [b.symbol for b in bars],
+        "open": np.fromiter((b.open for b in bars), np.float64, len(bars)),
+        "high": np.fromiter((b.high for b in bars), np.float64, len(bars)),
+        "low": np.fromiter((b.low for b in bars), np.float64, len(bars)),
+        "close": np.fromiter((b.close for b in bars), np.float64, len(bars)),
+        "volume": np.fromiter((b.volume for b in bars), np.int64, len(bars)),
+        # Nullable dtypes so missing values land as NULL, not NaN
+        "vwap": pd.array([b.vwap for b in bars], dtype="Float64"),
+        "trade_count": pd.array([b.trade_count for b in bars], dtype="Int64"),
+    })
+
+
+def bars_from_frame(frame: pd.DataFrame, symbol: str = "MES") -> list[Bar]:
+    """Build Bar objects from a bar DataFrame, for callers that need them.
+
+    Requires timestamp/open/high/low/close/volume columns; symbol, vwap and
+    trade_count are optional.
+    """
+    n = len(frame)
+    timestamps = pd.DatetimeIndex(frame["timestamp"]).to_pydatetime()
+    symbols = frame["symbol"].tolist() if "symbol" in frame else [symbol] * n
+    vwaps = _optional_column(frame, "vwap", n)
+    trade_counts = _optional_column(frame, "trade_count", n)
+
+    # Convert whole columns once, then build bars from plain Python values
+    columns = zip(
+        timestamps,
+        symbols,
+        frame["open"].to_numpy(dtype=np.float64).tolist(),
+        frame["high"].to_numpy(dtype=np.float64).tolist(),
+        frame["low"].to_numpy(dtype=np.float64).tolist(),
+        frame["close"].to_numpy(dtype=np.float64).tolist(),
+        frame["volume"].to_numpy(dtype=np.int64).tolist(),
+        vwaps,
+        trade_counts,
+    )
+    return [
+        Bar(
+            timestamp=ts, symbol=sym, open=o, high=h, low=lo, close=c, volume=v,
+            vwap=vw, trade_count=tc,
+        )
+        for ts, sym, o, h, lo, c, v, vw, tc in columns
+    ]
+
+
+def _optional_column(frame: pd.DataFrame, name: str, n: int) -> list:
+    """Values of an optional column with missing entries as None."""
+    if name not in frame:
+        return [None] * n
+    col = frame[name]
+    return col.astype(object).where(col.notna(), None).tolist()
+
+
 def store_bars_to_duckdb(
     conn: duckdb.DuckDBPyConnection,
     bars: list[Bar],
@@ -68,87 +153,113 @@ def store_bars_to_duckdb(
     """Store bars into DuckDB. Returns count of rows inserted."""
     if not bars:
         return 0
+    return store_frame_to_duckdb(conn, bars_to_frame(bars), timeframe)
+
+
+def store_frame_to_duckdb(
+    conn: duckdb.DuckDBPyConnection,
+    frame: pd.DataFrame,
+    timeframe: str = "1m",
+) -> int:
+    """Store a bar DataFrame into DuckDB. Returns count of rows inserted.
+
+    The frame is registered with DuckDB and ingested with one
+    INSERT ... SELECT, so DuckDB reads the columns vectorized rather than
+    binding parameters row by row. Columns the frame lacks are written as
+    NULL (vwap, trade_count).
+    """
+    if frame.empty:
+        return 0
 
     table = f"bars_{timeframe}"
-    data = [
-        (b.timestamp, b.symbol, b.open, b.high, b.low, b.close, b.volume, b.vwap, b.trade_count)
-        for b in bars
-    ]
+    # bars_5m has no trade_count column, so select only the table's columns
+    columns = _BAR_COLUMNS.get(timeframe, BARS_1M_COLUMNS)
+    select = ", ".join(c if c in frame else f"NULL AS {c}" for c in columns)
 
     try:
-        # Use INSERT OR REPLACE for idempotency
-        conn.executemany(
-            f"""INSERT OR REPLACE INTO {table}
-                (timestamp, symbol, open, high, low, close, volume, vwap, trade_count)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            data,
-        )
-        logger.info("bars_stored", table=table, count=len(data))
-        return len(data)
+        conn.register("_bars_stage", frame)
+        try:
+            count = _insert_select(
+                conn, table, f"({', '.join(columns)}) SELECT {select} FROM _bars_stage"
+            )
+        finally:
+            conn.unregister("_bars_stage")
+        # Dedupe keeps re-imports idempotent
+        dedupe_duckdb_table(conn, table)
+        logger.info("bars_stored", table=table, count=count)
+        return count
     except Exception as e:
         logger.error("bars_store_failed", table=table, error=str(e))
         return 0
 
 
+def _insert_select(
+    conn: duckdb.DuckDBPyConnection, table: str, select: str, params: list | None = None
+) -> int:
+    """Run INSERT INTO table <select>; returns the inserted row count.
+
+    Tables created with a primary key by older versions reject duplicate
+    keys, in which case the insert is retried as INSERT OR REPLACE.
+    """
+    try:
+        result = conn.execute(f"INSERT INTO {table} {select}", params)
+    except duckdb.ConstraintException:
+        result = conn.execute(f"INSERT OR REPLACE INTO {table} {select}", params)
+    row = result.fetchone()
+    return row[0] if row else 0
+
+
 def generate_sample_bars(
     count: int = 500,
     start_price: float = 5000.0,
     symbol: str = "MES",
     volatility: float = 2.0,
+    seed: int | None = None,
 ) -> list[Bar]:
     """Generate synthetic MES bars for testing/demo purposes.
 
-    Creates realistic-looking price action with random walks.
+    Creates realistic-looking price action with random walks. All random
+    draws, wicks, tick rounding and volumes are computed as arrays; only
+    the mean-reverting close walk is a (scalar) loop, since each step
+    depends on the previous close.
     """
-    import random
+    rng = np.random.default_rng(seed)
+    changes = rng.normal(0.0, volatility * 0.25, count)
+    wick_up = np.abs(rng.normal(0.0, volatility * 0.15, count))
+    wick_down = np.abs(rng.normal(0.0, volatility * 0.15, count))
+    volumes = np.maximum(rng.normal(1500.0, 500.0, count).astype(np.int64), 100)
 
-    bars = []
+    # Close walk with slight mean reversion, on tick-rounded prices
+    closes = np.empty(count, dtype=np.float64)
     price = start_price
-    base_time = datetime(2025, 1, 15, 17, 5)  # Wednesday session open
-
-    for i in range(count):
-        # Random walk with slight mean reversion
-        change = random.gauss(0, volatility * 0.25)
+    for i, change in enumerate(changes.tolist()):
         if abs(price - start_price) > 20:
             change -= (price - start_price) * 0.01  # Mean reversion pull
+        price = round(round((price + change) / 0.25) * 0.25, 2)
+        closes[i] = price
+    opens = np.empty(count, dtype=np.float64)
+    opens[:1] = round(round(start_price / 0.25) * 0.25, 2)
+    opens[1:] = closes[:-1]
 
-        open_price = price
-        close_price = price + change
-
-        # Generate realistic OHLC from the move
-        if change >= 0:
-            high_price = close_price + abs(random.gauss(0, volatility * 0.15))
-            low_price = open_price - abs(random.gauss(0, volatility * 0.15))
-        else:
-            high_price = open_price + abs(random.gauss(0, volatility * 0.15))
-            low_price = close_price - abs(random.gauss(0, volatility * 0.15))
-
-        # Round to tick size
-        open_price = round(round(open_price / 0.25) * 0.25, 2)
-        high_price = round(round(high_price / 0.25) * 0.25, 2)
-        low_price = round(round(low_price / 0.25) * 0.25, 2)
-        close_price = round(round(close_price / 0.25) * 0.25, 2)
+    # Wicks extend beyond the body, then round to tick size
+    highs = np.round(np.round((np.maximum(opens, closes) + wick_up) / 0.25) * 0.25, 2)
+    lows = np.round(np.round((np.minimum(opens, closes) - wick_down) / 0.25) * 0.25, 2)
 
-        # Ensure OHLC integrity
-        high_price = max(open_price, close_price, high_price)
-        low_price = min(open_price, close_price, low_price)
-
-        volume = int(random.gauss(1500, 500))
-        volume = max(volume, 100)
-
-        timestamp = base_time + pd.Timedelta(minutes=i)
-
-        bars.append(Bar(
-            timestamp=timestamp,
+    base_time = datetime(2025, 1, 15, 17, 5)  # Wednesday session open
+    bars = [
+        Bar(
+            timestamp=base_time + timedelta(minutes=i),
             symbol=symbol,
-            open=open_price,
-            high=high_price,
-            low=low_price,
-            close=close_price,
-            volume=volume,
+            open=o,
+            high=h,
+            low=lo,
+            close=c,
+            volume=v,
+        )
+        for i, (o, h, lo, c, v) in enumerate(zip(
+            opens.tolist(), highs.tolist(), lows.tolist(), closes.tolist(), volumes.tolist(),
         ))
-
-        price = close_price
+    ]
 
     logger.info("sample_bars_generated", count=count, start=start_price)
     return bars
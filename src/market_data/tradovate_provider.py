@@ -51,7 +51,8 @@ class TradovateProvider:
     config : object
         Must expose ``md_ws_url``.
     on_bar : Callable[[Bar], None] | None
-        Called for every completed 5-second chart bar.
+        Called once per 5-second chart bar, with its final update, when
+        the next bar starts.
     on_tick : Callable | None
         Called for raw tick data (reserved for future use).
     """
@@ -73,6 +74,14 @@ class TradovateProvider:
         self._seq: int = 0
         self._subscribed_symbol: str | None = None
         self._should_run = False
+        # Set by disconnect() so a pending reconnect backoff ends at once
+        self._stop_event = asyncio.Event()
+        # Newest bar already emitted; chart responses re-deliver history
+        # (e.g. after a resubscribe), and only newer bars are passed on
+        self._last_bar_ts: datetime | None = None
+        # Latest update of the still-forming bar. Tradovate resends a bar as
+        # it fills in, so it is emitted once a newer bar starts
+        self._forming: Bar | None = None
 
     # ------------------------------------------------------------------
     # Properties
@@ -125,13 +134,15 @@ class TradovateProvider:
         symbol : str
             Tradovate symbol root (default ``"MES"``).
 
-        Returns ``True`` on success.
+        One symbol at a time: every bar feeds the single BarAggregator and
+        trading pipeline. Returns ``True`` on success.
         """
         if not self._ws or not self._connected:
             logger.error("subscribe_bars_not_connected")
             return False
 
         try:
+            now = datetime.now(UTC).isoformat()
             chart_request = {
                 "symbol": symbol,
                 "chartDescription": {
@@ -141,8 +152,8 @@ class TradovateProvider:
                     "withHistogram": False,
                 },
                 "timeRange": {
-                    "asFarAsTimestamp": datetime.now(UTC).isoformat(),
-                    "closestTimestamp": datetime.now(UTC).isoformat(),
+                    "asFarAsTimestamp": now,
+                    "closestTimestamp": now,
                 },
             }
             msg = self._build_message("md/getChart", "", chart_request)
@@ -158,6 +169,7 @@ class TradovateProvider:
     async def disconnect(self) -> None:
         """Close the WebSocket connection."""
         self._should_run = False
+        self._stop_event.set()
         self._connected = False
         if self._ws:
             try:
@@ -179,6 +191,7 @@ class TradovateProvider:
         backoff and attempts to reconnect + resubscribe.
         """
         self._should_run = True
+        self._stop_event.clear()
         backoff = _INITIAL_BACKOFF_S
 
         while self._should_run:
@@ -187,7 +200,7 @@ class TradovateProvider:
                 ok = await self.connect()
                 if not ok:
                     logger.warning("md_ws_reconnect_backoff", wait_s=backoff)
-                    await asyncio.sleep(backoff)
+                    await self._wait_backoff(backoff)
                     backoff = min(backoff * _BACKOFF_FACTOR, _MAX_BACKOFF_S)
                     continue
 
@@ -226,13 +239,20 @@ class TradovateProvider:
 
             if self._should_run:
                 logger.info("md_ws_reconnecting", wait_s=backoff)
-                await asyncio.sleep(backoff)
+                await self._wait_backoff(backoff)
                 backoff = min(backoff * _BACKOFF_FACTOR, _MAX_BACKOFF_S)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    async def _wait_backoff(self, delay: float) -> None:
+        """Sleep for the reconnect backoff, returning early on disconnect()."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+        except TimeoutError:
+            pass
+
     def _next_seq(self) -> int:
         self._seq += 1
         return self._seq
@@ -281,15 +301,46 @@ class TradovateProvider:
         if not isinstance(charts, list):
             charts = [charts]
 
-        for bar_data in charts:
-            bar = self._parse_bar(bar_data)
-            if bar and self.on_bar:
-                try:
-                    self.on_bar(bar)
-                except Exception as exc:
-                    logger.error("on_bar_callback_error", error=str(exc))
+        bars_data = []
+        for chart in charts:
+            if isinstance(chart, dict) and "bars" in chart:
+                # Chart entry tagged with its id; bars are nested
+                bars_data.extend(chart["bars"] or [])
+            else:
+                bars_data.append(chart)
+        self._emit_bars(bars_data)
+
+    def _emit_bars(self, bars_data: list) -> None:
+        """Emit each bar once it is complete.
+
+        A bar counts as complete when a bar with a later timestamp arrives;
+        until then each update replaces the held one. Bars no newer than
+        the last one emitted are re-deliveries and are dropped.
+        """
+        symbol = self._subscribed_symbol or "MES"
+        last_ts = self._last_bar_ts
+        forming = self._forming
+        for bar_data in bars_data:
+            bar = self._parse_bar(bar_data, symbol)
+            if bar is None or (last_ts is not None and bar.timestamp <= last_ts):
+                continue
+            if forming is not None and bar.timestamp > forming.timestamp:
+                last_ts = forming.timestamp
+                self._emit_bar(forming)
+            elif forming is not None and bar.timestamp < forming.timestamp:
+                continue  # Older than the bar being built; already superseded
+            forming = bar
+        self._forming = forming
+        self._last_bar_ts = last_ts
+
+    def _emit_bar(self, bar: Bar) -> None:
+        if self.on_bar:
+            try:
+                self.on_bar(bar)
+            except Exception as exc:
+                logger.error("on_bar_callback_error", error=str(exc))
 
-    def _parse_bar(self, bar_data: dict) -> Bar | None:
+    def _parse_bar(self, bar_data: dict, symbol: str = "MES") -> Bar | None:
         """Convert a Tradovate chart bar dict into a Bar model.
 
         Tradovate bar fields:
@@ -318,7 +369,7 @@ class TradovateProvider:
 
             return Bar(
                 timestamp=ts,
-                symbol=self._subscribed_symbol or "MES",
+                symbol=symbol,
                 open=float(bar_data["open"]),
                 high=float(bar_data["high"]),
                 low=float(bar_data["low"]),
@@ -5,11 +5,16 @@ Periodically checks broker connection, database writes, and Ollama availability.
 
 from __future__ import annotations
 
+import asyncio
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
 from src.core.logging import get_logger
 
 logger = get_logger("health")
@@ -22,7 +27,7 @@ class ServiceStatus(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthStatus:
     """Current health of all services."""
 
@@ -37,48 +42,127 @@ class HealthStatus:
 
     @property
     def overall_status(self) -> ServiceStatus:
-        """Overall system health."""
-        statuses = [self.broker_status, self.duckdb_status, self.sqlite_status]
-        if any(s == ServiceStatus.DOWN for s in statuses):
-            return ServiceStatus.DOWN
-        if any(s == ServiceStatus.DEGRADED for s in statuses):
+        """Overall system health.
+
+        DOWN if any service is down, else DEGRADED if any is degraded, else
+        UP only when all are up. One pass, stopping at the first DOWN.
+        """
+        all_up = True
+        degraded = False
+        for s in (self.broker_status, self.duckdb_status, self.sqlite_status):
+            if s is ServiceStatus.DOWN:
+                return ServiceStatus.DOWN
+            if s is ServiceStatus.DEGRADED:
+                degraded = True
+            elif s is not ServiceStatus.UP:
+                all_up = False
+        if degraded:
             return ServiceStatus.DEGRADED
-        if all(s == ServiceStatus.UP for s in statuses):
-            return ServiceStatus.UP
-        return ServiceStatus.UNKNOWN
+        return ServiceStatus.UP if all_up else ServiceStatus.UNKNOWN
 
 
 class HealthMonitor:
-    """Monitors system health and tracks service availability."""
+    """Monitors system health and tracks service availability.
+
+    check_all results are reused for cache_ttl seconds, so callers that
+    poll in bursts don't repeat the probes.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_ttl: float = 1.0) -> None:
         self._start_time = time.monotonic()
         self.status = HealthStatus()
+        self._cache_ttl = cache_ttl
+        self._cache_ts: float | None = None
         self._broker_provider = None
         self._duckdb_conn = None
         self._sqlite_engine = None
+        # Probes use their own long-lived connections so they never queue
+        # behind (or take pool slots from) real query traffic
+        self._sqlite_health_conn = None
+        # Reused across Ollama checks to keep its connection alive
+        self._http: httpx.AsyncClient | None = None
 
     def register_broker(self, provider) -> None:
         """Register broker provider for health monitoring."""
         self._broker_provider = provider
 
     def register_duckdb(self, conn) -> None:
-        """Register DuckDB connection."""
-        self._duckdb_conn = conn
+        """Register DuckDB connection.
 
-    def register_sqlite(self, engine) -> None:
-        """Register SQLite engine."""
-        self._sqlite_engine = engine
+        Probes run on a cursor of it: a separate handle to the same
+        database, usable from the probe's worker thread.
+        """
+        self._duckdb_conn = conn.cursor()
 
-    def check_all(self) -> HealthStatus:
-        """Run all health checks."""
-        self.status.uptime_seconds = time.monotonic() - self._start_time
-        self.status.last_check = datetime.now()
-        self.status.errors.clear()
+    def register_sqlite(self, engine, healthcheck_engine=None) -> None:
+        """Register SQLite engine.
+
+        Probes use healthcheck_engine, by default a single-connection
+        engine on the same database that is kept open between checks.
+        """
+        self._sqlite_engine = healthcheck_engine or create_engine(
+            engine.url,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+
+    def close(self) -> None:
+        """Close the probe connections."""
+        if self._sqlite_health_conn is not None:
+            self._sqlite_health_conn.close()
+            self._sqlite_health_conn = None
+        if self._sqlite_engine is not None:
+            self._sqlite_engine.dispose()
+        if self._duckdb_conn is not None:
+            self._duckdb_conn.close()
+
+    def check_all(self, force: bool = False) -> HealthStatus:
+        """Run all health checks.
+
+        Returns the previous result if it is younger than the cache TTL,
+        unless force is set.
+        """
+        now = time.monotonic()
+        if self._is_cached(now, force):
+            return self.status
+
+        errors = [self._check_broker(), self._check_duckdb(), self._check_sqlite()]
+        return self._record(now, errors)
+
+    async def check_all_async(
+        self, force: bool = False, ollama_host: str = "http://localhost:11434"
+    ) -> HealthStatus:
+        """Run all health checks concurrently, including Ollama.
 
-        self._check_broker()
-        self._check_duckdb()
-        self._check_sqlite()
+        The database probes run in worker threads alongside the Ollama
+        request, so the check takes as long as the slowest probe rather
+        than their sum. Caching is as for check_all.
+        """
+        now = time.monotonic()
+        if self._is_cached(now, force):
+            return self.status
+
+        broker_error = self._check_broker()  # Attribute read, no I/O
+        duckdb_error, sqlite_error, _ = await asyncio.gather(
+            asyncio.to_thread(self._check_duckdb),
+            asyncio.to_thread(self._check_sqlite),
+            self.check_ollama(ollama_host),
+        )
+        return self._record(now, [broker_error, duckdb_error, sqlite_error])
+
+    def _is_cached(self, now: float, force: bool) -> bool:
+        return (
+            not force
+            and self._cache_ts is not None
+            and now - self._cache_ts < self._cache_ttl
+        )
+
+    def _record(self, now: float, errors: list[str | None]) -> HealthStatus:
+        """Store the errors of a completed check run and log the outcome."""
+        self.status.uptime_seconds = now - self._start_time
+        self.status.last_check = datetime.now()
+        self.status.errors = [e for e in errors if e]
+        self._cache_ts = now
 
         if self.status.overall_status == ServiceStatus.DOWN:
             logger.error("health_check_failed", status=self.status.overall_status.value,
@@ -88,28 +172,31 @@ class HealthMonitor:
 
         return self.status
 
-    def _check_broker(self) -> None:
+    # Each check sets its service status and returns an error message, if
+    # any, so checks running in parallel never share a list
+
+    def _check_broker(self) -> str | None:
         """Check broker connection health."""
         if self._broker_provider is None:
             self.status.broker_status = ServiceStatus.UNKNOWN
-            return
+            return None
 
         try:
             if self._broker_provider.connected:
                 self.status.broker_status = ServiceStatus.UP
                 self.status.broker_last_heartbeat = datetime.now()
-            else:
-                self.status.broker_status = ServiceStatus.DOWN
-                self.status.errors.append("Broker disconnected")
+                return None
+            self.status.broker_status = ServiceStatus.DOWN
+            return "Broker disconnected"
         except Exception as e:
             self.status.broker_status = ServiceStatus.DOWN
-            self.status.errors.append(f"Broker check failed: {e}")
+            return f"Broker check failed: {e}"
 
-    def _check_duckdb(self) -> None:
+    def _check_duckdb(self) -> str | None:
         """Check DuckDB is responsive."""
         if self._duckdb_conn is None:
             self.status.duckdb_status = ServiceStatus.UNKNOWN
-            return
+            return None
 
         try:
             result = self._duckdb_conn.execute("SELECT 1").fetchone()
@@ -117,36 +204,53 @@ class HealthMonitor:
                 self.status.duckdb_status = ServiceStatus.UP
             else:
                 self.status.duckdb_status = ServiceStatus.DEGRADED
+            return None
         except Exception as e:
             self.status.duckdb_status = ServiceStatus.DOWN
-            self.status.errors.append(f"DuckDB check failed: {e}")
+            return f"DuckDB check failed: {e}"
 
-    def _check_sqlite(self) -> None:
+    def _check_sqlite(self) -> str | None:
         """Check SQLite is responsive."""
         if self._sqlite_engine is None:
             self.status.sqlite_status = ServiceStatus.UNKNOWN
-            return
+            return None
 
         try:
-            with self._sqlite_engine.connect() as conn:
-                result = conn.execute("SELECT 1").fetchone()
-                if result and result[0] == 1:
-                    self.status.sqlite_status = ServiceStatus.UP
-                else:
-                    self.status.sqlite_status = ServiceStatus.DEGRADED
+            if self._sqlite_health_conn is None:
+                self._sqlite_health_conn = self._sqlite_engine.connect()
+            # Dialect-level ping on the raw DBAPI connection, skipping
+            # SQLAlchemy's statement and result handling
+            dbapi_conn = self._sqlite_health_conn.connection.dbapi_connection
+            if self._sqlite_engine.dialect.do_ping(dbapi_conn):
+                self.status.sqlite_status = ServiceStatus.UP
+            else:
+                self.status.sqlite_status = ServiceStatus.DEGRADED
+            return None
         except Exception as e:
+            # Reconnect on the next check
+            if self._sqlite_health_conn is not None:
+                self._sqlite_health_conn.invalidate()
+                self._sqlite_health_conn = None
             self.status.sqlite_status = ServiceStatus.DOWN
-            self.status.errors.append(f"SQLite check failed: {e}")
+            return f"SQLite check failed: {e}"
 
     async def check_ollama(self, ollama_host: str = "http://localhost:11434") -> None:
         """Check if Ollama is running (async)."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=5.0, limits=httpx.Limits(max_keepalive_connections=1)
+            )
         try:
-            import httpx
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.get(f"{ollama_host}/api/tags")
-                if resp.status_code == 200:
-                    self.status.ollama_status = ServiceStatus.UP
-                else:
-                    self.status.ollama_status = ServiceStatus.DEGRADED
+            resp = await self._http.get(f"{ollama_host}/api/tags")
+            if resp.status_code == 200:
+                self.status.ollama_status = ServiceStatus.UP
+            else:
+                self.status.ollama_status = ServiceStatus.DEGRADED
         except Exception:
             self.status.ollama_status = ServiceStatus.DOWN
+
+    async def aclose(self) -> None:
+        """Close the Ollama HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
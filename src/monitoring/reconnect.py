@@ -6,6 +6,8 @@ Used primarily for IB connection recovery.
 from __future__ import annotations
 
 import asyncio
+import random
+import time
 from typing import Callable
 
 from src.core.logging import get_logger
@@ -14,7 +16,12 @@ logger = get_logger("reconnect")
 
 
 class ReconnectManager:
-    """Manages reconnection with exponential backoff."""
+    """Manages reconnection with exponential backoff.
+
+    With jitter on, each wait is drawn uniformly from [0, current_delay]
+    ("full jitter"), so clients that dropped together don't retry in
+    lockstep.
+    """
 
     def __init__(
         self,
@@ -25,6 +32,7 @@ class ReconnectManager:
         max_attempts: int = 0,  # 0 = unlimited
         on_reconnected: Callable | None = None,
         on_give_up: Callable | None = None,
+        jitter: bool = True,
     ) -> None:
         self.connect_fn = connect_fn
         self.max_delay = max_delay
@@ -33,20 +41,40 @@ class ReconnectManager:
         self.max_attempts = max_attempts
         self.on_reconnected = on_reconnected
         self.on_give_up = on_give_up
+        self.jitter = jitter
 
         self._attempts = 0
         self._running = False
+        # Actual sleep before the latest attempt, and when that attempt ran
+        self._last_delay = 0.0
+        self._last_attempt_at: float | None = None
 
     @property
     def current_delay(self) -> float:
-        """Calculate current backoff delay."""
+        """Calculate current backoff delay (the jitter ceiling)."""
         delay = self.initial_delay * (self.backoff_factor ** self._attempts)
         return min(delay, self.max_delay)
 
+    def _next_delay(self) -> float:
+        """Delay before the next attempt, with jitter applied."""
+        ceiling = self.current_delay
+        self._last_delay = random.uniform(0.0, ceiling) if self.jitter else ceiling
+        return self._last_delay
+
     async def start(self) -> bool:
-        """Begin reconnection loop. Returns True if reconnected."""
+        """Begin reconnection loop. Returns True if reconnected.
+
+        If the last attempt was less than one backoff window ago (the
+        connection dropped right after reconnecting), the rest of that
+        window is waited out first, so flapping can't cause a burst of
+        reconnects. The attempt count still starts from zero.
+        """
         self._running = True
-        self._attempts = 0
+        hold = self._burst_hold()
+        self.reset()
+        if hold > 0:
+            logger.info("reconnect_burst_hold", wait=hold)
+            await asyncio.sleep(hold)
 
         while self._running:
             if self.max_attempts > 0 and self._attempts >= self.max_attempts:
@@ -55,7 +83,7 @@ class ReconnectManager:
                     self.on_give_up()
                 return False
 
-            delay = self.current_delay
+            delay = self._next_delay()
             logger.info(
                 "reconnect_attempt",
                 attempt=self._attempts + 1,
@@ -63,6 +91,7 @@ class ReconnectManager:
             )
 
             await asyncio.sleep(delay)
+            self._last_attempt_at = time.monotonic()
 
             try:
                 result = await self.connect_fn()
@@ -90,3 +119,10 @@ class ReconnectManager:
     def reset(self) -> None:
         """Reset attempt counter."""
         self._attempts = 0
+
+    def _burst_hold(self) -> float:
+        """Seconds left of the backoff window since the last attempt (0 if past)."""
+        if self._last_attempt_at is None:
+            return 0.0
+        elapsed = time.monotonic() - self._last_attempt_at
+        return max(0.0, self.current_delay - elapsed)
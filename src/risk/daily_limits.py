@@ -6,15 +6,23 @@ Tracks realized + unrealized P&L and enforces loss limits.
 from __future__ import annotations
 
 import time
+from collections import deque
 from dataclasses import dataclass, field
 
 from src.config import RISK_DEFAULTS
 from src.core.models import RiskEvent, Severity
 
+# Most recent risk events kept in memory; older ones are dropped
+MAX_RISK_EVENTS = 1000
 
-@dataclass
+
+@dataclass(slots=True)
 class DailyLimitsTracker:
-    """Tracks daily/weekly P&L and enforces loss limits."""
+    """Tracks daily/weekly P&L and enforces loss limits.
+
+    The dollar limits are derived from account_equity once; change equity
+    through set_equity so they stay in step.
+    """
 
     account_equity: float
     daily_loss_limit_pct: float = RISK_DEFAULTS["daily_loss_limit"]
@@ -30,16 +38,25 @@ class DailyLimitsTracker:
     trades_today: int = 0
     daily_halted: bool = False
     weekly_halted: bool = False
-    last_loss_time: float | None = None
-    events: list[RiskEvent] = field(default_factory=list)
+    last_loss_time_ns: int | None = None  # time.monotonic_ns() of the last loss
+    events: deque[RiskEvent] = field(
+        default_factory=lambda: deque(maxlen=MAX_RISK_EVENTS)
+    )
+
+    # P&L floors (negated dollar limits), precomputed for the per-tick checks
+    _daily_floor: float = field(init=False, repr=False)
+    _weekly_floor: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._update_limits()
 
     @property
     def daily_loss_limit_dollars(self) -> float:
-        return self.account_equity * self.daily_loss_limit_pct
+        return -self._daily_floor
 
     @property
     def weekly_loss_limit_dollars(self) -> float:
-        return self.account_equity * self.weekly_loss_limit_pct
+        return -self._weekly_floor
 
     @property
     def total_pnl_today(self) -> float:
@@ -51,18 +68,18 @@ class DailyLimitsTracker:
 
     @property
     def is_in_cooldown(self) -> bool:
-        if self.last_loss_time is None:
+        if self.last_loss_time_ns is None:
             return False
-        elapsed = time.monotonic() - self.last_loss_time
-        return elapsed < self.cooldown_seconds
+        elapsed_ns = time.monotonic_ns() - self.last_loss_time_ns
+        return elapsed_ns < self.cooldown_seconds * 1_000_000_000
 
     @property
     def cooldown_remaining(self) -> float:
-        if self.last_loss_time is None:
+        if self.last_loss_time_ns is None:
             return 0.0
-        elapsed = time.monotonic() - self.last_loss_time
-        remaining = self.cooldown_seconds - elapsed
-        return max(remaining, 0.0)
+        elapsed_ns = time.monotonic_ns() - self.last_loss_time_ns
+        remaining_ns = self.cooldown_seconds * 1_000_000_000 - elapsed_ns
+        return max(remaining_ns / 1e9, 0.0)
 
     def record_trade_closed(self, pnl_dollars: float) -> None:
         """Record a closed trade's P&L and check limits."""
@@ -71,7 +88,7 @@ class DailyLimitsTracker:
         self.trades_today += 1
 
         if pnl_dollars < 0:
-            self.last_loss_time = time.monotonic()
+            self.last_loss_time_ns = time.monotonic_ns()
 
         self._check_daily_limit()
         self._check_weekly_limit()
@@ -82,6 +99,11 @@ class DailyLimitsTracker:
         self._check_daily_limit()
         self._check_weekly_limit()
 
+    def set_equity(self, account_equity: float) -> None:
+        """Update account equity and the dollar limits derived from it."""
+        self.account_equity = account_equity
+        self._update_limits()
+
     def can_trade(self) -> tuple[bool, str]:
         """Check if trading is allowed. Returns (allowed, reason)."""
         if self.daily_halted:
@@ -100,7 +122,7 @@ class DailyLimitsTracker:
         self.unrealized_pnl = 0.0
         self.trades_today = 0
         self.daily_halted = False
-        self.last_loss_time = None
+        self.last_loss_time_ns = None
         self.events.clear()
 
     def reset_weekly(self) -> None:
@@ -109,19 +131,24 @@ class DailyLimitsTracker:
         self.weekly_halted = False
         self.reset_daily()
 
+    def _update_limits(self) -> None:
+        self._daily_floor = -self.account_equity * self.daily_loss_limit_pct
+        self._weekly_floor = -self.account_equity * self.weekly_loss_limit_pct
+
     def _check_daily_limit(self) -> None:
         """Check if daily loss limit has been breached."""
         if self.daily_halted:
             return
-        if self.total_pnl_today <= -self.daily_loss_limit_dollars:
+        total = self.realized_pnl_today + self.unrealized_pnl
+        if total <= self._daily_floor:
             self.daily_halted = True
             self.events.append(RiskEvent(
                 event_type="DAILY_LIMIT",
                 details={
                     "realized_pnl": self.realized_pnl_today,
                     "unrealized_pnl": self.unrealized_pnl,
-                    "total_pnl": self.total_pnl_today,
-                    "limit": -self.daily_loss_limit_dollars,
+                    "total_pnl": total,
+                    "limit": self._daily_floor,
                 },
                 severity=Severity.CRITICAL,
             ))
@@ -131,7 +158,7 @@ class DailyLimitsTracker:
         if self.weekly_halted:
             return
         total_week = self.realized_pnl_week + self.unrealized_pnl
-        if total_week <= -self.weekly_loss_limit_dollars:
+        if total_week <= self._weekly_floor:
             self.weekly_halted = True
             self.events.append(RiskEvent(
                 event_type="WEEKLY_LIMIT",
@@ -139,7 +166,7 @@ class DailyLimitsTracker:
                     "realized_pnl_week": self.realized_pnl_week,
                     "unrealized_pnl": self.unrealized_pnl,
                     "total_pnl_week": total_week,
-                    "limit": -self.weekly_loss_limit_dollars,
+                    "limit": self._weekly_floor,
                 },
                 severity=Severity.CRITICAL,
             ))
@@ -7,13 +7,16 @@ concurrent positions, trading hours, and cooldown timer.
 
 from __future__ import annotations
 
+from collections import deque
 from datetime import datetime, time
-
-import pytz
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
 from src.config import RISK_DEFAULTS, MES_SPEC
+from src.core.logging import get_logger
 from src.core.models import (
     Direction,
+    RejectDetails,
     RiskDecision,
     RiskEvent,
     RiskResult,
@@ -21,15 +24,73 @@ from src.core.models import (
     Signal,
 )
 from src.risk.apex_drawdown import ApexDrawdownTracker
-from src.risk.daily_limits import DailyLimitsTracker
-from src.risk.position_sizer import calculate_position_size, validate_stop_distance
-from src.risk.stop_loss import (
-    calculate_risk_reward_ratio,
-    calculate_stop_distance_ticks,
-    validate_stop_placement,
-)
+from src.risk.daily_limits import MAX_RISK_EVENTS, DailyLimitsTracker
+from src.risk.trade_math import evaluate_trade_math
+
+logger = get_logger(__name__)
+
+# Rejections kept for the journal between drain_events calls. Larger than
+# MAX_RISK_EVENTS: that deque is only an in-memory view, while an event
+# dropped here never reaches the journal, so this one must ride out a
+# slow or failing journal flush.
+MAX_UNRECORDED_EVENTS = 4096
+
+CT = ZoneInfo("America/Chicago")
+ET = ZoneInfo("America/New_York")
+
+_MINUTES_PER_DAY = 24 * 60
+
+
+def _hours_reason(
+    weekday: int, current_time: time, skip_first: int, skip_last: int
+) -> str:
+    """Trading-hours rejection reason at a CT weekday (0=Monday) and time, or ""."""
+    # CME Globex: Sunday 5PM to Friday 4PM CT
+    # Saturday = completely closed
+    if weekday == 5:  # Saturday
+        return "Market closed (Saturday)"
+
+    # Sunday before 5PM
+    if weekday == 6 and current_time < time(17, 0):
+        return "Market closed (Sunday before 5PM CT)"
+
+    # Friday after 4PM
+    if weekday == 4 and current_time >= time(16, 0):
+        return "Market closed (Friday after 4PM CT)"
+
+    # Apex: block new entries 5 min before daily maintenance
+    if time(15, 55) <= current_time < time(16, 0) and weekday in range(5):
+        return "Approaching daily maintenance (3:55-4:00 PM CT)"
 
-CT = pytz.timezone("America/Chicago")
+    # Daily maintenance break: 4:00 PM - 5:00 PM CT (Mon-Thu)
+    if time(16, 0) <= current_time < time(17, 0) and weekday in (0, 1, 2, 3):
+        return "Daily maintenance break (4-5PM CT)"
+
+    # Skip first N minutes of session
+    session_start = time(17, skip_first)
+    if current_time >= time(17, 0) and current_time < session_start:
+        return f"Skipping first {skip_first} minutes of session"
+
+    # Skip last N minutes before close
+    close_buffer = time(15, 60 - skip_last)
+    if weekday == 4 and current_time >= close_buffer:
+        return f"Skipping last {skip_last} minutes before close"
+
+    return ""
+
+
+@lru_cache(maxsize=8)
+def _hours_table(skip_first: int, skip_last: int) -> tuple[str, ...]:
+    """_hours_reason for every minute of the week, indexed by minute of week.
+
+    All session boundaries fall on whole minutes, so a per-minute table
+    gives the same answer as evaluating the rules at any second.
+    """
+    return tuple(
+        _hours_reason(weekday, time(minute // 60, minute % 60), skip_first, skip_last)
+        for weekday in range(7)
+        for minute in range(_MINUTES_PER_DAY)
+    )
 
 
 class RiskManager:
@@ -59,7 +120,13 @@ class RiskManager:
         self.apex_drawdown = apex_drawdown
         self.max_contracts = max_contracts
         self.open_positions: int = 0
-        self.events: list[RiskEvent] = []
+        self.events: deque[RiskEvent] = deque(maxlen=MAX_RISK_EVENTS)
+        # Rejections not yet handed to the journal; see drain_events
+        self._unrecorded: deque[RiskEvent] = deque(maxlen=MAX_UNRECORDED_EVENTS)
+        # Rejection reason per CT minute of the week ("" = tradable)
+        self._hours_reasons = _hours_table(
+            self.config["skip_first_minutes"], self.config["skip_last_minutes"]
+        )
 
     def evaluate(
         self,
@@ -114,64 +181,13 @@ class RiskManager:
         if self.config["always_use_stop_loss"] and signal.stop_loss is None:
             return self._reject(signal, "Stop-loss is required", "STOP_REQUIRED_CHECK")
 
-        stop_valid, stop_reason = validate_stop_placement(
-            entry_price=signal.entry_price,
-            stop_price=signal.stop_loss,
-            direction=signal.direction,
-            atr=atr,
-            max_atr_multiple=self.config["max_stop_distance_atr"],
-            tick_size=self.spec["tick_size"],
-        )
-        if not stop_valid:
-            return self._reject(signal, stop_reason, "STOP_VALIDATION_CHECK")
-
-        # 5. Check stop distance vs ATR limit
-        stop_ticks = calculate_stop_distance_ticks(
-            entry_price=signal.entry_price,
-            stop_price=signal.stop_loss,
-            direction=signal.direction,
-            tick_size=self.spec["tick_size"],
+        # 5-7. Stop placement, stop distance vs ATR, R:R and position size
+        trade_math = evaluate_trade_math(
+            signal, atr, self.account_equity, self.spec, self.config
         )
-        if not validate_stop_distance(
-            stop_distance_ticks=stop_ticks,
-            atr_ticks=atr / self.spec["tick_size"],
-            max_atr_multiple=self.config["max_stop_distance_atr"],
-        ):
-            return self._reject(
-                signal,
-                f"Stop distance ({stop_ticks} ticks) exceeds ATR limit",
-                "ATR_DISTANCE_CHECK",
-            )
-
-        # 6. Check risk:reward ratio
-        if signal.take_profit is not None:
-            rr_ratio = calculate_risk_reward_ratio(
-                entry_price=signal.entry_price,
-                stop_price=signal.stop_loss,
-                target_price=signal.take_profit,
-                direction=signal.direction,
-            )
-            if rr_ratio < self.config["min_risk_reward_ratio"]:
-                return self._reject(
-                    signal,
-                    f"R:R ratio ({rr_ratio:.2f}) below minimum ({self.config['min_risk_reward_ratio']})",
-                    "RR_RATIO_CHECK",
-                )
-
-        # 7. Calculate position size
-        position_size = calculate_position_size(
-            account_equity=self.account_equity,
-            stop_distance_ticks=stop_ticks,
-            tick_value=self.spec["tick_value"],
-            max_risk_pct=self.config["max_risk_per_trade"],
-            max_position_size=self.config["max_position_size"],
-        )
-        if position_size <= 0:
-            return self._reject(
-                signal,
-                "Position size calculated as 0 (insufficient equity or stop too wide)",
-                "POSITION_SIZE_CHECK",
-            )
+        if trade_math.check:
+            return self._reject(signal, trade_math.reason, trade_math.check)
+        position_size = trade_math.contracts
 
         # Clamp to Apex max contract limit
         if self.max_contracts is not None:
@@ -193,6 +209,18 @@ class RiskManager:
             signal=signal,
         )
 
+    def drain_events(self) -> list[RiskEvent]:
+        """Remove and return rejection events not yet drained.
+
+        Safe to call from a worker thread while signals are evaluated.
+        """
+        drained = []
+        while True:
+            try:
+                drained.append(self._unrecorded.popleft())
+            except IndexError:
+                return drained
+
     def record_position_opened(self) -> None:
         """Track that a new position has been opened."""
         self.open_positions += 1
@@ -205,52 +233,19 @@ class RiskManager:
     def update_equity(self, new_equity: float) -> None:
         """Update account equity."""
         self.account_equity = new_equity
-        self.daily_tracker.account_equity = new_equity
+        self.daily_tracker.set_equity(new_equity)
 
     def _check_trading_hours(self, now: datetime) -> tuple[bool, str]:
         """Check if current time is within trading hours."""
         if now.tzinfo is None:
-            now = CT.localize(now)
+            now = now.replace(tzinfo=CT)
         else:
             now = now.astimezone(CT)
 
-        current_time = now.time()
-        weekday = now.weekday()  # 0=Monday, 6=Sunday
-
-        # CME Globex: Sunday 5PM to Friday 4PM CT
-        # Saturday = completely closed
-        if weekday == 5:  # Saturday
-            return False, "Market closed (Saturday)"
-
-        # Sunday before 5PM
-        if weekday == 6 and current_time < time(17, 0):
-            return False, "Market closed (Sunday before 5PM CT)"
-
-        # Friday after 4PM
-        if weekday == 4 and current_time >= time(16, 0):
-            return False, "Market closed (Friday after 4PM CT)"
-
-        # Apex: block new entries 5 min before daily maintenance
-        if time(15, 55) <= current_time < time(16, 0) and weekday in range(5):
-            return False, "Approaching daily maintenance (3:55-4:00 PM CT)"
-
-        # Daily maintenance break: 4:00 PM - 5:00 PM CT (Mon-Thu)
-        if time(16, 0) <= current_time < time(17, 0) and weekday in (0, 1, 2, 3):
-            return False, "Daily maintenance break (4-5PM CT)"
-
-        # Skip first N minutes of session
-        skip_first = self.config["skip_first_minutes"]
-        session_start = time(17, skip_first)
-        if current_time >= time(17, 0) and current_time < session_start:
-            return False, f"Skipping first {skip_first} minutes of session"
-
-        # Skip last N minutes before close
-        skip_last = self.config["skip_last_minutes"]
-        close_buffer = time(15, 60 - skip_last)
-        if weekday == 4 and current_time >= close_buffer:
-            return False, f"Skipping last {skip_last} minutes before close"
-
-        return True, ""
+        reason = self._hours_reasons[
+            now.weekday() * _MINUTES_PER_DAY + now.hour * 60 + now.minute
+        ]
+        return not reason, reason
 
     def _check_trading_window(
         self, now: datetime, trading_window: object
@@ -259,9 +254,8 @@ class RiskManager:
 
         Window times are in ET (Eastern Time).
         """
-        ET = pytz.timezone("America/New_York")
         if now.tzinfo is None:
-            now_et = ET.localize(now)
+            now_et = now.replace(tzinfo=ET)
         else:
             now_et = now.astimezone(ET)
 
@@ -279,17 +273,22 @@ class RiskManager:
 
     def _reject(self, signal: Signal, reason: str, check_name: str) -> RiskResult:
         """Create a rejection result and log the event."""
-        self.events.append(RiskEvent(
+        event = RiskEvent(
             event_type=f"SIGNAL_REJECTED:{check_name}",
-            details={
-                "strategy": signal.strategy,
-                "direction": signal.direction.value,
-                "entry": signal.entry_price,
-                "stop": signal.stop_loss,
-                "reason": reason,
-            },
+            details=RejectDetails(
+                signal.strategy,
+                signal.direction.value,
+                signal.entry_price,
+                signal.stop_loss,
+                reason,
+            ),
             severity=Severity.WARNING,
-        ))
+        )
+        self.events.append(event)
+        if len(self._unrecorded) == self._unrecorded.maxlen:
+            # The oldest pending rejection is pushed out unjournaled
+            logger.warning("risk_event_dropped", pending=self._unrecorded.maxlen)
+        self._unrecorded.append(event)
         return RiskResult(
             decision=RiskDecision.REJECTED,
             position_size=0,
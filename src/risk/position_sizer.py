@@ -7,8 +7,6 @@ Always returns 0 (no trade) if risk limits would be exceeded.
 
 from __future__ import annotations
 
-import math
-
 from src.config import RISK_DEFAULTS, MES_SPEC
 
 
@@ -38,8 +36,9 @@ def calculate_position_size(
     if risk_per_contract <= 0:
         return 0
 
-    raw_size = max_risk_dollars / risk_per_contract
-    contracts = math.floor(raw_size)
+    # Floor division floors the exact quotient of the two floats, so
+    # rounding in a plain divide can never round a size up past the limit
+    contracts = int(max_risk_dollars // risk_per_contract)
 
     # Enforce hard cap
     contracts = min(contracts, max_position_size)
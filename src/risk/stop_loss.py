@@ -109,6 +109,36 @@ def update_trailing_stop(
     if atr <= 0:
         return current_stop, False
 
+    return trail_stop_by_distance(
+        entry_price=entry_price,
+        current_price=current_price,
+        current_stop=current_stop,
+        direction=direction,
+        trail_distance=atr * trailing_atr_multiple,
+        activation_r_multiple=activation_r_multiple,
+        tick_size=tick_size,
+    )
+
+
+def trail_stop_by_distance(
+    entry_price: float,
+    current_price: float,
+    current_stop: float,
+    direction: Direction,
+    trail_distance: float,
+    activation_r_multiple: float = 1.0,
+    tick_size: float = MES_SPEC["tick_size"],
+) -> tuple[float, bool]:
+    """Trailing stop update with a precomputed trail distance (price units).
+
+    Same rules as update_trailing_stop; callers that already hold
+    ATR * multiple avoid recomputing it per bar.
+
+    Returns (new_stop_price, trailing_activated).
+    """
+    if trail_distance <= 0:
+        return current_stop, False
+
     # Calculate 1R distance (from entry to initial stop)
     if direction == Direction.LONG:
         initial_risk = entry_price - current_stop
@@ -126,8 +156,6 @@ def update_trailing_stop(
         return current_stop, False
 
     # Trailing is active — calculate new trailing stop
-    trail_distance = atr * trailing_atr_multiple
-
     if direction == Direction.LONG:
         new_stop = current_price - trail_distance
         new_stop = _round_to_tick(new_stop, tick_size)
@@ -186,6 +214,10 @@ def validate_stop_placement(
 
 def _round_to_tick(price: float, tick_size: float) -> float:
     """Round a price to the nearest valid tick."""
+    if tick_size == 0.25:
+        # MES quarter tick: scaling by 4 and 0.25 is exact in binary, so
+        # this equals the general path without its cleanup round
+        return round(price * 4.0) * 0.25
     if tick_size <= 0:
         return price
     return round(round(price / tick_size) * tick_size, 10)
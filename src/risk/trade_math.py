@@ -0,0 +1,114 @@
+"""Fused stop, R:R and position-size math for signal evaluation.
+
+Computes the entry-to-stop distance once and derives every per-signal
+number RiskManager checks from it, stopping at the first failed check.
+Results and rejection messages match the standalone helpers in
+stop_loss and position_sizer.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from src.core.models import Direction, Signal
+
+
+@dataclass(slots=True)
+class RiskMath:
+    """Derived trade numbers, or the first check that failed.
+
+    check is empty when every check passed; otherwise it names the failed
+    check and reason holds the rejection message.
+    """
+
+    distance: float = 0.0
+    stop_ticks: float = 0.0
+    rr_ratio: float | None = None
+    contracts: int = 0
+    check: str = ""
+    reason: str = ""
+
+
+def evaluate_trade_math(
+    signal: Signal,
+    atr: float,
+    account_equity: float,
+    spec: dict,
+    config: dict,
+) -> RiskMath:
+    """Run the stop, ATR distance, R:R and sizing checks for a signal."""
+    entry = signal.entry_price
+    stop = signal.stop_loss
+    tick_size = spec["tick_size"]
+    max_atr_multiple = config["max_stop_distance_atr"]
+    math_ = RiskMath()
+
+    # Stop placement (validate_stop_placement)
+    if signal.direction == Direction.LONG:
+        if stop >= entry:
+            return _fail(math_, "STOP_VALIDATION_CHECK", "Long stop must be below entry price")
+        distance = entry - stop
+    else:
+        if stop <= entry:
+            return _fail(math_, "STOP_VALIDATION_CHECK", "Short stop must be above entry price")
+        distance = stop - entry
+    math_.distance = distance
+
+    if distance <= 0:
+        return _fail(math_, "STOP_VALIDATION_CHECK", "Stop distance must be positive")
+    if atr > 0:
+        max_distance = atr * max_atr_multiple
+        if distance > max_distance:
+            return _fail(math_, "STOP_VALIDATION_CHECK", (
+                f"Stop distance ({distance:.2f}) exceeds "
+                f"{max_atr_multiple}x ATR ({max_distance:.2f})"
+            ))
+    ticks = distance / tick_size
+    if abs(ticks - round(ticks)) > 0.001:
+        return _fail(
+            math_, "STOP_VALIDATION_CHECK",
+            f"Stop distance not aligned to tick size ({tick_size})",
+        )
+
+    # Stop distance vs ATR, in ticks (validate_stop_distance)
+    math_.stop_ticks = ticks
+    atr_ticks = atr / tick_size
+    if atr_ticks <= 0 or ticks > atr_ticks * max_atr_multiple:
+        return _fail(
+            math_, "ATR_DISTANCE_CHECK", f"Stop distance ({ticks} ticks) exceeds ATR limit"
+        )
+
+    # Risk:reward (calculate_risk_reward_ratio)
+    if signal.take_profit is not None:
+        if signal.direction == Direction.LONG:
+            reward = signal.take_profit - entry
+        else:
+            reward = entry - signal.take_profit
+        rr_ratio = reward / distance
+        math_.rr_ratio = rr_ratio
+        min_rr = config["min_risk_reward_ratio"]
+        if rr_ratio < min_rr:
+            return _fail(
+                math_, "RR_RATIO_CHECK",
+                f"R:R ratio ({rr_ratio:.2f}) below minimum ({min_rr})",
+            )
+
+    # Fixed-fractional size (calculate_position_size)
+    tick_value = spec["tick_value"]
+    max_risk_pct = config["max_risk_per_trade"]
+    if account_equity > 0 and tick_value > 0 and max_risk_pct > 0:
+        contracts = int(account_equity * max_risk_pct // (ticks * tick_value))
+        math_.contracts = max(min(contracts, config["max_position_size"]), 0)
+    if math_.contracts <= 0:
+        return _fail(
+            math_, "POSITION_SIZE_CHECK",
+            "Position size calculated as 0 (insufficient equity or stop too wide)",
+        )
+
+    return math_
+
+
+def _fail(math_: RiskMath, check: str, reason: str) -> RiskMath:
+    math_.check = check
+    math_.reason = reason
+    return math_
@@ -5,10 +5,16 @@ Jobs:
   - weekly_reset: Reset weekly tracking on Sunday 5PM CT
   - health_check: Run health checks every 60 seconds
   - equity_snapshot: Record equity every 5 minutes during market hours
+  - journal_flush: Commit batched journal rows every few seconds
+  - risk_event_flush: Journal buffered risk events every second
+  - signal_flush: Write buffered signal rows every second
+  - market_data_flush: Write buffered DuckDB rows every 60 seconds
+  - market_data_dedupe: Drop duplicate DuckDB bar rows during the 4PM CT halt
 """
 
 from __future__ import annotations
 
+import asyncio
 from typing import Callable
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -21,6 +27,15 @@ from src.risk.daily_limits import DailyLimitsTracker
 
 logger = get_logger("scheduler")
 
+# Missed runs (e.g. the event loop was blocked) fire once when it frees up
+# rather than in a burst, and never overlap a run still in progress
+_PERIODIC_JOB_OPTIONS = {"coalesce": True, "max_instances": 1, "misfire_grace_time": 30}
+# Session resets still run if the loop was stalled past 5PM, at most once
+_RESET_JOB_OPTIONS = {"coalesce": True, "max_instances": 1, "misfire_grace_time": 3600}
+# Halt-window maintenance (4:15PM) still runs after a stall, but only until
+# the 5PM reopen
+_HALT_JOB_OPTIONS = {"coalesce": True, "max_instances": 1, "misfire_grace_time": 2700}
+
 
 class TradingScheduler:
     """Manages scheduled jobs for the trading system.
@@ -36,6 +51,10 @@ class TradingScheduler:
         health_monitor: HealthMonitor | None = None,
         trade_recorder: TradeRecorder | None = None,
         equity_getter: Callable[[], list[EquitySnapshot]] | None = None,
+        market_data_flush: Callable[[], None] | None = None,
+        market_data_dedupe: Callable[[], None] | None = None,
+        risk_event_flush: Callable[[], None] | None = None,
+        signal_flush: Callable[[], None] | None = None,
     ) -> None:
         # Support both single and multi-account tracker modes
         if daily_trackers:
@@ -48,6 +67,10 @@ class TradingScheduler:
         self.health = health_monitor
         self.recorder = trade_recorder
         self.equity_getter = equity_getter
+        self.market_data_flush = market_data_flush
+        self.market_data_dedupe = market_data_dedupe
+        self.risk_event_flush = risk_event_flush
+        self.signal_flush = signal_flush
         self.scheduler = AsyncIOScheduler(timezone="America/Chicago")
 
     def start(self) -> None:
@@ -60,6 +83,7 @@ class TradingScheduler:
             minute=0,
             day_of_week="mon-fri",
             id="daily_reset",
+            **_RESET_JOB_OPTIONS,
         )
 
         # Weekly reset on Sunday at 5PM CT
@@ -70,6 +94,7 @@ class TradingScheduler:
             minute=0,
             day_of_week="sun",
             id="weekly_reset",
+            **_RESET_JOB_OPTIONS,
         )
 
         # Health check every 60 seconds
@@ -79,6 +104,7 @@ class TradingScheduler:
                 "interval",
                 seconds=60,
                 id="health_check",
+                **_PERIODIC_JOB_OPTIONS,
             )
 
         # Equity snapshot every 5 minutes
@@ -88,6 +114,59 @@ class TradingScheduler:
                 "interval",
                 minutes=5,
                 id="equity_snapshot",
+                **_PERIODIC_JOB_OPTIONS,
+            )
+
+        # Commit batched journal writes so none sit uncommitted for long
+        if self.recorder:
+            self.scheduler.add_job(
+                self._journal_flush_job,
+                "interval",
+                seconds=max(self.recorder.flush_interval_s, 1.0),
+                id="journal_flush",
+                **_PERIODIC_JOB_OPTIONS,
+            )
+
+        # Hand buffered risk events to the journal in batches
+        if self.risk_event_flush:
+            self.scheduler.add_job(
+                self._risk_event_flush_job,
+                "interval",
+                seconds=1,
+                id="risk_event_flush",
+                **_PERIODIC_JOB_OPTIONS,
+            )
+
+        # Write buffered signal rows in batches
+        if self.signal_flush:
+            self.scheduler.add_job(
+                self._signal_flush_job,
+                "interval",
+                seconds=1,
+                id="signal_flush",
+                **_PERIODIC_JOB_OPTIONS,
+            )
+
+        # Bound how long buffered market data rows wait (e.g. over a halt)
+        if self.market_data_flush:
+            self.scheduler.add_job(
+                self._market_data_flush_job,
+                "interval",
+                seconds=60,
+                id="market_data_flush",
+                **_PERIODIC_JOB_OPTIONS,
+            )
+
+        # Dedupe append-only market data while CME is halted (4-5PM CT)
+        if self.market_data_dedupe:
+            self.scheduler.add_job(
+                self._market_data_dedupe_job,
+                "cron",
+                hour=16,
+                minute=15,
+                day_of_week="mon-fri",
+                id="market_data_dedupe",
+                **_HALT_JOB_OPTIONS,
             )
 
         self.scheduler.start()
@@ -99,25 +178,31 @@ class TradingScheduler:
             self.scheduler.shutdown()
             logger.info("scheduler_stopped")
 
-    def _daily_reset_job(self) -> None:
-        """Reset daily P&L tracking and generate daily summary for all accounts."""
+    async def _daily_reset_job(self) -> None:
+        """Reset daily P&L tracking and generate daily summary for all accounts.
+
+        Runs on the event loop, so trackers are reset on the same thread
+        that updates them; journal I/O is sent to a worker thread.
+        """
         logger.info("daily_reset_running", accounts=list(self.daily_trackers.keys()))
 
         # Generate daily summaries before reset
         if self.recorder:
             for account_id in self.daily_trackers:
-                self.recorder.generate_daily_summary(account_id=account_id)
+                await asyncio.to_thread(
+                    self.recorder.generate_daily_summary, account_id=account_id
+                )
 
         # Reset all account trackers
         for account_id, tracker in self.daily_trackers.items():
             tracker.reset_daily()
 
         if self.recorder:
-            self.recorder.reset_daily()
+            await asyncio.to_thread(self.recorder.reset_daily)
 
         logger.info("daily_reset_complete")
 
-    def _weekly_reset_job(self) -> None:
+    async def _weekly_reset_job(self) -> None:
         """Reset weekly P&L tracking for all accounts."""
         logger.info("weekly_reset_running")
         for account_id, tracker in self.daily_trackers.items():
@@ -135,14 +220,62 @@ class TradingScheduler:
                 status=status.overall_status.value,
             )
 
-    def _equity_snapshot_job(self) -> None:
-        """Take equity snapshots and persist for all accounts."""
+    def _journal_flush_job(self) -> None:
+        """Commit any journal rows still waiting in the recorder's batch."""
+        if self.recorder:
+            self.recorder.flush()
+
+    def _risk_event_flush_job(self) -> None:
+        """Journal risk events buffered since the last run."""
+        if not self.risk_event_flush:
+            return
+        try:
+            self.risk_event_flush()
+        except Exception as e:
+            logger.error("risk_event_flush_failed", error=str(e))
+
+    def _signal_flush_job(self) -> None:
+        """Write signal rows buffered since the last run."""
+        if not self.signal_flush:
+            return
+        try:
+            self.signal_flush()
+        except Exception as e:
+            logger.error("signal_flush_failed", error=str(e))
+
+    def _market_data_flush_job(self) -> None:
+        """Write any market data rows still buffered for DuckDB."""
+        if not self.market_data_flush:
+            return
+        try:
+            self.market_data_flush()
+        except Exception as e:
+            logger.error("market_data_flush_failed", error=str(e))
+
+    def _market_data_dedupe_job(self) -> None:
+        """Remove duplicate market data rows left by append-only inserts."""
+        if not self.market_data_dedupe:
+            return
+        try:
+            self.market_data_dedupe()
+        except Exception as e:
+            logger.error("market_data_dedupe_failed", error=str(e))
+
+    async def _equity_snapshot_job(self) -> None:
+        """Take equity snapshots and persist for all accounts.
+
+        Snapshots are read on the event loop (in-memory account state);
+        the SQLite writes run in a worker thread.
+        """
         if not self.equity_getter or not self.recorder:
             return
 
         try:
             snapshots = self.equity_getter()
-            for snapshot in snapshots:
-                self.recorder.record_equity_snapshot(snapshot)
+            await asyncio.to_thread(self._record_equity_snapshots, snapshots)
         except Exception as e:
             logger.error("equity_snapshot_failed", error=str(e))
+
+    def _record_equity_snapshots(self, snapshots: list[EquitySnapshot]) -> None:
+        for snapshot in snapshots:
+            self.recorder.record_equity_snapshot(snapshot)
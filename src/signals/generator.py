@@ -6,14 +6,26 @@ RiskManager before it can be executed.
 
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import Executor
 from datetime import datetime
 
-from src.core.database import SignalRow, get_session
-from src.core.logging import get_logger
-from src.core.models import Bar, IndicatorSnapshot, RiskDecision, RiskResult, Signal
+from sqlalchemy import insert
+
+from src.core.database import SignalRow, configure_sqlite_engine
+from src.core.logging import get_logger, info_enabled
+from src.core.models import (
+    Bar,
+    Direction,
+    IndicatorSnapshot,
+    RiskDecision,
+    RiskResult,
+    Signal,
+)
 from src.indicators.regime import RegimeDetector
 from src.risk.manager import RiskManager
-from src.signals.scorer import score_confluence
+from src.signals.scorer import direction_confluence
 from src.strategies.base import BaseStrategy
 
 logger = get_logger("signals")
@@ -27,6 +39,13 @@ class SignalGenerator:
     In single-account mode, pass risk_manager to constructor.
     In multi-account mode, pass risk_manager=None and use generate_signals() +
     evaluate_signal_for_accounts() instead of on_bar().
+
+    Signal rows are buffered and written with one executemany INSERT every
+    ``flush_every`` rows or ``flush_interval_s`` seconds; call ``flush()``
+    to write them immediately and ``close()`` on shutdown. With an
+    ``executor`` (a single-worker pool), the writes run on its thread, so
+    bar processing never waits on the SQLite write lock; write errors are
+    logged there.
     """
 
     def __init__(
@@ -35,11 +54,25 @@ class SignalGenerator:
         risk_manager: RiskManager | None = None,
         sqlite_engine=None,
         regime_detector: RegimeDetector | None = None,
+        flush_every: int = 100,
+        flush_interval_s: float = 1.0,
+        executor: Executor | None = None,
     ) -> None:
         self.strategies = strategies
         self.risk_manager = risk_manager
         self.sqlite_engine = sqlite_engine
+        if sqlite_engine is not None:
+            configure_sqlite_engine(sqlite_engine)
         self.regime_detector = regime_detector
+        self.flush_every = flush_every
+        self.flush_interval_s = flush_interval_s
+        self.executor = executor
+
+        # Column values for SignalRow inserts
+        self._pending: list[dict] = []
+        self._last_flush = time.monotonic()
+        # flush() also runs from a scheduler worker thread
+        self._lock = threading.Lock()
 
     def generate_signals(
         self, bar: Bar, snapshot: IndicatorSnapshot | None
@@ -53,20 +86,22 @@ class SignalGenerator:
         if snapshot is None:
             return signals
 
+        scaling = self._regime_scaling()
+        if scaling <= 0.0:
+            return signals  # Trending regime: no strategy signals this bar
+
+        confluence_cache: dict[tuple[Direction, float], float | None] = {}
         for strategy in self.strategies:
             signal = strategy.on_bar(bar, snapshot)
             if signal is None:
                 continue
 
             # Post-hoc confluence scoring adjustment
-            confluence = score_confluence(signal, snapshot)
+            confluence = self._confluence(signal, snapshot, confluence_cache)
             signal.confidence = (signal.confidence + confluence) / 2
 
             # Regime scaling: reduce confidence in non-ranging markets
             if self.regime_detector is not None:
-                scaling = self.regime_detector.state.signal_scaling
-                if scaling <= 0.0:
-                    continue  # Skip signal entirely in trending regime
                 signal.confidence *= scaling
 
             signals.append(signal)
@@ -94,15 +129,16 @@ class SignalGenerator:
             result.account_id = account_id
             self._persist_signal(signal, result, account_id=account_id)
 
-            logger.info(
-                "signal_evaluated",
-                account=account_id,
-                strategy=signal.strategy,
-                direction=signal.direction.value,
-                confidence=f"{signal.confidence:.2f}",
-                decision=result.decision.value,
-                reason=result.reason,
-            )
+            if info_enabled():
+                logger.info(
+                    "signal_evaluated",
+                    account=account_id,
+                    strategy=signal.strategy,
+                    direction=signal.direction.value,
+                    confidence=f"{signal.confidence:.2f}",
+                    decision=result.decision.value,
+                    reason=result.reason,
+                )
 
             results[account_id] = result
 
@@ -121,20 +157,22 @@ class SignalGenerator:
         if snapshot is None or self.risk_manager is None:
             return results
 
+        scaling = self._regime_scaling()
+        if scaling <= 0.0:
+            return results  # Trending regime: no strategy signals this bar
+
+        confluence_cache: dict[tuple[Direction, float], float | None] = {}
         for strategy in self.strategies:
             signal = strategy.on_bar(bar, snapshot)
             if signal is None:
                 continue
 
             # Post-hoc confluence scoring adjustment
-            confluence = score_confluence(signal, snapshot)
+            confluence = self._confluence(signal, snapshot, confluence_cache)
             signal.confidence = (signal.confidence + confluence) / 2
 
             # Regime scaling: reduce confidence in non-ranging markets
             if self.regime_detector is not None:
-                scaling = self.regime_detector.state.signal_scaling
-                if scaling <= 0.0:
-                    continue  # Skip signal entirely in trending regime
                 signal.confidence *= scaling
 
             # Risk gate
@@ -149,47 +187,102 @@ class SignalGenerator:
             # Persist signal
             self._persist_signal(signal, risk_result)
 
-            logger.info(
-                "signal_processed",
-                strategy=strategy.name,
-                direction=signal.direction.value,
-                confidence=f"{signal.confidence:.2f}",
-                decision=risk_result.decision.value,
-                reason=risk_result.reason,
-            )
+            if info_enabled():
+                logger.info(
+                    "signal_processed",
+                    strategy=strategy.name,
+                    direction=signal.direction.value,
+                    confidence=f"{signal.confidence:.2f}",
+                    decision=risk_result.decision.value,
+                    reason=risk_result.reason,
+                )
 
             results.append(risk_result)
 
         return results
 
+    @staticmethod
+    def _confluence(
+        signal: Signal,
+        snapshot: IndicatorSnapshot,
+        cache: dict[tuple[Direction, float], float | None],
+    ) -> float:
+        """score_confluence, computed once per (direction, entry price) on a bar."""
+        key = (signal.direction, signal.entry_price)
+        try:
+            score = cache[key]
+        except KeyError:
+            score = cache[key] = direction_confluence(
+                signal.direction, signal.entry_price, snapshot
+            )
+        return signal.confidence if score is None else score
+
+    def _regime_scaling(self) -> float:
+        """Confidence scale for the current regime (1.0 without a detector)."""
+        if self.regime_detector is None:
+            return 1.0
+        return self.regime_detector.state.signal_scaling
+
+    def flush(self) -> None:
+        """Write buffered signal rows in a single transaction (on the executor, if set)."""
+        with self._lock:
+            rows, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+        if not rows:
+            return
+        if self.executor is not None:
+            self.executor.submit(self._write_rows, rows)
+        else:
+            self._write_rows(rows)
+
+    def close(self) -> None:
+        """Write any buffered signal rows."""
+        self.flush()
+
+    def _write_rows(self, rows: list[dict]) -> None:
+        """INSERT a batch with a Core executemany.
+
+        The rows are write-only journal data, so they skip the ORM unit of
+        work and identity map entirely.
+        """
+        try:
+            with self.sqlite_engine.begin() as conn:
+                conn.execute(insert(SignalRow), rows)
+        except Exception as e:
+            logger.error("signal_flush_failed", rows=len(rows), error=str(e))
+
     def _persist_signal(
         self, signal: Signal, result: RiskResult, account_id: str | None = None
     ) -> None:
-        """Store signal in SQLite for journal/analysis."""
+        """Buffer the signal for SQLite (journal/analysis)."""
         if self.sqlite_engine is None:
             return
         try:
-            session = get_session(self.sqlite_engine)
-            row = SignalRow(
-                account_id=account_id,
-                strategy=signal.strategy,
-                symbol=signal.symbol,
-                direction=signal.direction.value,
-                confidence=signal.confidence,
-                entry_price=signal.entry_price,
-                stop_loss=signal.stop_loss,
-                take_profit=signal.take_profit,
-                risk_approved=(result.decision == RiskDecision.APPROVED),
-                rejection_reason=(
+            row = {
+                "account_id": account_id,
+                "strategy": signal.strategy,
+                "symbol": signal.symbol,
+                "direction": signal.direction.value,
+                "confidence": signal.confidence,
+                "entry_price": signal.entry_price,
+                "stop_loss": signal.stop_loss,
+                "take_profit": signal.take_profit,
+                "risk_approved": result.decision == RiskDecision.APPROVED,
+                "rejection_reason": (
                     result.reason if result.decision == RiskDecision.REJECTED else None
                 ),
-                executed=False,
-                market_context=(
-                    signal.market_context.model_dump() if signal.market_context else None
-                ),
-            )
-            session.add(row)
-            session.commit()
-            session.close()
+                "executed": False,
+                "market_context": signal.market_context_dict(),
+            }
         except Exception as e:
             logger.error("signal_persist_failed", error=str(e))
+            return
+
+        with self._lock:
+            self._pending.append(row)
+            due = (
+                len(self._pending) >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval_s
+            )
+        if due:
+            self.flush()
@@ -11,27 +11,48 @@ these should be loaded from an external calendar API.
 
 from __future__ import annotations
 
+from bisect import bisect_right, insort
 from dataclasses import dataclass, field
 from datetime import datetime, time, timedelta
-
-import pytz
+from zoneinfo import ZoneInfo
 
 from src.core.logging import get_logger
 
 logger = get_logger("news_calendar")
 
-ET = pytz.timezone("America/New_York")
+ET = ZoneInfo("America/New_York")
+
+
+def _timestamp(dt: datetime) -> float:
+    """POSIX timestamp of a datetime; naive datetimes are taken as ET."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=ET)
+    return dt.timestamp()
 
 
 @dataclass
 class EconomicEvent:
-    """A scheduled economic event with blackout buffer."""
+    """A scheduled economic event with blackout buffer.
+
+    The blackout window is computed once, at construction, as POSIX
+    timestamps; create a new event rather than changing the buffers.
+    """
 
     name: str
     event_time: datetime  # ET timezone
     pre_buffer_minutes: int = 15
     post_buffer_minutes: int = 30
 
+    blackout_start_ts: float = field(init=False, repr=False)
+    blackout_end_ts: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.event_time.tzinfo is None:
+            self.event_time = self.event_time.replace(tzinfo=ET)
+        event_ts = self.event_time.timestamp()
+        self.blackout_start_ts = event_ts - self.pre_buffer_minutes * 60
+        self.blackout_end_ts = event_ts + self.post_buffer_minutes * 60
+
     @property
     def blackout_start(self) -> datetime:
         return self.event_time - timedelta(minutes=self.pre_buffer_minutes)
@@ -42,12 +63,11 @@ class EconomicEvent:
 
     def is_blocked(self, now: datetime) -> bool:
         """Check if the given time falls within this event's blackout window."""
-        if now.tzinfo is None:
-            now = ET.localize(now)
-        else:
-            now = now.astimezone(ET)
+        return self.is_blocked_at(_timestamp(now))
 
-        return self.blackout_start <= now <= self.blackout_end
+    def is_blocked_at(self, now_ts: float) -> bool:
+        """is_blocked for a POSIX timestamp."""
+        return self.blackout_start_ts <= now_ts <= self.blackout_end_ts
 
 
 # Standard event configurations
@@ -59,30 +79,36 @@ CPI_BUFFER = {"pre_buffer_minutes": 15, "post_buffer_minutes": 30}
 class NewsCalendar:
     """Manages economic events and checks for blackout periods.
 
-    Events can be added manually or loaded from external sources.
+    Events can be added manually or loaded from external sources. They are
+    kept sorted by blackout start so is_blocked can binary search them;
+    add events through the add_* methods rather than to ``events``.
     """
 
     def __init__(self, events: list[EconomicEvent] | None = None) -> None:
-        self.events: list[EconomicEvent] = events or []
+        self.events: list[EconomicEvent] = sorted(
+            events or [], key=lambda e: e.blackout_start_ts
+        )
+        self._reindex()
 
     def add_event(self, event: EconomicEvent) -> None:
-        self.events.append(event)
+        insort(self.events, event, key=lambda e: e.blackout_start_ts)
+        self._reindex()
 
     def add_fomc(self, event_time: datetime) -> None:
         """Add an FOMC decision event (2:00 PM ET typically)."""
-        self.events.append(EconomicEvent(
+        self.add_event(EconomicEvent(
             name="FOMC", event_time=event_time, **FOMC_BUFFER,
         ))
 
     def add_nfp(self, event_time: datetime) -> None:
         """Add an NFP report event (8:30 AM ET, first Friday of month)."""
-        self.events.append(EconomicEvent(
+        self.add_event(EconomicEvent(
             name="NFP", event_time=event_time, **NFP_BUFFER,
         ))
 
     def add_cpi(self, event_time: datetime) -> None:
         """Add a CPI report event (8:30 AM ET)."""
-        self.events.append(EconomicEvent(
+        self.add_event(EconomicEvent(
             name="CPI", event_time=event_time, **CPI_BUFFER,
         ))
 
@@ -91,43 +117,53 @@ class NewsCalendar:
 
         Returns (blocked, reason).
         """
-        if now.tzinfo is None:
-            now = ET.localize(now)
-        else:
-            now = now.astimezone(ET)
-
-        for event in self.events:
-            if event.is_blocked(now):
-                return True, (
-                    f"News blackout: {event.name} "
-                    f"({event.blackout_start.strftime('%H:%M')}-"
-                    f"{event.blackout_end.strftime('%H:%M')} ET)"
-                )
-
-        return False, ""
+        now_ts = _timestamp(now)
+        # Of the windows started by now, the one reaching furthest covers
+        # now if any does; two lookups however much the windows overlap
+        i = bisect_right(self._starts, now_ts) - 1
+        if i < 0 or self._max_ends[i] < now_ts:
+            return False, ""
+
+        event = self.events[self._max_end_owner[i]]
+        return True, (
+            f"News blackout: {event.name} "
+            f"({event.blackout_start.strftime('%H:%M')}-"
+            f"{event.blackout_end.strftime('%H:%M')} ET)"
+        )
 
     def next_event(self, now: datetime) -> EconomicEvent | None:
         """Find the next upcoming event after the given time."""
-        if now.tzinfo is None:
-            now = ET.localize(now)
-        else:
-            now = now.astimezone(ET)
-
-        future_events = [e for e in self.events if e.event_time > now]
+        now_ts = _timestamp(now)
+        future_events = [e for e in self.events if e.event_time.timestamp() > now_ts]
         if not future_events:
             return None
-        return min(future_events, key=lambda e: e.event_time)
+        return min(future_events, key=lambda e: e.event_time.timestamp())
 
     def clear_past_events(self, now: datetime) -> int:
         """Remove events whose blackout window has fully passed."""
-        if now.tzinfo is None:
-            now = ET.localize(now)
-        else:
-            now = now.astimezone(ET)
-
+        now_ts = _timestamp(now)
         before = len(self.events)
-        self.events = [e for e in self.events if e.blackout_end > now]
+        # Every event before the first running max end past now has ended
+        cut = bisect_right(self._max_ends, now_ts)
+        self.events = [e for e in self.events[cut:] if e.blackout_end_ts > now_ts]
+        self._reindex()
         removed = before - len(self.events)
         if removed:
             logger.info("cleared_past_events", count=removed)
         return removed
+
+    def _reindex(self) -> None:
+        """Rebuild the blackout starts and the running max of blackout ends.
+
+        _max_end_owner[i] is the index of the event with the latest end
+        among events[: i + 1].
+        """
+        self._starts = [e.blackout_start_ts for e in self.events]
+        self._max_ends = []
+        self._max_end_owner = []
+        best_end, owner = float("-inf"), -1
+        for i, event in enumerate(self.events):
+            if event.blackout_end_ts > best_end:
+                best_end, owner = event.blackout_end_ts, i
+            self._max_ends.append(best_end)
+            self._max_end_owner.append(owner)
@@ -8,66 +8,71 @@ from src.core.models import Direction, IndicatorSnapshot, Signal
 def score_confluence(signal: Signal, snapshot: IndicatorSnapshot) -> float:
     """Score a signal's confluence with market context. Returns 0.0-1.0.
 
-    Checks alignment of multiple indicators with the signal direction.
+    Falls back to the signal's own confidence when the snapshot has
+    nothing to score against.
     """
     if snapshot is None:
         return signal.confidence
 
+    score = direction_confluence(signal.direction, signal.entry_price, snapshot)
+    return signal.confidence if score is None else score
+
+
+def direction_confluence(
+    direction: Direction, price: float, snapshot: IndicatorSnapshot
+) -> float | None:
+    """Confluence of an entry at price in direction, or None if nothing to score.
+
+    Checks alignment of multiple indicators with the signal direction.
+    Each check is written for a LONG and multiplied through by the
+    direction sign (+1/-1), so SHORTs mirror it without a second branch.
+    Depends only on its arguments, so signals sharing them share a score.
+    """
+    # Enum members are singletons: an identity check, no str __eq__
+    long = direction is Direction.LONG
+    sign = 1.0 if long else -1.0
     score = 0.0
     factors = 0
 
     # BB position (is price near the expected band?)
     if snapshot.bb_lower is not None and snapshot.bb_upper is not None:
         factors += 1
-        if signal.direction == Direction.LONG and signal.entry_price <= snapshot.bb_lower:
-            score += 1.0
-        elif signal.direction == Direction.SHORT and signal.entry_price >= snapshot.bb_upper:
+        band = snapshot.bb_lower if long else snapshot.bb_upper
+        if sign * (band - price) >= 0:
             score += 1.0
-        elif snapshot.bb_middle is not None:
-            # Partial credit for being on the correct side of middle
-            if signal.direction == Direction.LONG and signal.entry_price < snapshot.bb_middle:
-                score += 0.5
-            elif signal.direction == Direction.SHORT and signal.entry_price > snapshot.bb_middle:
-                score += 0.5
-
-    # RSI alignment
+        elif snapshot.bb_middle is not None and sign * (snapshot.bb_middle - price) > 0:
+            score += 0.5  # Partial credit for being on the correct side of middle
+
+    # RSI alignment: oversold (<=35) / overbought (>=65), partial within 45/55
     if snapshot.rsi_14 is not None:
         factors += 1
-        if signal.direction == Direction.LONG and snapshot.rsi_14 <= 35:
-            score += 1.0
-        elif signal.direction == Direction.SHORT and snapshot.rsi_14 >= 65:
+        stretch = sign * (50.0 - snapshot.rsi_14)
+        if stretch >= 15.0:
             score += 1.0
-        elif signal.direction == Direction.LONG and snapshot.rsi_14 <= 45:
-            score += 0.5
-        elif signal.direction == Direction.SHORT and snapshot.rsi_14 >= 55:
+        elif stretch >= 5.0:
             score += 0.5
 
     # VWAP alignment
     if snapshot.vwap is not None:
         factors += 1
-        if signal.direction == Direction.LONG and signal.entry_price < snapshot.vwap:
-            score += 1.0
-        elif signal.direction == Direction.SHORT and signal.entry_price > snapshot.vwap:
+        if sign * (snapshot.vwap - price) > 0:
             score += 1.0
 
-    # EMA alignment (short EMA vs long EMA)
+    # EMA alignment (short EMA vs long EMA); oversold/overbought confirmation
     if snapshot.ema_9 is not None and snapshot.ema_21 is not None:
         factors += 1
-        if signal.direction == Direction.LONG and snapshot.ema_9 < snapshot.ema_21:
-            score += 1.0  # Oversold confirmation
-        elif signal.direction == Direction.SHORT and snapshot.ema_9 > snapshot.ema_21:
-            score += 1.0  # Overbought confirmation
+        if sign * (snapshot.ema_21 - snapshot.ema_9) > 0:
+            score += 1.0
 
-    # Keltner alignment
+    # Keltner alignment: inside the channel (not an extreme trend)
     if snapshot.keltner_lower is not None and snapshot.keltner_upper is not None:
         factors += 1
-        if signal.direction == Direction.LONG and signal.entry_price > snapshot.keltner_lower:
-            score += 1.0  # Inside channel (not extreme trend)
-        elif signal.direction == Direction.SHORT and signal.entry_price < snapshot.keltner_upper:
+        band = snapshot.keltner_lower if long else snapshot.keltner_upper
+        if sign * (price - band) > 0:
             score += 1.0
 
     if factors == 0:
-        return signal.confidence
+        return None
 
     return min(score / factors, 1.0)
 
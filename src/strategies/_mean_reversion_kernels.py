@@ -0,0 +1,108 @@
+"""Numba-compiled mean reversion entry and confidence predicates.
+
+Scalar float kernels behind MeanReversionStrategy's per-bar checks.
+Optional inputs (Keltner, VWAP, EMAs) are passed as NaN when missing;
+every comparison against NaN is False, which matches the None checks of
+the original code. numba is optional: without it these run as plain
+Python.
+"""
+
+from __future__ import annotations
+
+import math
+
+from src.core._njit import njit
+
+LONG = 1
+SHORT = -1
+
+
+@njit(cache=True)
+def check_entry(
+    close: float,
+    bb_lower: float,
+    bb_upper: float,
+    rsi: float,
+    keltner_lower: float,
+    keltner_upper: float,
+    vwap: float,
+    threshold: float,
+    rsi_oversold: float,
+    rsi_overbought: float,
+    require_keltner: bool,
+    require_vwap: bool,
+) -> int:
+    """LONG (1), SHORT (-1) or no entry (0)."""
+    # LONG: price at or below lower BB + RSI oversold
+    if (
+        close <= bb_lower + threshold
+        and rsi <= rsi_oversold
+        and (not require_keltner or math.isnan(keltner_lower) or close > keltner_lower)
+    ):
+        if require_vwap and close > vwap:
+            return 0
+        return LONG
+
+    # SHORT: price at or above upper BB + RSI overbought
+    if (
+        close >= bb_upper - threshold
+        and rsi >= rsi_overbought
+        and (not require_keltner or math.isnan(keltner_upper) or close < keltner_upper)
+    ):
+        if require_vwap and close < vwap:
+            return 0
+        return SHORT
+
+    return 0
+
+
+@njit(cache=True)
+def calc_confidence(
+    direction: int,
+    close: float,
+    bb_lower: float,
+    bb_upper: float,
+    rsi: float,
+    atr: float,
+    vwap: float,
+    ema_9: float,
+    ema_21: float,
+    rsi_oversold: float,
+    rsi_overbought: float,
+    rsi_extreme_oversold: float,
+    rsi_extreme_overbought: float,
+) -> float:
+    """Signal confidence in [0.5, 1.0] for an entry in the given direction."""
+    score = 0.5
+    long = direction == LONG
+
+    # RSI extremity bonus (up to +0.15)
+    if long:
+        if rsi <= rsi_extreme_oversold:
+            score += 0.15
+        elif rsi <= rsi_oversold - 5:
+            score += 0.08
+    else:
+        if rsi >= rsi_extreme_overbought:
+            score += 0.15
+        elif rsi >= rsi_overbought + 5:
+            score += 0.08
+
+    # VWAP alignment bonus (+0.10)
+    if (long and close < vwap) or (not long and close > vwap):
+        score += 0.10
+
+    # EMA alignment bonus (+0.10)
+    if (long and ema_9 < ema_21) or (not long and ema_9 > ema_21):
+        score += 0.10
+
+    # BB penetration depth bonus (+0.05-0.10)
+    penetration = 0.0
+    if atr != 0:
+        penetration = ((bb_lower - close) if long else (close - bb_upper)) / atr
+    if penetration > 0.5:
+        score += 0.10
+    elif penetration > 0.2:
+        score += 0.05
+
+    return min(score, 1.0)
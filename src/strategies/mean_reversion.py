@@ -9,8 +9,11 @@ The Keltner Channel filter prevents entries during extreme trends.
 
 from __future__ import annotations
 
+import math
+
 from src.core.models import Bar, Direction, IndicatorSnapshot, Signal
 from src.risk.stop_loss import calculate_initial_stop, calculate_take_profit
+from src.strategies._mean_reversion_kernels import LONG, SHORT, calc_confidence, check_entry
 from src.strategies.base import BaseStrategy, StrategyConfig, TradingWindow
 
 DEFAULT_PARAMS = {
@@ -43,6 +46,20 @@ class MeanReversionStrategy(BaseStrategy):
         super().__init__(config)
         self.validate_params()
 
+        # Bound once so the per-bar path skips the params dict lookups;
+        # params are fixed for the life of the strategy
+        p = self.params
+        self._bb_threshold = float(p["bb_touch_threshold"])
+        self._rsi_oversold = float(p["rsi_oversold"])
+        self._rsi_overbought = float(p["rsi_overbought"])
+        self._rsi_extreme_oversold = float(p["rsi_extreme_oversold"])
+        self._rsi_extreme_overbought = float(p["rsi_extreme_overbought"])
+        self._atr_stop_multiple = float(p["atr_stop_multiple"])
+        self._risk_reward_target = float(p["risk_reward_target"])
+        self._require_keltner = bool(p["require_keltner_filter"])
+        self._require_vwap = bool(p["require_vwap_alignment"])
+        self._min_atr = float(p["min_atr"])
+
     @property
     def params(self) -> dict:
         return self.config.params
@@ -52,7 +69,7 @@ class MeanReversionStrategy(BaseStrategy):
         if not self._indicators_ready(snapshot):
             return None
 
-        if snapshot.atr_14 < self.params["min_atr"]:
+        if snapshot.atr_14 < self._min_atr:
             return None
 
         direction = self._check_entry_conditions(bar, snapshot)
@@ -63,17 +80,27 @@ class MeanReversionStrategy(BaseStrategy):
         if confidence < self.config.min_confidence:
             return None
 
+        return self._build_signal(bar, snapshot, direction, confidence)
+
+    def _build_signal(
+        self,
+        bar: Bar,
+        snapshot: IndicatorSnapshot,
+        direction: Direction,
+        confidence: float,
+    ) -> Signal:
+        """Stops, targets and reason for a signal that passed its checks."""
         stop_price = calculate_initial_stop(
             entry_price=bar.close,
             direction=direction,
             atr=snapshot.atr_14,
-            atr_multiple=self.params["atr_stop_multiple"],
+            atr_multiple=self._atr_stop_multiple,
         )
         take_profit = calculate_take_profit(
             entry_price=bar.close,
             stop_price=stop_price,
             direction=direction,
-            risk_reward_ratio=self.params["risk_reward_target"],
+            risk_reward_ratio=self._risk_reward_target,
         )
 
         # Dynamic targets: BB middle (primary), VWAP (secondary)
@@ -143,109 +170,70 @@ class MeanReversionStrategy(BaseStrategy):
     def _check_entry_conditions(
         self, bar: Bar, snap: IndicatorSnapshot
     ) -> Direction | None:
-        threshold = self.params["bb_touch_threshold"]
-
-        # LONG: price at or below lower BB + RSI oversold
-        long_bb = bar.close <= snap.bb_lower + threshold
-        long_rsi = snap.rsi_14 <= self.params["rsi_oversold"]
-        long_keltner = (
-            not self.params["require_keltner_filter"]
-            or snap.keltner_lower is None
-            or bar.close > snap.keltner_lower
+        direction = check_entry(
+            bar.close,
+            snap.bb_lower,
+            snap.bb_upper,
+            snap.rsi_14,
+            _nan_if_none(snap.keltner_lower),
+            _nan_if_none(snap.keltner_upper),
+            _nan_if_none(snap.vwap),
+            self._bb_threshold,
+            self._rsi_oversold,
+            self._rsi_overbought,
+            self._require_keltner,
+            self._require_vwap,
         )
-
-        if long_bb and long_rsi and long_keltner:
-            if self.params["require_vwap_alignment"] and snap.vwap is not None:
-                if bar.close > snap.vwap:
-                    return None
+        if direction == LONG:
             return Direction.LONG
-
-        # SHORT: price at or above upper BB + RSI overbought
-        short_bb = bar.close >= snap.bb_upper - threshold
-        short_rsi = snap.rsi_14 >= self.params["rsi_overbought"]
-        short_keltner = (
-            not self.params["require_keltner_filter"]
-            or snap.keltner_upper is None
-            or bar.close < snap.keltner_upper
-        )
-
-        if short_bb and short_rsi and short_keltner:
-            if self.params["require_vwap_alignment"] and snap.vwap is not None:
-                if bar.close < snap.vwap:
-                    return None
+        if direction == SHORT:
             return Direction.SHORT
-
         return None
 
     def _calculate_confidence(
         self, bar: Bar, snap: IndicatorSnapshot, direction: Direction
     ) -> float:
-        score = 0.5
-
-        # RSI extremity bonus (up to +0.15)
-        if direction == Direction.LONG:
-            if snap.rsi_14 <= self.params["rsi_extreme_oversold"]:
-                score += 0.15
-            elif snap.rsi_14 <= self.params["rsi_oversold"] - 5:
-                score += 0.08
-        else:
-            if snap.rsi_14 >= self.params["rsi_extreme_overbought"]:
-                score += 0.15
-            elif snap.rsi_14 >= self.params["rsi_overbought"] + 5:
-                score += 0.08
-
-        # VWAP alignment bonus (+0.10)
-        if snap.vwap is not None:
-            if direction == Direction.LONG and bar.close < snap.vwap:
-                score += 0.10
-            elif direction == Direction.SHORT and bar.close > snap.vwap:
-                score += 0.10
-
-        # EMA alignment bonus (+0.10)
-        if snap.ema_9 is not None and snap.ema_21 is not None:
-            if direction == Direction.LONG and snap.ema_9 < snap.ema_21:
-                score += 0.10
-            elif direction == Direction.SHORT and snap.ema_9 > snap.ema_21:
-                score += 0.10
-
-        # BB penetration depth bonus (+0.05-0.10)
-        if direction == Direction.LONG and snap.bb_lower is not None:
-            penetration = (snap.bb_lower - bar.close) / snap.atr_14 if snap.atr_14 else 0
-            if penetration > 0.5:
-                score += 0.10
-            elif penetration > 0.2:
-                score += 0.05
-        elif direction == Direction.SHORT and snap.bb_upper is not None:
-            penetration = (bar.close - snap.bb_upper) / snap.atr_14 if snap.atr_14 else 0
-            if penetration > 0.5:
-                score += 0.10
-            elif penetration > 0.2:
-                score += 0.05
-
-        return min(score, 1.0)
+        return calc_confidence(
+            LONG if direction == Direction.LONG else SHORT,
+            bar.close,
+            snap.bb_lower,
+            snap.bb_upper,
+            snap.rsi_14,
+            snap.atr_14,
+            _nan_if_none(snap.vwap),
+            _nan_if_none(snap.ema_9),
+            _nan_if_none(snap.ema_21),
+            self._rsi_oversold,
+            self._rsi_overbought,
+            self._rsi_extreme_oversold,
+            self._rsi_extreme_overbought,
+        )
 
     def _indicators_ready(self, snap: IndicatorSnapshot) -> bool:
-        return all([
-            snap.bb_upper is not None,
-            snap.bb_lower is not None,
-            snap.bb_middle is not None,
-            snap.rsi_14 is not None,
-            snap.atr_14 is not None,
-        ])
+        return (
+            snap.bb_upper is not None
+            and snap.bb_lower is not None
+            and snap.bb_middle is not None
+            and snap.rsi_14 is not None
+            and snap.atr_14 is not None
+        )
 
     def _build_reason(
         self, bar: Bar, snap: IndicatorSnapshot, direction: Direction
     ) -> str:
-        parts = []
         if direction == Direction.LONG:
-            parts.append(f"BB lower touch (close={bar.close:.2f}, bb_lower={snap.bb_lower:.2f})")
-            parts.append(f"RSI oversold ({snap.rsi_14:.1f})")
+            reason = (
+                f"BB lower touch (close={bar.close:.2f}, bb_lower={snap.bb_lower:.2f})"
+                f" | RSI oversold ({snap.rsi_14:.1f})"
+            )
         else:
-            parts.append(f"BB upper touch (close={bar.close:.2f}, bb_upper={snap.bb_upper:.2f})")
-            parts.append(f"RSI overbought ({snap.rsi_14:.1f})")
+            reason = (
+                f"BB upper touch (close={bar.close:.2f}, bb_upper={snap.bb_upper:.2f})"
+                f" | RSI overbought ({snap.rsi_14:.1f})"
+            )
         if snap.vwap:
-            parts.append(f"VWAP={snap.vwap:.2f}")
-        return " | ".join(parts)
+            reason += f" | VWAP={snap.vwap:.2f}"
+        return reason
 
     def validate_params(self) -> bool:
         p = self.params
@@ -254,3 +242,7 @@ class MeanReversionStrategy(BaseStrategy):
         assert p["atr_stop_multiple"] > 0, "atr_stop_multiple must be positive"
         assert p["risk_reward_target"] > 0, "risk_reward_target must be positive"
         return True
+
+
+def _nan_if_none(value: float | None) -> float:
+    return math.nan if value is None else value
@@ -0,0 +1,80 @@
+"""Shared backtesting fixtures."""
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.backtesting.engine import BacktestEngine
+from src.core.models import Bar
+from src.strategies.mean_reversion import MeanReversionStrategy
+
+
+def make_synthetic_bars(
+    count: int = 100,
+    start_price: float = 5000.0,
+    volatility: float = 2.0,
+    seed: int = 42,
+) -> list[Bar]:
+    """Generate synthetic 1-minute bars with a seeded random walk.
+
+    The walk and the wick noise are drawn as whole arrays; only the Bar
+    objects are built in Python.
+    """
+    rng = np.random.default_rng(seed)
+    changes = rng.normal(0.0, volatility, count)
+    high_noise = np.abs(rng.normal(0.0, 1.0, count))
+    low_noise = np.abs(rng.normal(0.0, 1.0, count))
+    volumes = rng.integers(100, 5001, count)
+
+    close = start_price + np.cumsum(changes)
+    open_ = close - changes / 2
+    high = close + high_noise
+    low = close - low_noise
+
+    base_time = datetime(2024, 1, 15, 9, 30, tzinfo=UTC)
+    return [
+        Bar(
+            timestamp=base_time + timedelta(minutes=i),
+            open=o,
+            high=h,
+            low=lo,
+            close=c,
+            volume=v,
+        )
+        for i, (o, h, lo, c, v) in enumerate(zip(
+            open_.tolist(), high.tolist(), low.tolist(), close.tolist(), volumes.tolist(),
+        ))
+    ]
+
+
+@pytest.fixture(scope="session")
+def make_bars():
+    """make_synthetic_bars, memoized for the session by its arguments.
+
+    Equal arguments return the same list; tests must not mutate it.
+    """
+    cache: dict[tuple, list[Bar]] = {}
+
+    def _make_bars(
+        count: int = 100,
+        start_price: float = 5000.0,
+        volatility: float = 2.0,
+        seed: int = 42,
+    ) -> list[Bar]:
+        key = (count, start_price, volatility, seed)
+        if key not in cache:
+            cache[key] = make_synthetic_bars(count, start_price, volatility, seed)
+        return cache[key]
+
+    return _make_bars
+
+
+@pytest.fixture
+def engine():
+    """A BacktestEngine running the default MeanReversionStrategy.
+
+    Built fresh per test: construction costs a few microseconds, less
+    than copying a shared template, and the strategy carries state.
+    """
+    return BacktestEngine(strategies=[MeanReversionStrategy()], starting_equity=10000.0)
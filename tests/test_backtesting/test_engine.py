@@ -10,31 +10,6 @@ from src.core.models import Bar, Direction
 from src.strategies.mean_reversion import MeanReversionStrategy
 
 
-def _make_bars(count=100, start_price=5000.0, volatility=2.0) -> list[Bar]:
-    """Generate synthetic bars with random walk."""
-    random.seed(42)
-    bars = []
-    price = start_price
-    base_time = datetime(2024, 1, 15, 9, 30, tzinfo=UTC)
-
-    for i in range(count):
-        change = random.gauss(0, volatility)
-        price += change
-        high = price + abs(random.gauss(0, 1))
-        low = price - abs(random.gauss(0, 1))
-        bar = Bar(
-            timestamp=base_time + timedelta(minutes=i),
-            open=price - change / 2,
-            high=max(high, price),
-            low=min(low, price),
-            close=price,
-            volume=random.randint(100, 5000),
-        )
-        bars.append(bar)
-
-    return bars
-
-
 def _make_trending_down_bars(count=50, start_price=5020.0) -> list[Bar]:
     """Generate bars that trend down to trigger long entries (BB lower touch)."""
     bars = []
@@ -64,52 +39,38 @@ def _make_trending_down_bars(count=50, start_price=5020.0) -> list[Bar]:
 
 
 class TestBacktestEngine:
-    def test_empty_bars(self):
-        strategy = MeanReversionStrategy()
-        engine = BacktestEngine(strategies=[strategy], starting_equity=10000.0)
+    def test_empty_bars(self, engine):
         results = engine.run([])
         assert results.bars_processed == 0
         assert results.ending_equity == 10000.0
 
-    def test_basic_backtest_runs(self):
+    def test_basic_backtest_runs(self, engine, make_bars):
         """Engine should process bars without crashing."""
-        random.seed(42)
-        strategy = MeanReversionStrategy()
-        engine = BacktestEngine(strategies=[strategy], starting_equity=10000.0)
-        bars = _make_bars(200, volatility=3.0)
+        bars = make_bars(200, volatility=3.0)
         results = engine.run(bars)
 
         assert results.bars_processed == 200
         assert results.metrics is not None
         assert results.strategy_name == "mean_reversion"
 
-    def test_results_have_equity_curve(self):
-        random.seed(42)
-        strategy = MeanReversionStrategy()
-        engine = BacktestEngine(strategies=[strategy], starting_equity=10000.0)
-        bars = _make_bars(200, volatility=3.0)
+    def test_results_have_equity_curve(self, engine, make_bars):
+        bars = make_bars(200, volatility=3.0)
         results = engine.run(bars)
 
         # Equity curve may be empty if no trades triggered
         assert isinstance(results.equity_curve, list)
 
-    def test_signals_counted(self):
-        random.seed(42)
-        strategy = MeanReversionStrategy()
-        engine = BacktestEngine(strategies=[strategy], starting_equity=10000.0)
-        bars = _make_bars(200, volatility=3.0)
+    def test_signals_counted(self, engine, make_bars):
+        bars = make_bars(200, volatility=3.0)
         results = engine.run(bars)
 
         # signals_generated >= 0 (may be 0 if no conditions met)
         assert results.signals_generated >= 0
         assert results.signals_rejected >= 0
 
-    def test_no_open_positions_at_end(self):
+    def test_no_open_positions_at_end(self, engine, make_bars):
         """All positions should be closed at the end of backtest."""
-        random.seed(42)
-        strategy = MeanReversionStrategy()
-        engine = BacktestEngine(strategies=[strategy], starting_equity=10000.0)
-        bars = _make_bars(200, volatility=3.0)
+        bars = make_bars(200, volatility=3.0)
         results = engine.run(bars)
 
         # All trades in results should be closed
@@ -117,37 +78,33 @@ class TestBacktestEngine:
         for trade in results.trades:
             assert trade.status == TradeStatus.CLOSED
 
-    def test_summary_string(self):
-        random.seed(42)
-        strategy = MeanReversionStrategy()
-        engine = BacktestEngine(strategies=[strategy], starting_equity=10000.0)
-        bars = _make_bars(100)
+    def test_summary_string(self, engine, make_bars):
+        bars = make_bars(100)
         results = engine.run(bars)
         summary = results.summary()
         assert "mean_reversion" in summary
         assert "100" in summary  # bars processed
 
-    def test_custom_risk_config(self):
+    def test_custom_risk_config(self, make_bars):
         strategy = MeanReversionStrategy()
         engine = BacktestEngine(
             strategies=[strategy],
             starting_equity=10000.0,
             risk_config={"max_daily_trades": 2},
         )
-        bars = _make_bars(100)
+        bars = make_bars(100)
         results = engine.run(bars)
         assert results.bars_processed == 100
 
-    def test_next_bar_fill(self):
+    def test_next_bar_fill(self, make_bars):
         """Signals should fill at the next bar's open, not the signal bar's close."""
-        random.seed(12345)
         strategy = MeanReversionStrategy()
         engine = BacktestEngine(
             strategies=[strategy],
             starting_equity=10000.0,
         )
         # Use enough bars with high volatility to generate signals
-        bars = _make_bars(500, volatility=4.0)
+        bars = make_bars(500, volatility=4.0, seed=12345)
         results = engine.run(bars)
 
         # If any trades were generated, entries should be at bar open prices
@@ -155,7 +112,7 @@ class TestBacktestEngine:
         # we just verify the engine runs without error and processes all bars.
         assert results.bars_processed == 500
 
-    def test_cooldown_disabled_in_backtest(self):
+    def test_cooldown_disabled_in_backtest(self, make_bars):
         """Backtest should disable cooldown_after_loss to avoid wall-clock bias."""
         strategy = MeanReversionStrategy()
         engine = BacktestEngine(
@@ -163,7 +120,7 @@ class TestBacktestEngine:
             starting_equity=10000.0,
             risk_config={"cooldown_after_loss": 300},  # Would block in real-time
         )
-        bars = _make_bars(200, volatility=3.0)
+        bars = make_bars(200, volatility=3.0)
         results = engine.run(bars)
         # Engine should override cooldown to 0 and still process all bars
         assert results.bars_processed == 200
@@ -1,8 +1,5 @@
 """Tests for Optuna parameter optimizer."""
 
-import random
-from datetime import UTC, datetime, timedelta
-
 import pytest
 
 from src.backtesting.optimizer import (
@@ -12,28 +9,6 @@ from src.backtesting.optimizer import (
     composite_objective,
 )
 from src.backtesting.results import BacktestResults
-from src.core.models import Bar
-
-
-def _make_bars(count=500, start_price=5000.0, volatility=2.5, seed=42) -> list[Bar]:
-    random.seed(seed)
-    bars = []
-    price = start_price
-    base_time = datetime(2024, 1, 15, 9, 30, tzinfo=UTC)
-    for i in range(count):
-        change = random.gauss(0, volatility)
-        price += change
-        high = price + abs(random.gauss(0, 1))
-        low = price - abs(random.gauss(0, 1))
-        bars.append(Bar(
-            timestamp=base_time + timedelta(minutes=i),
-            open=price - change / 2,
-            high=max(high, price),
-            low=min(low, price),
-            close=price,
-            volume=random.randint(100, 5000),
-        ))
-    return bars
 
 
 class TestCompositeObjective:
@@ -65,24 +40,35 @@ class TestCompositeObjective:
             assert low < high, f"{name} has invalid range"
 
 
+@pytest.fixture(scope="class")
+def optimize_result(make_bars):
+    """One 5-trial search, shared by the TestOptunaOptimizer tests."""
+    bars = make_bars(300, volatility=3.0)
+    opt = OptunaOptimizer(bars=bars, n_trials=5, starting_equity=10000.0)
+    return opt.optimize()
+
+
 class TestOptunaOptimizer:
-    def test_creates_optimizer(self):
-        bars = _make_bars(100)
+    def test_creates_optimizer(self, make_bars):
+        bars = make_bars(100, volatility=2.5)
         opt = OptunaOptimizer(bars=bars, n_trials=5)
         assert opt.n_trials == 5
 
-    def test_optimize_runs_without_error(self):
+    def test_optimize_runs_without_error(self, optimize_result):
         """Smoke test: run a few trials."""
-        bars = _make_bars(300, volatility=3.0)
-        opt = OptunaOptimizer(bars=bars, n_trials=5, starting_equity=10000.0)
-        best_params, best_score = opt.optimize()
+        best_params, best_score = optimize_result
         assert isinstance(best_params, dict)
         assert isinstance(best_score, float)
         assert len(best_params) > 0
 
-    def test_best_params_have_expected_keys(self):
-        bars = _make_bars(300, volatility=3.0)
-        opt = OptunaOptimizer(bars=bars, n_trials=5)
-        best_params, _ = opt.optimize()
+    def test_best_params_have_expected_keys(self, optimize_result):
+        best_params, _ = optimize_result
         for key in PARAM_SPACE:
             assert key in best_params
+
+    def test_parallel_trials(self, make_bars):
+        bars = make_bars(300, volatility=3.0)
+        opt = OptunaOptimizer(bars=bars, n_trials=4, starting_equity=10000.0, n_jobs=2)
+        best_params, best_score = opt.optimize()
+        assert set(best_params) == set(PARAM_SPACE)
+        assert isinstance(best_score, float)
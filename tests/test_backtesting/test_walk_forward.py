@@ -1,33 +1,8 @@
 """Tests for walk-forward analysis."""
 
-import random
-from datetime import UTC, datetime, timedelta
-
 import pytest
 
 from src.backtesting.walk_forward import WalkForwardAnalyzer, WalkForwardReport
-from src.core.models import Bar
-
-
-def _make_bars(count=500, start_price=5000.0, volatility=2.5, seed=42) -> list[Bar]:
-    random.seed(seed)
-    bars = []
-    price = start_price
-    base_time = datetime(2024, 1, 15, 9, 30, tzinfo=UTC)
-    for i in range(count):
-        change = random.gauss(0, volatility)
-        price += change
-        high = price + abs(random.gauss(0, 1))
-        low = price - abs(random.gauss(0, 1))
-        bars.append(Bar(
-            timestamp=base_time + timedelta(minutes=i),
-            open=price - change / 2,
-            high=max(high, price),
-            low=min(low, price),
-            close=price,
-            volume=random.randint(100, 5000),
-        ))
-    return bars
 
 
 class TestWalkForwardReport:
@@ -44,26 +19,26 @@ class TestWalkForwardReport:
 
 
 class TestWalkForwardAnalyzer:
-    def test_creates_analyzer(self):
-        bars = _make_bars(500)
+    def test_creates_analyzer(self, make_bars):
+        bars = make_bars(500, volatility=2.5)
         analyzer = WalkForwardAnalyzer(
             bars=bars, is_bars=200, oos_bars=100, trials_per_fold=3,
         )
         assert analyzer.is_bars == 200
         assert analyzer.oos_bars == 100
 
-    def test_insufficient_bars_returns_empty(self):
+    def test_insufficient_bars_returns_empty(self, make_bars):
         """Not enough bars for even one fold should return empty report."""
-        bars = _make_bars(100)
+        bars = make_bars(100, volatility=2.5)
         analyzer = WalkForwardAnalyzer(
             bars=bars, is_bars=200, oos_bars=100, trials_per_fold=3,
         )
         report = analyzer.run()
         assert len(report.folds) == 0
 
-    def test_single_fold_runs(self):
+    def test_single_fold_runs(self, make_bars):
         """Enough bars for exactly one fold."""
-        bars = _make_bars(600, volatility=3.0)
+        bars = make_bars(600, volatility=3.0)
         analyzer = WalkForwardAnalyzer(
             bars=bars, is_bars=300, oos_bars=200, trials_per_fold=3,
         )
@@ -72,13 +47,23 @@ class TestWalkForwardAnalyzer:
         assert report.folds[0].is_bars == 300
         assert report.folds[0].oos_bars == 200
 
-    def test_multiple_folds(self):
+    def test_multiple_folds(self, make_bars):
         """Enough bars for multiple folds."""
-        bars = _make_bars(1000, volatility=3.0)
+        bars = make_bars(1000, volatility=3.0)
         analyzer = WalkForwardAnalyzer(
-            bars=bars, is_bars=300, oos_bars=200, trials_per_fold=3,
+            bars=bars, is_bars=300, oos_bars=200, trials_per_fold=3, n_jobs=2,
         )
         report = analyzer.run()
         # With 1000 bars, IS=300, OOS=200, fold_size=500
         # First fold: 0-500, second fold: 200-700, third: 400-900, fourth: 600-1000
         assert len(report.folds) >= 2
+
+    def test_parallel_folds_match_serial(self, make_bars):
+        bars = make_bars(700, volatility=3.0)
+        kwargs = dict(bars=bars, is_bars=300, oos_bars=200, trials_per_fold=3)
+        serial = WalkForwardAnalyzer(**kwargs).run()
+        parallel = WalkForwardAnalyzer(**kwargs, n_jobs=2).run()
+
+        assert [f.fold_number for f in parallel.folds] == [1, 2]
+        assert [f.best_params for f in parallel.folds] == [f.best_params for f in serial.folds]
+        assert parallel.total_oos_pnl == serial.total_oos_pnl
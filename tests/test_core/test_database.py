@@ -0,0 +1,63 @@
+"""Tests for DuckDB batch writes."""
+
+from datetime import datetime
+
+import duckdb
+import pytest
+
+from src.core.database import BARS_5M_COLUMNS, DuckDBBatchWriter
+
+_T0 = datetime(2024, 1, 2, 14, 30)
+_T1 = datetime(2024, 1, 2, 14, 35)
+
+
+def _row(ts: datetime, close: float) -> tuple:
+    return (ts, "MES", 5000.0, 5001.0, 4999.0, close, 10, None)
+
+
+@pytest.fixture
+def keyed_conn():
+    """bars_5m as created by older versions, with a primary key."""
+    conn = duckdb.connect(":memory:")
+    conn.execute("""
+        CREATE TABLE bars_5m (
+            timestamp TIMESTAMP NOT NULL,
+            symbol VARCHAR NOT NULL,
+            open DOUBLE, high DOUBLE, low DOUBLE, close DOUBLE,
+            volume BIGINT, vwap DOUBLE,
+            PRIMARY KEY (timestamp, symbol)
+        )
+    """)
+    yield conn
+    conn.close()
+
+
+class TestUpsertFallback:
+    def test_existing_key_replaced(self, keyed_conn):
+        keyed_conn.execute(
+            "INSERT INTO bars_5m VALUES (?, ?, ?, ?, ?, ?, ?, ?)", _row(_T0, 5000.0)
+        )
+        writer = DuckDBBatchWriter(keyed_conn, "bars_5m", BARS_5M_COLUMNS)
+        writer.add(_row(_T0, 5002.0))
+        writer.add(_row(_T1, 5003.0))
+        assert writer.flush() == 2
+
+        rows = keyed_conn.execute(
+            "SELECT timestamp, close FROM bars_5m ORDER BY timestamp"
+        ).fetchall()
+        assert rows == [(_T0, 5002.0), (_T1, 5003.0)]
+
+    def test_key_repeated_in_batch_keeps_last_row(self, keyed_conn):
+        keyed_conn.execute(
+            "INSERT INTO bars_5m VALUES (?, ?, ?, ?, ?, ?, ?, ?)", _row(_T0, 5000.0)
+        )
+        writer = DuckDBBatchWriter(keyed_conn, "bars_5m", BARS_5M_COLUMNS)
+        writer.add(_row(_T0, 5001.0))
+        writer.add(_row(_T1, 5003.0))
+        writer.add(_row(_T0, 5002.0))
+        writer.flush()
+
+        rows = keyed_conn.execute(
+            "SELECT timestamp, close FROM bars_5m ORDER BY timestamp"
+        ).fetchall()
+        assert rows == [(_T0, 5002.0), (_T1, 5003.0)]
@@ -0,0 +1,35 @@
+"""Tests for logging setup helpers."""
+
+import pytest
+
+from src.core.logging import debug_enabled, info_enabled, setup_logging
+
+
+@pytest.fixture(autouse=True)
+def _restore_logging():
+    yield
+    setup_logging()
+
+
+class TestInfoEnabled:
+    def test_enabled_at_info(self):
+        setup_logging(level="INFO")
+        assert info_enabled() is True
+
+    def test_disabled_at_warning(self):
+        setup_logging(level="WARNING")
+        assert info_enabled() is False
+
+    def test_level_is_case_insensitive(self):
+        setup_logging(level="debug")
+        assert info_enabled() is True
+
+
+class TestDebugEnabled:
+    def test_disabled_at_info(self):
+        setup_logging(level="INFO")
+        assert debug_enabled() is False
+
+    def test_enabled_at_debug(self):
+        setup_logging(level="DEBUG")
+        assert debug_enabled() is True
@@ -164,6 +164,74 @@ class TestOnBar:
         order_manager.on_bar(bar)
         assert risk_manager.open_positions == 0
 
+    def test_multi_lot_scales_out_at_target(self, order_manager):
+        order_manager.process_signals([_make_risk_result(Direction.LONG, 5000.0, qty=2)])
+        position = order_manager.open_positions[0]
+
+        closed = order_manager.on_bar(_make_bar(close=5008.0))
+        assert closed == []
+        assert position.scale_out_done
+        assert position.trade.quantity == 1
+        assert position.trailing_stop == 5000.0  # Breakeven
+
+        # Remaining lot exits at the same target on the next bar
+        closed = order_manager.on_bar(_make_bar(close=5008.5))
+        assert len(closed) == 1
+        assert order_manager.open_positions == []
+
+
+class TestTrailingStop:
+    def test_trailing_stop_tracks_new_highs(self, order_manager):
+        # Long at 5000, stop 4996 (1R = 4 points), ATR 3.0 -> 4.5 point trail
+        order_manager.process_signals([_make_risk_result(Direction.LONG, 5000.0)])
+        position = order_manager.open_positions[0]
+
+        order_manager.on_bar(_make_bar(close=5006.0))
+        assert position.trailing_activated
+        assert position.trailing_stop == 5001.5
+        assert position.high_water == 5006.0
+
+    def test_pullback_does_not_touch_trailing_stop(self, order_manager):
+        order_manager.process_signals([_make_risk_result(Direction.LONG, 5000.0)])
+        position = order_manager.open_positions[0]
+
+        order_manager.on_bar(_make_bar(close=5006.0))
+        order_manager.on_bar(_make_bar(close=5004.0))
+        assert position.trailing_stop == 5001.5
+        assert position.high_water == 5006.0
+
+    def test_short_tracks_low_water(self, order_manager):
+        order_manager.process_signals([_make_risk_result(Direction.SHORT, 5000.0)])
+        position = order_manager.open_positions[0]
+
+        order_manager.on_bar(_make_bar(close=4994.0))
+        assert position.low_water == 4994.0
+        assert position.trailing_stop == 4998.5
+
+
+class TestSetAtr:
+    def test_set_atr_updates_trail_offset(self, order_manager):
+        order_manager.set_atr(2.0)
+        assert order_manager.atr_for_trailing == 2.0
+        assert order_manager._trail_offset == 3.0
+
+    def test_invalid_atr_ignored(self, order_manager):
+        order_manager.set_atr(None)
+        order_manager.set_atr(0.0)
+        assert order_manager.atr_for_trailing == 3.0
+
+    def test_contracting_atr_tightens_without_new_high(self, order_manager):
+        order_manager.process_signals([_make_risk_result(Direction.LONG, 5000.0)])
+        position = order_manager.open_positions[0]
+
+        order_manager.on_bar(_make_bar(close=5004.25))
+        assert position.trailing_stop == 4999.75
+
+        # Pullback bar, but ATR halved: trail distance drops to 2.25
+        order_manager.set_atr(1.5)
+        order_manager.on_bar(_make_bar(close=5004.0))
+        assert position.trailing_stop == 5001.75
+
 
 class TestForceClose:
     def test_force_close_all(self, order_manager):
@@ -196,6 +264,45 @@ class TestUnrealizedPnl:
     def test_unrealized_pnl_zero_no_positions(self, order_manager):
         assert order_manager.get_total_unrealized_pnl() == 0.0
 
+    def test_running_total_matches_positions(self, order_manager):
+        order_manager.process_signals([
+            _make_risk_result(Direction.LONG, 5000.0),
+            _make_risk_result(Direction.SHORT, 5000.0),
+        ])
+        for close in (5001.0, 5002.5, 4999.0):
+            order_manager.on_bar(_make_bar(close=close))
+            expected = sum(p.unrealized_pnl for p in order_manager.open_positions)
+            assert order_manager.get_total_unrealized_pnl() == pytest.approx(expected)
+
+    def test_running_total_drops_closed_position(self, order_manager):
+        order_manager.process_signals([
+            _make_risk_result(Direction.LONG, 5000.0),
+            _make_risk_result(Direction.SHORT, 5000.0),
+        ])
+        order_manager.on_bar(_make_bar(close=5003.0))
+
+        # Long stops out at 4996; short (stop 5004) stays open
+        order_manager.on_bar(_make_bar(close=4995.0))
+        assert len(order_manager.open_positions) == 1
+        remaining = order_manager.open_positions[0]
+        assert order_manager.get_total_unrealized_pnl() == pytest.approx(
+            remaining.unrealized_pnl
+        )
+
+    def test_on_bar_updates_daily_tracker(self, order_manager, risk_manager):
+        order_manager.process_signals([_make_risk_result(Direction.LONG, 5000.0)])
+        order_manager.on_bar(_make_bar(close=5002.0))
+        assert risk_manager.daily_tracker.unrealized_pnl == pytest.approx(
+            order_manager.get_total_unrealized_pnl()
+        )
+        assert risk_manager.daily_tracker.unrealized_pnl > 0
+
+    def test_running_total_reset_on_force_close(self, order_manager):
+        order_manager.process_signals([_make_risk_result(Direction.LONG, 5000.0)])
+        order_manager.on_bar(_make_bar(close=5003.0))
+        order_manager.force_close_all(5003.0)
+        assert order_manager.get_total_unrealized_pnl() == 0.0
+
 
 class TestWithRecorder:
     def test_closed_trades_recorded(self, executor, risk_manager):
@@ -3,10 +3,11 @@
 import math
 from datetime import datetime, timedelta
 
+import pandas as pd
 import pytest
 
 from src.core.models import Bar
-from src.indicators.calculator import IndicatorCalculator
+from src.indicators.calculator import IndicatorCalculator, _kahan_add, _resolve_columns
 
 
 def _make_bars(prices: list[float], base_volume: int = 1000) -> list[Bar]:
@@ -236,3 +237,66 @@ class TestIndicatorCalculator:
 
         assert result is not None
         assert result.timestamp == bars[-1].timestamp
+
+    def test_band_columns_resolved_once(self, calc):
+        prices = [5000.0 + (i % 10) * 0.5 for i in range(50)]
+        for bar in _make_bars(prices):
+            calc.update(bar)
+
+        assert calc._bb_cols is not None
+        assert calc._bb_cols[0].startswith("BBL")
+        assert calc._kc_cols is not None
+        assert calc._kc_cols[2].startswith("KCU")
+
+    def test_duplicate_bar_returns_cached_snapshot(self, calc):
+        """Re-delivering the same bar should not recompute or re-buffer it."""
+        prices = [5000.0 + (i % 5) * 0.25 for i in range(30)]
+        bars = _make_bars(prices)
+
+        result = None
+        for bar in bars:
+            result = calc.update(bar)
+        buffered = len(calc._bars)
+        vwap_volume = calc._vwap_cum_vol
+
+        again = calc.update(bars[-1].model_copy())
+        assert again is result
+        assert len(calc._bars) == buffered
+        assert calc._vwap_cum_vol == vwap_volume
+
+    def test_changed_bar_same_timestamp_recomputes(self, calc):
+        """A partial-bar update (same timestamp, new close) is not a duplicate."""
+        prices = [5000.0 + (i % 5) * 0.25 for i in range(30)]
+        bars = _make_bars(prices)
+
+        result = None
+        for bar in bars:
+            result = calc.update(bar)
+
+        revised = bars[-1].model_copy(update={"close": bars[-1].close + 1.0})
+        assert calc.update(revised) is not result
+
+
+class TestResolveColumns:
+    def test_matches_prefixes_in_order(self):
+        cols = pd.Index(["BBU_20_2.0", "BBL_20_2.0", "BBB_20_2.0", "BBM_20_2.0"])
+        assert _resolve_columns(cols, ("BBL", "BBM", "BBU")) == (
+            "BBL_20_2.0", "BBM_20_2.0", "BBU_20_2.0",
+        )
+
+    def test_missing_prefix_returns_none(self):
+        cols = pd.Index(["KCLe_20_1.5", "KCUe_20_1.5"])
+        assert _resolve_columns(cols, ("KCL", "KCB", "KCU")) is None
+
+
+class TestKahanAdd:
+    def test_retains_small_increments(self):
+        """Compensated sum keeps increments a plain float sum would drop."""
+        total, comp = 1e16, 0.0
+        naive = 1e16
+        for _ in range(10):
+            total, comp = _kahan_add(total, comp, 1.0)
+            naive += 1.0
+
+        assert naive == 1e16
+        assert total == 1e16 + 10
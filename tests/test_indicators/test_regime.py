@@ -1,8 +1,10 @@
 """Tests for market regime detection."""
 
+import math
 import random
 from datetime import UTC, datetime, timedelta
 
+import numpy as np
 import pytest
 
 from src.core.models import Bar
@@ -64,6 +66,54 @@ def _make_trending_bars(count=200, start_price=5000.0, trend=2.0, seed=99) -> li
     return bars
 
 
+def _record_5m_bars(detector: RegimeDetector) -> list[Bar]:
+    """Capture the 5m bars a detector aggregates from its 1m bars."""
+    seen: list[Bar] = []
+    on_5m_bar = detector.on_5m_bar
+
+    def record(bar: Bar) -> RegimeState:
+        seen.append(bar)
+        return on_5m_bar(bar)
+
+    detector.on_5m_bar = record
+    return seen
+
+
+def _reference_adx(bars: list[Bar], n: int) -> float:
+    """Wilder ADX over the full bar history, or NaN with fewer than 2*n bars."""
+    if len(bars) < 2 * n:
+        return math.nan
+    tr_s = pdm_s = ndm_s = adx = 0.0
+    for i in range(1, len(bars)):
+        bar, prev = bars[i], bars[i - 1]
+        tr = max(bar.high - bar.low, abs(bar.high - prev.close), abs(bar.low - prev.close))
+        up = bar.high - prev.high
+        down = prev.low - bar.low
+        pdm = up if (up > down and up > 0.0) else 0.0
+        ndm = down if (down > up and down > 0.0) else 0.0
+        if i <= n:
+            tr_s += tr / n
+            pdm_s += pdm / n
+            ndm_s += ndm / n
+            if i < n:
+                continue
+        else:
+            tr_s = (tr_s * (n - 1) + tr) / n
+            pdm_s = (pdm_s * (n - 1) + pdm) / n
+            ndm_s = (ndm_s * (n - 1) + ndm) / n
+        dx = 0.0
+        if tr_s > 0.0:
+            pdi = 100.0 * pdm_s / tr_s
+            ndi = 100.0 * ndm_s / tr_s
+            if pdi + ndi > 0.0:
+                dx = 100.0 * abs(pdi - ndi) / (pdi + ndi)
+        if i - n < n:
+            adx += dx / n
+        else:
+            adx = (adx * (n - 1) + dx) / n
+    return adx
+
+
 class TestRegimeState:
     def test_default_state_is_ranging(self):
         state = RegimeState()
@@ -91,6 +141,13 @@ class TestRegimeDetector:
             detector.on_5m_bar(bar)
         assert detector.state.regime == MarketRegime.RANGING
 
+    def test_no_classification_during_warmup(self):
+        detector = RegimeDetector()
+        for bar in _make_bars(detector._min_5m_bars - 1):
+            detector.on_5m_bar(bar)
+        assert detector.state.adx is None
+        assert detector.state.squeeze_active is False
+
     def test_processes_bars_without_error(self):
         detector = RegimeDetector()
         bars = _make_bars(200)
@@ -132,24 +189,105 @@ class TestBarAggregation:
         expected_close = bars[-1].close
         expected_volume = sum(b.volume for b in bars)
 
+        seen = _record_5m_bars(detector)
         for bar in bars:
             detector.on_1m_bar(bar)
 
         # Check that one 5m bar was created
-        assert len(detector._5m_bars) == 1
-        bar_5m = detector._5m_bars[0]
-        assert bar_5m.open == expected_open
-        assert bar_5m.high == expected_high
-        assert bar_5m.low == expected_low
-        assert bar_5m.close == expected_close
-        assert bar_5m.volume == expected_volume
+        assert len(seen) == 1
+        assert seen[0].open == expected_open
+        assert seen[0].high == expected_high
+        assert seen[0].low == expected_low
+        assert seen[0].close == expected_close
+        assert seen[0].volume == expected_volume
 
     def test_multiple_aggregations(self):
         detector = RegimeDetector()
+        seen = _record_5m_bars(detector)
         bars = _make_bars(15)  # Should produce 3 x 5m bars
         for bar in bars:
             detector.on_1m_bar(bar)
-        assert len(detector._5m_bars) == 3
+        assert len(seen) == 3
+
+    def test_second_window_starts_fresh(self):
+        """Each 5m bar aggregates only its own five 1m bars."""
+        detector = RegimeDetector()
+        seen = _record_5m_bars(detector)
+        bars = _make_bars(12)
+        for bar in bars:
+            detector.on_1m_bar(bar)
+
+        second = bars[5:10]
+        assert len(seen) == 2
+        assert detector._agg_n == 2  # Two 1m bars waiting for the next 5m bar
+        assert seen[1].open == second[0].open
+        assert seen[1].high == max(b.high for b in second)
+        assert seen[1].low == min(b.low for b in second)
+        assert seen[1].volume == sum(b.volume for b in second)
+
+
+class TestAdxState:
+    def test_matches_full_history_adx(self):
+        detector = RegimeDetector()
+        bars = _make_trending_bars(150)
+        for bar in bars:
+            detector.on_5m_bar(bar)
+        expected = _reference_adx(bars, detector.adx_period)
+        assert detector.state.adx == pytest.approx(expected)
+
+    def test_available_once_full_history_adx_is(self):
+        detector = RegimeDetector(adx_period=14, bb_period=10, kc_period=10)
+        bars = _make_bars(40)
+        for k, bar in enumerate(bars, 1):
+            detector.on_5m_bar(bar)
+            ready = not math.isnan(_reference_adx(bars[:k], 14))
+            assert (detector._current_adx() is not None) == ready
+
+
+class TestSqueezeState:
+    def test_bollinger_matches_window_stats(self):
+        detector = RegimeDetector()
+        bars = _make_bars(150)
+        for bar in bars:
+            detector.on_5m_bar(bar)
+
+        closes = np.array([b.close for b in bars[-detector.bb_period:]])
+        assert detector._bb_mean == pytest.approx(closes.mean())
+        std = math.sqrt(detector._bb_m2 / detector.bb_period)
+        assert std == pytest.approx(closes.std(), rel=1e-9)
+
+    def test_keltner_basis_is_sma_seeded_ema(self):
+        detector = RegimeDetector()
+        bars = _make_bars(60)
+        for bar in bars:
+            detector.on_5m_bar(bar)
+
+        n = detector.kc_period
+        alpha = 2.0 / (n + 1)
+        ema = sum(b.close for b in bars[:n]) / n
+        for bar in bars[n:]:
+            ema += alpha * (bar.close - ema)
+        assert detector._kc_mid == pytest.approx(ema)
+
+    def test_no_squeeze_before_warmup(self):
+        detector = RegimeDetector()
+        for bar in _make_bars(detector.kc_period):
+            detector.on_5m_bar(bar)
+        assert detector._check_squeeze() is False
+
+    def test_tight_consolidation_after_wide_bars_is_squeeze(self):
+        """Closes pinned in a narrow band while bar ranges stay wide -> BB inside KC."""
+        detector = RegimeDetector()
+        base_time = datetime(2024, 1, 15, 9, 30, tzinfo=UTC)
+        for i in range(60):
+            close = 5000.0 + (0.25 if i % 2 else -0.25)
+            detector.on_5m_bar(Bar(
+                timestamp=base_time + timedelta(minutes=5 * i),
+                open=5000.0, high=close + 3.0, low=close - 3.0,
+                close=close, volume=1000,
+            ))
+        assert detector._check_squeeze() is True
+        assert detector.state.squeeze_active is True
 
 
 class TestHysteresis:
@@ -172,6 +310,18 @@ class TestHysteresis:
         # (the actual _update_regime does this logic internally)
         assert HYSTERESIS_BARS == 3  # Verify our expected hysteresis value
 
+    def test_pending_candidate_cleared_when_regime_confirmed(self, monkeypatch):
+        detector = RegimeDetector()
+        detector._5m_bars = detector._min_5m_bars
+        monkeypatch.setattr(detector, "_current_adx", lambda: 10.0)
+        detector._candidate_regime = MarketRegime.TRENDING
+        detector._candidate_count = 2
+
+        detector._update_regime()
+        assert detector.state.regime == MarketRegime.RANGING
+        assert detector._candidate_regime is None
+        assert detector._candidate_count == 0
+
 
 class TestRegimeClassification:
     def test_trending_bars_increase_adx(self):
@@ -1,7 +1,9 @@
 """Tests for TradeAnalyzer."""
 
+import math
 from datetime import UTC, datetime, timedelta
 
+import numpy as np
 import pytest
 
 from src.core.models import Direction, Trade, TradeStatus
@@ -119,6 +121,24 @@ class TestTradeAnalyzer:
         metrics = self.analyzer.analyze(trades)
         # Peak at 50, then drops to 50-30-20=0, so max dd = 50
         assert metrics.max_drawdown == pytest.approx(50.0)
+        assert metrics.max_drawdown_pct == pytest.approx(1.0)
+
+    def test_drawdown_from_flat_start(self):
+        """Losses before any positive peak count as drawdown with no percentage."""
+        trades = [
+            _make_trade(-40.0, entry_offset_min=0),
+            _make_trade(20.0, entry_offset_min=20),
+            _make_trade(-10.0, entry_offset_min=40),
+        ]
+        metrics = self.analyzer.analyze(trades)
+        assert metrics.max_drawdown == pytest.approx(40.0)
+        assert metrics.max_drawdown_pct == 0.0
+
+    def test_metrics_are_python_floats(self):
+        trades = [_make_trade(50.0), _make_trade(-20.0, entry_offset_min=20)]
+        metrics = self.analyzer.analyze(trades)
+        for value in (metrics.gross_profit, metrics.max_winner, metrics.max_drawdown):
+            assert type(value) is float
 
     def test_sharpe_ratio_single_trade(self):
         trades = [_make_trade(10.0)]
@@ -137,6 +157,14 @@ class TestTradeAnalyzer:
         assert metrics.sharpe_ratio is not None
         assert metrics.sharpe_ratio > 0  # Net positive P&L
 
+    def test_sharpe_annualization_factor(self):
+        pnl = np.array([10.0, -5.0, 15.0, -3.0, 8.0])
+        per_trade = pnl.mean() / pnl.std(ddof=1)
+        assert self.analyzer._compute_sharpe(pnl) == pytest.approx(per_trade * math.sqrt(252))
+        assert self.analyzer._compute_sharpe(pnl, periods_per_year=12) == pytest.approx(
+            per_trade * math.sqrt(12)
+        )
+
     def test_sharpe_none_for_constant_pnl(self):
         trades = [
             _make_trade(10.0, entry_offset_min=i * 20)
@@ -176,6 +204,16 @@ class TestTradeAnalyzer:
         metrics = self.analyzer.analyze(trades)
         assert metrics.avg_trade_duration_minutes == pytest.approx(15.0)
 
+    def test_duration_skips_trades_without_exit_time(self):
+        trades = [
+            _make_trade(10.0, duration_min=10),
+            _make_trade(20.0, entry_offset_min=30, duration_min=20),
+            _make_trade(5.0, entry_offset_min=60).model_copy(update={"exit_time": None}),
+        ]
+        metrics = self.analyzer.analyze(trades)
+        assert metrics.total_trades == 3
+        assert metrics.avg_trade_duration_minutes == pytest.approx(15.0)
+
     def test_open_trades_excluded(self):
         """Open trades should not be included in analysis."""
         open_trade = Trade(
@@ -0,0 +1,53 @@
+"""Tests for the compiled TradeAnalyzer loops."""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.journal._analyzer_kernels import max_drawdown, streaks
+from src.journal.analyzer import TradeAnalyzer
+
+
+def _random_pnl(count: int, seed: int = 7) -> np.ndarray:
+    rng = random.Random(seed)
+    return np.array([rng.choice([-1, 0, 1]) * rng.uniform(5, 50) for _ in range(count)])
+
+
+class TestStreaks:
+    def test_mixed_sequence(self):
+        pnl = np.array([10.0, 5.0, 3.0, -2.0, 4.0, -1.0, -1.0])
+        assert streaks(pnl) == (3, 2, -2)
+
+    def test_breakeven_resets_current(self):
+        pnl = np.array([10.0, 0.0])
+        assert streaks(pnl) == (1, 0, 0)
+
+    def test_empty(self):
+        assert streaks(np.empty(0)) == (0, 0, 0)
+
+
+class TestMaxDrawdown:
+    def test_drop_from_peak(self):
+        dd, dd_pct = max_drawdown(np.array([50.0, -30.0, -20.0, 60.0]))
+        assert dd == pytest.approx(50.0)
+        assert dd_pct == pytest.approx(1.0)
+
+    def test_loss_before_any_peak(self):
+        dd, dd_pct = max_drawdown(np.array([-40.0, 20.0]))
+        assert dd == pytest.approx(40.0)
+        assert dd_pct == 0.0
+
+
+class TestMatchesAnalyzer:
+    def test_kernels_agree_with_numpy_paths(self, monkeypatch):
+        """The compiled loops and the NumPy/Python fallbacks give the same answer."""
+        monkeypatch.setattr("src.journal.analyzer.HAS_NUMBA", False)
+        analyzer = TradeAnalyzer()
+        pnl = _random_pnl(500)
+
+        assert streaks(pnl) == analyzer._compute_streaks(pnl)
+        dd, dd_pct = max_drawdown(pnl)
+        ref_dd, ref_pct = analyzer._compute_max_drawdown(pnl)
+        assert dd == pytest.approx(ref_dd)
+        assert dd_pct == pytest.approx(ref_pct)
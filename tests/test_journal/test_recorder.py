@@ -1,13 +1,23 @@
 """Tests for TradeRecorder."""
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
 
 import pytest
 
-from src.core.database import Base, get_sqlite_engine, init_sqlite_db
+from src.core.database import (
+    Base,
+    EquitySnapshotRow,
+    RiskEventRow,
+    TradeRow,
+    get_session,
+    get_sqlite_engine,
+    init_sqlite_db,
+)
 from src.core.models import (
     Direction,
     EquitySnapshot,
+    RejectDetails,
     RiskEvent,
     Severity,
     Trade,
@@ -79,6 +89,24 @@ class TestRecordRiskEvent:
         )
         recorder.record_risk_event(event)  # Should not raise
 
+    def test_reject_details_stored_as_dict(self, recorder, sqlite_engine):
+        event = RiskEvent(
+            event_type="SIGNAL_REJECTED:RR_RATIO_CHECK",
+            details=RejectDetails("orb", "LONG", 5000.0, 4996.0, "low R:R"),
+            severity=Severity.WARNING,
+        )
+        recorder.record_risk_event(event)
+        recorder.flush()
+        session = get_session(sqlite_engine)
+        try:
+            row = session.query(RiskEventRow).one()
+        finally:
+            session.close()
+        assert row.details == {
+            "strategy": "orb", "direction": "LONG", "entry": 5000.0,
+            "stop": 4996.0, "reason": "low R:R",
+        }
+
 
 class TestRecordEquitySnapshot:
     def test_record_equity_snapshot(self, recorder):
@@ -115,6 +143,22 @@ class TestDailySummary:
         summary = recorder.generate_daily_summary("2024-01-15")
         assert summary.max_drawdown == pytest.approx(50.0)
 
+    def test_summary_totals_skip_other_accounts_and_open_trades(self, recorder):
+        recorder.record_trade(_make_trade(50.0, 0))
+        recorder.record_trade(_make_trade(0.0, 20))  # Breakeven
+        recorder.record_trade(_make_trade(-20.0, 40))
+        recorder.record_trade(_make_trade(99.0, 60).model_copy(update={"account_id": "other"}))
+        recorder.record_trade(_make_trade(10.0, 80).model_copy(update={"status": TradeStatus.OPEN}))
+
+        summary = recorder.generate_daily_summary("2024-01-15")
+        assert summary.total_trades == 3
+        assert summary.gross_pnl == pytest.approx(30.0)
+        assert summary.net_pnl == pytest.approx(30.0)
+        assert summary.avg_winner == pytest.approx(50.0)
+        assert summary.avg_loser == pytest.approx(-20.0)
+        assert summary.profit_factor == pytest.approx(2.5)
+        assert summary.max_drawdown == pytest.approx(20.0)
+
 
 class TestGetTradesForDate:
     def test_get_trades_for_date(self, recorder):
@@ -136,3 +180,83 @@ class TestResetDaily:
         assert len(recorder._today_trades) == 1
         recorder.reset_daily()
         assert len(recorder._today_trades) == 0
+
+
+class TestBatchedWrites:
+    @pytest.fixture
+    def file_engine(self, tmp_path):
+        engine = get_sqlite_engine(db_url=f"sqlite:///{tmp_path}/journal.db")
+        init_sqlite_db(engine)
+        return engine
+
+    def _committed_snapshots(self, engine) -> int:
+        session = get_session(engine)
+        try:
+            return session.query(EquitySnapshotRow).count()
+        finally:
+            session.close()
+
+    def _snapshot(self) -> EquitySnapshot:
+        return EquitySnapshot(equity=10000.0)
+
+    def test_rows_staged_until_batch_fills(self, file_engine):
+        recorder = TradeRecorder(sqlite_engine=file_engine, flush_every=3, flush_interval_s=3600)
+        recorder.record_equity_snapshot(self._snapshot())
+        recorder.record_equity_snapshot(self._snapshot())
+        assert self._committed_snapshots(file_engine) == 0
+
+        recorder.record_equity_snapshot(self._snapshot())
+        assert self._committed_snapshots(file_engine) == 3
+        recorder.close()
+
+    def test_flush_commits_partial_batch(self, file_engine):
+        recorder = TradeRecorder(sqlite_engine=file_engine, flush_every=100, flush_interval_s=3600)
+        recorder.record_equity_snapshot(self._snapshot())
+        recorder.flush()
+        assert self._committed_snapshots(file_engine) == 1
+        recorder.close()
+
+    def test_trade_committed_when_recorded(self, file_engine):
+        recorder = TradeRecorder(sqlite_engine=file_engine, flush_every=100, flush_interval_s=3600)
+        recorder.record_equity_snapshot(self._snapshot())
+        trade_id = recorder.record_trade(_make_trade(50.0))
+
+        # The trade commits at once, taking the staged snapshot with it
+        session = get_session(file_engine)
+        assert session.get(TradeRow, trade_id) is not None
+        session.close()
+        assert self._committed_snapshots(file_engine) == 1
+        recorder.close()
+
+    def test_failed_trade_logs_dropped_rows(self, file_engine, monkeypatch):
+        mock_logger = MagicMock()
+        monkeypatch.setattr("src.journal.recorder.logger", mock_logger)
+        recorder = TradeRecorder(sqlite_engine=file_engine, flush_every=100, flush_interval_s=3600)
+        recorder.record_equity_snapshot(self._snapshot())
+        recorder.record_equity_snapshot(self._snapshot())
+        monkeypatch.setattr(recorder, "_trade_to_values", lambda trade: {"strategy": None})
+
+        assert recorder.record_trade(_make_trade(50.0)) is None
+        mock_logger.error.assert_any_call("journal_batch_dropped", rows=2)
+        recorder.close()
+        assert self._committed_snapshots(file_engine) == 0
+
+    def test_trade_insert_applies_column_defaults(self, file_engine):
+        recorder = TradeRecorder(sqlite_engine=file_engine)
+        trade_id = recorder.record_trade(_make_trade(50.0))
+        recorder.close()
+
+        session = get_session(file_engine)
+        row = session.get(TradeRow, trade_id)
+        assert row.pnl_dollars == pytest.approx(50.0)
+        assert row.status == "CLOSED"
+        assert row.created_at is not None
+        session.close()
+
+    def test_closed_recorder_refuses_writes(self, file_engine):
+        recorder = TradeRecorder(sqlite_engine=file_engine)
+        recorder.close()
+        assert recorder.record_trade(_make_trade(50.0)) is None
+        recorder.record_equity_snapshot(self._snapshot())
+        assert recorder._session is None
+        assert self._committed_snapshots(file_engine) == 0
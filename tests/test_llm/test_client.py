@@ -1,5 +1,6 @@
 """Tests for OllamaClient."""
 
+import json
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, patch
 
@@ -29,6 +30,17 @@ def _make_trade(pnl: float = 50.0) -> Trade:
     )
 
 
+def _stream_response(*tokens: str) -> httpx.Response:
+    """Ollama-style NDJSON stream: one chunk per token, then a done marker."""
+    lines = [json.dumps({"response": t, "done": False}) for t in tokens]
+    lines.append(json.dumps({"response": "", "done": True}))
+    return httpx.Response(
+        200,
+        content="\n".join(lines).encode(),
+        request=httpx.Request("POST", "http://localhost:11434/api/generate"),
+    )
+
+
 class TestPromptBuilding:
     def test_trade_review_prompt(self):
         client = OllamaClient(host="http://localhost:11434", model="test")
@@ -39,6 +51,22 @@ class TestPromptBuilding:
         assert "50.00" in prompt
         assert "mean_reversion" in prompt
 
+    def test_trade_review_prompt_open_trade(self):
+        client = OllamaClient(host="http://localhost:11434", model="test")
+        trade = _make_trade(50.0).model_copy(update={
+            "exit_price": None,
+            "take_profit": None,
+            "pnl_dollars": None,
+            "signal_confidence": None,
+        })
+        prompt = client._build_trade_review_prompt(trade)
+        assert "Exit: (open)" in prompt
+        assert "Target: none" in prompt
+        assert "P&L: N/A" in prompt
+        assert "Confidence" not in prompt
+        assert "R:R Actual" not in prompt
+        assert "Strategy: mean_reversion\n\nWhat went right" in prompt
+
     def test_daily_summary_prompt(self):
         client = OllamaClient(host="http://localhost:11434", model="test")
         trades = [_make_trade(50.0), _make_trade(-20.0)]
@@ -63,41 +91,77 @@ class TestGenerate:
     @pytest.mark.asyncio
     async def test_generate_success(self):
         client = OllamaClient(host="http://localhost:11434", model="test")
-        mock_response = httpx.Response(
-            200,
-            json={"response": "This is a good trade."},
-            request=httpx.Request("POST", "http://localhost:11434/api/generate"),
-        )
+        mock_response = _stream_response("This is ", "a good trade.")
 
-        with patch("httpx.AsyncClient.post", new_callable=AsyncMock, return_value=mock_response):
+        with patch("httpx.AsyncClient.send", new_callable=AsyncMock, return_value=mock_response):
             result = await client.generate("test prompt")
             assert result == "This is a good trade."
 
     @pytest.mark.asyncio
     async def test_generate_with_system(self):
         client = OllamaClient(host="http://localhost:11434", model="test")
-        mock_response = httpx.Response(
-            200,
-            json={"response": "Review complete."},
-            request=httpx.Request("POST", "http://localhost:11434/api/generate"),
-        )
+        mock_response = _stream_response("Review complete.")
 
-        with patch("httpx.AsyncClient.post", new_callable=AsyncMock, return_value=mock_response):
+        with patch(
+            "httpx.AsyncClient.send", new_callable=AsyncMock, return_value=mock_response
+        ) as send:
             result = await client.generate("test", system="You are a coach.")
             assert result == "Review complete."
 
+        payload = json.loads(send.call_args.kwargs["request"].content)
+        assert payload["system"] == "You are a coach."
+        assert payload["stream"] is True
 
-class TestReviewTrade:
     @pytest.mark.asyncio
-    async def test_review_trade(self):
+    async def test_generate_stream_yields_tokens(self):
+        client = OllamaClient(host="http://localhost:11434", model="test")
+        mock_response = _stream_response("Good ", "entry ", "timing.")
+
+        with patch("httpx.AsyncClient.send", new_callable=AsyncMock, return_value=mock_response):
+            tokens = [t async for t in client.generate_stream("test")]
+        assert tokens == ["Good ", "entry ", "timing."]
+
+    @pytest.mark.asyncio
+    async def test_stream_lines_split_across_chunks(self):
         client = OllamaClient(host="http://localhost:11434", model="test")
+        body = (
+            b'{"response": "Hel", "done": false}\n{"respo'
+            b'nse": "lo", "done": false}\n{"response": "", "done": true}'
+        )
+
+        async def byte_chunks():
+            yield body[:20]
+            yield body[20:45]
+            yield body[45:]
+
         mock_response = httpx.Response(
             200,
-            json={"response": "Good entry timing."},
+            content=byte_chunks(),
             request=httpx.Request("POST", "http://localhost:11434/api/generate"),
         )
 
-        with patch("httpx.AsyncClient.post", new_callable=AsyncMock, return_value=mock_response):
+        with patch("httpx.AsyncClient.send", new_callable=AsyncMock, return_value=mock_response):
+            assert await client.generate("test") == "Hello"
+
+    @pytest.mark.asyncio
+    async def test_generate_http_error(self):
+        client = OllamaClient(host="http://localhost:11434", model="test")
+        mock_response = httpx.Response(
+            500, request=httpx.Request("POST", "http://localhost:11434/api/generate"),
+        )
+
+        with patch("httpx.AsyncClient.send", new_callable=AsyncMock, return_value=mock_response):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.generate("test")
+
+
+class TestReviewTrade:
+    @pytest.mark.asyncio
+    async def test_review_trade(self):
+        client = OllamaClient(host="http://localhost:11434", model="test")
+        mock_response = _stream_response("Good entry timing.")
+
+        with patch("httpx.AsyncClient.send", new_callable=AsyncMock, return_value=mock_response):
             result = await client.review_trade(_make_trade())
             assert "Good entry timing." in result
 
@@ -137,3 +201,65 @@ class TestIsAvailable:
             side_effect=httpx.ConnectError("Connection refused"),
         ):
             assert await client.is_available() is False
+
+
+    @pytest.mark.asyncio
+    async def test_result_cached_within_ttl(self):
+        client = OllamaClient(host="http://localhost:11434", model="test-model")
+        mock_response = httpx.Response(
+            200,
+            json={"models": [{"name": "test-model:latest"}]},
+            request=httpx.Request("GET", "http://localhost:11434/api/tags"),
+        )
+
+        with patch(
+            "httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_response
+        ) as get:
+            assert await client.is_available() is True
+            assert await client.is_available() is True
+            assert get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_refetches_after_ttl(self):
+        client = OllamaClient(
+            host="http://localhost:11434", model="test-model", availability_ttl=0.0
+        )
+
+        with patch(
+            "httpx.AsyncClient.get",
+            new_callable=AsyncMock,
+            side_effect=httpx.ConnectError("Connection refused"),
+        ) as get:
+            assert await client.is_available() is False
+            assert await client.is_available() is False
+            assert get.call_count == 2
+
+
+class TestConnectionPooling:
+    @pytest.mark.asyncio
+    async def test_client_reused_across_calls(self):
+        client = OllamaClient(host="http://localhost:11434", model="test")
+        with patch(
+            "httpx.AsyncClient.send",
+            new_callable=AsyncMock,
+            side_effect=lambda *a, **kw: _stream_response("ok"),
+        ):
+            await client.generate("one")
+            first = client._client
+            await client.generate("two")
+            assert client._client is first
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_client(self):
+        client = OllamaClient(host="http://localhost:11434", model="test")
+        http_client = client._get_client()
+        await client.close()
+        assert http_client.is_closed
+        assert client._client is None
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes(self):
+        async with OllamaClient(host="http://localhost:11434", model="test") as client:
+            http_client = client._get_client()
+        assert http_client.is_closed
@@ -0,0 +1,127 @@
+"""Tests for TradingApp shutdown."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy import func, select
+
+from src.core.database import (
+    RiskEventRow,
+    SignalRow,
+    TradeRow,
+    get_session,
+    get_sqlite_engine,
+    init_sqlite_db,
+)
+from src.core.models import Direction, Signal, Trade, TradeStatus
+from src.journal.recorder import TradeRecorder
+from src.main import TradingApp
+from src.risk.manager import RiskManager
+from src.signals.generator import SignalGenerator
+
+# Wednesday 10AM CT, inside trading hours
+_TRADING_TIME = datetime(2025, 1, 15, 10, 0, tzinfo=ZoneInfo("America/Chicago"))
+
+
+def _make_signal(target: float = 5008.0) -> Signal:
+    return Signal(
+        strategy="mean_reversion",
+        symbol="MES",
+        direction=Direction.LONG,
+        confidence=0.7,
+        entry_price=5000.0,
+        stop_loss=4996.0,
+        take_profit=target,
+        reason="test signal",
+    )
+
+
+def _make_trade() -> Trade:
+    return Trade(
+        strategy="mean_reversion",
+        direction=Direction.LONG,
+        entry_price=5000.0,
+        exit_price=5002.0,
+        stop_loss=4996.0,
+        take_profit=5008.0,
+        quantity=1,
+        entry_time=_TRADING_TIME,
+        exit_time=_TRADING_TIME,
+        status=TradeStatus.CLOSED,
+        pnl_ticks=8.0,
+        pnl_dollars=10.0,
+    )
+
+
+@pytest.fixture
+def app(tmp_path):
+    """A TradingApp around a real journal, with the live connections mocked."""
+    engine = get_sqlite_engine(db_url=f"sqlite:///{tmp_path}/journal.db")
+    init_sqlite_db(engine)
+
+    app = TradingApp.__new__(TradingApp)  # Skip the broker/LLM wiring in __init__
+    app.sqlite_engine = engine
+    app.duckdb_writer = ThreadPoolExecutor(max_workers=1)
+    app.sqlite_writer = ThreadPoolExecutor(max_workers=1)
+    app.trade_recorder = TradeRecorder(sqlite_engine=engine, flush_interval_s=3600)
+    app.signal_generator = SignalGenerator(
+        strategies=[], sqlite_engine=engine,
+        flush_interval_s=3600, executor=app.sqlite_writer,
+    )
+    app.risk_managers = {"acct": RiskManager(account_equity=10000)}
+    app.order_managers = {}
+    app.aggregator = MagicMock()
+    app.indicator_writer = MagicMock()
+    app.scheduler = MagicMock()
+    app.tv_provider = AsyncMock()
+    app.tv_auth = AsyncMock()
+    app.ollama_client = AsyncMock()
+    app.health = MagicMock(aclose=AsyncMock())
+    app.duckdb_conn = MagicMock()
+    app._ai_review_workers = []
+    app._dashboard_proc = None
+    return app
+
+
+def _count(engine, row_type) -> int:
+    session = get_session(engine)
+    try:
+        return session.execute(select(func.count()).select_from(row_type)).scalar_one()
+    finally:
+        session.close()
+
+
+class TestShutdown:
+    async def test_signal_from_final_bar_journaled(self, app):
+        # The aggregator flush emits the last partial bar through the pipeline
+        def final_bar():
+            app.signal_generator.evaluate_signal_for_accounts(
+                _make_signal(), atr=3.0, risk_managers=app.risk_managers,
+                current_time=_TRADING_TIME,
+            )
+
+        app.aggregator.flush.side_effect = final_bar
+        await app.shutdown()
+
+        assert _count(app.sqlite_engine, SignalRow) == 1
+
+    async def test_trade_closed_on_final_bar_journaled(self, app):
+        app.aggregator.flush.side_effect = lambda: app.trade_recorder.record_trade(_make_trade())
+        await app.shutdown()
+
+        assert _count(app.sqlite_engine, TradeRow) == 1
+
+    async def test_rejection_on_final_bar_journaled(self, app):
+        def final_bar():
+            app.signal_generator.evaluate_signal_for_accounts(
+                _make_signal(target=5002.0), atr=3.0,  # Bad R:R
+                risk_managers=app.risk_managers, current_time=_TRADING_TIME,
+            )
+
+        app.aggregator.flush.side_effect = final_bar
+        await app.shutdown()
+
+        assert _count(app.sqlite_engine, RiskEventRow) == 1
@@ -0,0 +1,94 @@
+"""Tests for TradovateProvider chart bar handling."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.market_data.tradovate_provider import TradovateProvider
+
+_T0 = 1_704_200_400_000  # 2024-01-02 13:00:00 UTC, epoch ms
+
+
+def _bar(offset_s: int, close: float, high: float | None = None,
+         low: float | None = None, volume: int = 10) -> dict:
+    return {
+        "timestamp": _T0 + offset_s * 1000,
+        "open": 5000.0,
+        "high": high if high is not None else max(close, 5000.0),
+        "low": low if low is not None else min(close, 5000.0),
+        "close": close,
+        "upVolume": volume,
+        "downVolume": 0,
+    }
+
+
+def _chart(*bars: dict, chart_id: int = 7) -> str:
+    return json.dumps([{"e": "chart", "d": {"charts": [{"id": chart_id, "bars": list(bars)}]}}])
+
+
+@pytest.fixture
+def emitted():
+    return []
+
+
+@pytest.fixture
+def provider(emitted):
+    return TradovateProvider(
+        auth=MagicMock(),
+        config=SimpleNamespace(md_ws_url="wss://md.example"),
+        on_bar=emitted.append,
+    )
+
+
+class TestChartBars:
+    def test_forming_bar_emitted_with_final_update(self, provider, emitted):
+        provider._handle_payload(_chart(_bar(0, 5001.0, volume=3)))
+        provider._handle_payload(_chart(_bar(0, 5003.0, high=5004.0, volume=8)))
+        provider._handle_payload(_chart(_bar(0, 4999.0, high=5004.0, low=4998.0, volume=12)))
+        assert emitted == []
+
+        provider._handle_payload(_chart(_bar(5, 5000.0)))
+
+        assert len(emitted) == 1
+        bar = emitted[0]
+        assert bar.high == 5004.0
+        assert bar.low == 4998.0
+        assert bar.close == 4999.0
+        assert bar.volume == 12
+
+    def test_redelivered_history_not_emitted_twice(self, provider, emitted):
+        provider._handle_payload(_chart(_bar(0, 5001.0), _bar(5, 5002.0), _bar(10, 5003.0)))
+        assert [b.close for b in emitted] == [5001.0, 5002.0]
+
+        # A resubscribe replays the history, then the stream moves on
+        provider._handle_payload(_chart(_bar(0, 5001.0), _bar(5, 5002.0), _bar(10, 5003.5)))
+        provider._handle_payload(_chart(_bar(15, 5004.0)))
+        assert [b.close for b in emitted] == [5001.0, 5002.0, 5003.5]
+
+
+def _connect(provider: TradovateProvider) -> AsyncMock:
+    ws = AsyncMock()
+    provider._ws = ws
+    provider._connected = True
+    return ws
+
+
+class TestChartSubscription:
+    async def test_bars_tagged_with_subscribed_symbol(self, provider, emitted):
+        ws = _connect(provider)
+        assert await provider.subscribe_realtime_bars("MNQ")
+
+        endpoint, _, _, body = ws.send.call_args.args[0].split("\n", 3)
+        assert endpoint == "md/getChart"
+        assert json.loads(body)["symbol"] == "MNQ"
+
+        provider._handle_payload(_chart(_bar(0, 5001.0), _bar(5, 5002.0)))
+        assert [b.symbol for b in emitted] == ["MNQ"]
+
+    async def test_not_connected(self, provider):
+        assert not await provider.subscribe_realtime_bars("MES")
+        assert provider._subscribed_symbol is None
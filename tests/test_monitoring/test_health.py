@@ -0,0 +1,129 @@
+"""Tests for HealthMonitor."""
+
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+
+from src.monitoring.health import HealthMonitor, HealthStatus, ServiceStatus
+
+
+def _monitor(cache_ttl: float = 60.0) -> tuple[HealthMonitor, MagicMock]:
+    monitor = HealthMonitor(cache_ttl=cache_ttl)
+    duckdb_conn = MagicMock()
+    probe = duckdb_conn.cursor.return_value
+    probe.execute.return_value.fetchone.return_value = (1,)
+    monitor.register_duckdb(duckdb_conn)
+    return monitor, probe
+
+
+UP, DOWN = ServiceStatus.UP, ServiceStatus.DOWN
+DEGRADED, UNKNOWN = ServiceStatus.DEGRADED, ServiceStatus.UNKNOWN
+
+
+class TestOverallStatus:
+    @pytest.mark.parametrize("statuses, expected", [
+        ((UP, UP, UP), UP),
+        ((UP, DEGRADED, DOWN), DOWN),
+        ((DEGRADED, UNKNOWN, UP), DEGRADED),
+        ((UP, UNKNOWN, UP), UNKNOWN),
+        ((UNKNOWN, UNKNOWN, UNKNOWN), UNKNOWN),
+    ])
+    def test_precedence(self, statuses, expected):
+        status = HealthStatus(
+            broker_status=statuses[0],
+            duckdb_status=statuses[1],
+            sqlite_status=statuses[2],
+        )
+        assert status.overall_status is expected
+
+
+class TestCheckAllCache:
+    def test_repeat_call_within_ttl_is_cached(self):
+        monitor, conn = _monitor()
+        first = monitor.check_all()
+        second = monitor.check_all()
+        assert second is first
+        assert first.duckdb_status == ServiceStatus.UP
+        assert conn.execute.call_count == 1
+
+    def test_force_bypasses_cache(self):
+        monitor, conn = _monitor()
+        monitor.check_all()
+        monitor.check_all(force=True)
+        assert conn.execute.call_count == 2
+
+    def test_expired_cache_reprobes(self):
+        monitor, conn = _monitor(cache_ttl=0.0)
+        monitor.check_all()
+        monitor.check_all()
+        assert conn.execute.call_count == 2
+
+
+class TestCheckAllAsync:
+    async def test_runs_probes_and_collects_errors(self, monkeypatch):
+        monitor, _ = _monitor()
+        broker = MagicMock(connected=False)
+        monitor.register_broker(broker)
+
+        async def ollama_up(host):
+            monitor.status.ollama_status = ServiceStatus.UP
+
+        monkeypatch.setattr(monitor, "check_ollama", ollama_up)
+        status = await monitor.check_all_async()
+        assert status.duckdb_status == ServiceStatus.UP
+        assert status.ollama_status == ServiceStatus.UP
+        assert status.broker_status == ServiceStatus.DOWN
+        assert status.errors == ["Broker disconnected"]
+
+    async def test_shares_cache_with_check_all(self):
+        monitor, conn = _monitor()
+        monitor.check_all()
+        await monitor.check_all_async()
+        assert conn.execute.call_count == 1
+
+
+class TestProbeConnections:
+    def test_duckdb_probe_uses_cursor(self):
+        monitor, probe = _monitor()
+        monitor.check_all()
+        probe.execute.assert_called_once_with("SELECT 1")
+
+    def test_sqlite_probe_connection_held_open(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'trades.db'}")
+        monitor = HealthMonitor(cache_ttl=0.0)
+        monitor.register_sqlite(engine)
+
+        assert monitor.check_all().sqlite_status == ServiceStatus.UP
+        conn = monitor._sqlite_health_conn
+        monitor.check_all()
+        assert monitor._sqlite_health_conn is conn
+        assert engine.pool.checkedout() == 0
+
+        monitor.close()
+        assert monitor._sqlite_health_conn is None
+
+    def test_sqlite_probe_uses_dialect_ping(self, tmp_path, monkeypatch):
+        engine = create_engine(f"sqlite:///{tmp_path / 'trades.db'}")
+        monitor = HealthMonitor()
+        monitor.register_sqlite(engine)
+        monkeypatch.setattr(monitor._sqlite_engine.dialect, "do_ping", lambda conn: False)
+        assert monitor.check_all().sqlite_status == ServiceStatus.DEGRADED
+
+
+class TestCheckOllama:
+    async def test_client_reused_across_checks(self):
+        monitor = HealthMonitor()
+        monitor._http = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200))
+        )
+        client = monitor._http
+        await monitor.check_ollama()
+        await monitor.check_ollama()
+        assert monitor._http is client
+        assert monitor.status.ollama_status == ServiceStatus.UP
+
+        await monitor.aclose()
+        assert client.is_closed
+        assert monitor._http is None
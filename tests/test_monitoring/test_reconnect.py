@@ -0,0 +1,83 @@
+"""Tests for ReconnectManager."""
+
+import time
+
+import pytest
+
+from src.monitoring.reconnect import ReconnectManager
+
+
+async def _never_connects():
+    return False
+
+
+class TestBackoffDelay:
+    def test_delay_grows_to_cap(self):
+        manager = ReconnectManager(_never_connects, max_delay=5.0, jitter=False)
+        delays = []
+        for attempt in range(5):
+            manager._attempts = attempt
+            delays.append(manager._next_delay())
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_jitter_stays_within_ceiling(self):
+        manager = ReconnectManager(_never_connects)
+        manager._attempts = 3
+        for _ in range(100):
+            delay = manager._next_delay()
+            assert 0.0 <= delay <= manager.current_delay
+            assert manager._last_delay == delay
+
+
+class TestReset:
+    def test_reset_clears_attempts(self):
+        manager = ReconnectManager(_never_connects)
+        manager._attempts = 4
+        manager.reset()
+        assert manager._attempts == 0
+
+    def test_reset_right_after_attempt_still_clears(self):
+        manager = ReconnectManager(_never_connects)
+        manager._attempts = 2
+        manager._last_attempt_at = time.monotonic()
+        manager.reset()
+        assert manager._attempts == 0
+
+
+class TestStart:
+    async def test_gives_up_after_max_attempts(self):
+        manager = ReconnectManager(_never_connects, initial_delay=0.0, max_attempts=2)
+        assert await manager.start() is False
+        assert manager._attempts == 2
+
+    async def test_reconnects(self):
+        async def connects():
+            return True
+
+        manager = ReconnectManager(connects, initial_delay=0.0)
+        assert await manager.start() is True
+        assert manager._last_delay == pytest.approx(0.0)
+
+    async def test_restart_right_after_attempt_waits_out_backoff(self):
+        attempted_at = []
+
+        async def connects():
+            attempted_at.append(time.monotonic())
+            return True
+
+        manager = ReconnectManager(
+            connects, initial_delay=0.05, max_attempts=1, jitter=False,
+        )
+        manager._attempts = 1  # Last window: 0.1s
+        manager._last_attempt_at = started = time.monotonic()
+
+        assert await manager.start() is True
+        # Hold for the rest of the 0.1s window, then the first attempt's 0.05s
+        assert attempted_at[0] - started >= 0.14
+        assert manager._attempts == 0
+
+    async def test_restart_after_backoff_window_does_not_wait(self):
+        manager = ReconnectManager(_never_connects, initial_delay=0.05)
+        manager._last_attempt_at = time.monotonic() - 1.0
+        assert manager._burst_hold() == 0.0
+
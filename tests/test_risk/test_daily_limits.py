@@ -4,7 +4,7 @@ import time
 
 import pytest
 
-from src.risk.daily_limits import DailyLimitsTracker
+from src.risk.daily_limits import MAX_RISK_EVENTS, DailyLimitsTracker
 
 
 class TestDailyLimitsTracker:
@@ -36,6 +36,13 @@ class TestDailyLimitsTracker:
     def test_weekly_loss_limit_dollars(self, tracker):
         assert tracker.weekly_loss_limit_dollars == 600.0  # 10000 * 0.06
 
+    def test_set_equity_updates_limits(self, tracker):
+        tracker.set_equity(20000)
+        assert tracker.daily_loss_limit_dollars == 600.0
+        assert tracker.weekly_loss_limit_dollars == 1200.0
+        tracker.update_unrealized(-400.0)
+        assert not tracker.daily_halted
+
     def test_record_winning_trade(self, tracker):
         tracker.record_trade_closed(50.0)
         assert tracker.realized_pnl_today == 50.0
@@ -146,7 +153,7 @@ class TestDailyLimitsTracker:
         assert tracker.unrealized_pnl == 0.0
         assert tracker.trades_today == 0
         assert not tracker.daily_halted
-        assert tracker.last_loss_time is None
+        assert tracker.last_loss_time_ns is None
 
     def test_reset_weekly(self, tracker):
         """Weekly reset clears everything."""
@@ -187,6 +194,12 @@ class TestDailyLimitsTracker:
         tracker.record_trade_closed(-50.0)  # Further loss
         assert len(tracker.events) == events_count  # No new event
 
+    def test_events_capped(self, tracker):
+        for _ in range(MAX_RISK_EVENTS + 5):
+            tracker.daily_halted = False
+            tracker.record_trade_closed(-300.0)
+        assert len(tracker.events) == MAX_RISK_EVENTS
+
     def test_multiple_small_losses_accumulate(self, tracker):
         """Many small losses can trigger the daily limit."""
         for _ in range(30):
@@ -1,6 +1,8 @@
 """Tests for the risk manager orchestrator."""
 
+from collections import deque
 from datetime import datetime
+from unittest.mock import MagicMock
 
 import pytz
 import pytest
@@ -189,6 +191,20 @@ class TestTradingHours:
         assert result.decision == RiskDecision.REJECTED
         assert "first" in result.reason.lower()
 
+    def test_boundaries_within_a_minute(self, manager):
+        """Lookup is per minute; the last second before a boundary is still open."""
+        assert manager._check_trading_hours(CT.localize(datetime(2025, 1, 15, 15, 54, 59)))[0]
+        ok, reason = manager._check_trading_hours(CT.localize(datetime(2025, 1, 15, 15, 55)))
+        assert not ok
+        assert "maintenance" in reason
+        assert manager._check_trading_hours(CT.localize(datetime(2025, 1, 15, 17, 5)))[0]
+
+    def test_skip_minutes_follow_config(self):
+        manager = RiskManager(account_equity=10000, risk_config={"skip_first_minutes": 10})
+        ok, reason = manager._check_trading_hours(CT.localize(datetime(2025, 1, 15, 17, 7)))
+        assert not ok
+        assert "first 10 minutes" in reason
+
 
 class TestPositionTracking:
     def test_record_position_opened(self, manager):
@@ -222,3 +238,38 @@ class TestEventLogging:
         manager.evaluate(signal, atr=3.0, current_time=trading_time)
         assert len(manager.events) >= 1
         assert "SIGNAL_REJECTED" in manager.events[0].event_type
+
+    def test_rejection_details(self, manager, trading_time):
+        signal = _make_signal(target=5002)
+        result = manager.evaluate(signal, atr=3.0, current_time=trading_time)
+        details = manager.events[0].details_dict()
+        assert details == {
+            "strategy": signal.strategy,
+            "direction": "LONG",
+            "entry": signal.entry_price,
+            "stop": signal.stop_loss,
+            "reason": result.reason,
+        }
+
+    def test_drain_events_returns_each_rejection_once(self, manager, trading_time):
+        manager.evaluate(_make_signal(target=5002), atr=3.0, current_time=trading_time)
+        manager.evaluate(_make_signal(target=5002), atr=3.0, current_time=trading_time)
+        drained = manager.drain_events()
+        assert [e.event_type for e in drained] == [
+            "SIGNAL_REJECTED:RR_RATIO_CHECK", "SIGNAL_REJECTED:RR_RATIO_CHECK",
+        ]
+        assert manager.drain_events() == []
+        assert len(manager.events) == 2
+
+    def test_full_journal_buffer_logs_dropped_event(
+        self, manager, trading_time, monkeypatch
+    ):
+        mock_logger = MagicMock()
+        monkeypatch.setattr("src.risk.manager.logger", mock_logger)
+        manager._unrecorded = deque(maxlen=2)
+        for _ in range(3):
+            manager.evaluate(_make_signal(target=5002), atr=3.0, current_time=trading_time)
+
+        assert len(manager.drain_events()) == 2
+        mock_logger.warning.assert_called_once()
+        assert mock_logger.warning.call_args.args == ("risk_event_dropped",)
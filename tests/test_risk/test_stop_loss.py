@@ -1,5 +1,7 @@
 """Tests for stop-loss calculation and trailing stop logic."""
 
+import random
+
 import pytest
 
 from src.core.models import Direction
@@ -9,6 +11,7 @@ from src.risk.stop_loss import (
     calculate_risk_reward_ratio,
     calculate_stop_distance_ticks,
     calculate_take_profit,
+    trail_stop_by_distance,
     update_trailing_stop,
     validate_stop_placement,
 )
@@ -183,6 +186,27 @@ class TestUpdateTrailingStop:
         assert activated is False
 
 
+class TestTrailStopByDistance:
+    def test_matches_atr_version(self):
+        by_atr = update_trailing_stop(
+            entry_price=5000, current_price=5005, current_stop=4996,
+            direction=Direction.LONG, atr=3.0, trailing_atr_multiple=1.5,
+        )
+        by_distance = trail_stop_by_distance(
+            entry_price=5000, current_price=5005, current_stop=4996,
+            direction=Direction.LONG, trail_distance=4.5,
+        )
+        assert by_distance == by_atr == (5000.5, True)
+
+    def test_zero_distance(self):
+        new_stop, activated = trail_stop_by_distance(
+            entry_price=5000, current_price=5010, current_stop=4996,
+            direction=Direction.LONG, trail_distance=0.0,
+        )
+        assert new_stop == 4996
+        assert activated is False
+
+
 class TestValidateStopPlacement:
     def test_valid_long_stop(self):
         valid, _ = validate_stop_placement(5000, 4996, Direction.LONG, atr=3.0)
@@ -239,3 +263,9 @@ class TestRoundToTick:
 
     def test_zero_tick_size(self):
         assert _round_to_tick(5000.13, 0) == 5000.13  # No rounding
+
+    def test_quarter_tick_matches_general_rounding(self):
+        rng = random.Random(3)
+        for _ in range(100_000):
+            price = rng.uniform(-1e6, 1e6)
+            assert _round_to_tick(price, 0.25) == round(round(price / 0.25) * 0.25, 10)
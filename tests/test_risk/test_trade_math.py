@@ -0,0 +1,94 @@
+"""Tests for the fused signal risk math."""
+
+import random
+
+import pytest
+
+from src.config import MES_SPEC, RISK_DEFAULTS
+from src.core.models import Direction, Signal
+from src.risk.position_sizer import calculate_position_size, validate_stop_distance
+from src.risk.stop_loss import (
+    calculate_risk_reward_ratio,
+    calculate_stop_distance_ticks,
+    validate_stop_placement,
+)
+from src.risk.trade_math import evaluate_trade_math
+
+
+def _make_signal(direction, entry, stop, target) -> Signal:
+    return Signal(
+        strategy="mean_reversion",
+        symbol="MES",
+        direction=direction,
+        confidence=0.7,
+        entry_price=entry,
+        stop_loss=stop,
+        take_profit=target,
+        reason="test signal",
+    )
+
+
+def _reference(signal, atr, equity, spec, config):
+    """(check, reason, contracts) via the standalone helpers, in evaluate order."""
+    ok, reason = validate_stop_placement(
+        signal.entry_price, signal.stop_loss, signal.direction, atr,
+        config["max_stop_distance_atr"], spec["tick_size"],
+    )
+    if not ok:
+        return "STOP_VALIDATION_CHECK", reason, 0
+    ticks = calculate_stop_distance_ticks(
+        signal.entry_price, signal.stop_loss, signal.direction, spec["tick_size"]
+    )
+    if not validate_stop_distance(ticks, atr / spec["tick_size"], config["max_stop_distance_atr"]):
+        return "ATR_DISTANCE_CHECK", f"Stop distance ({ticks} ticks) exceeds ATR limit", 0
+    if signal.take_profit is not None:
+        rr = calculate_risk_reward_ratio(
+            signal.entry_price, signal.stop_loss, signal.take_profit, signal.direction
+        )
+        if rr < config["min_risk_reward_ratio"]:
+            return "RR_RATIO_CHECK", (
+                f"R:R ratio ({rr:.2f}) below minimum ({config['min_risk_reward_ratio']})"
+            ), 0
+    size = calculate_position_size(
+        equity, ticks, spec["tick_value"], config["max_risk_per_trade"],
+        config["max_position_size"],
+    )
+    if size <= 0:
+        return "POSITION_SIZE_CHECK", (
+            "Position size calculated as 0 (insufficient equity or stop too wide)"
+        ), 0
+    return "", "", size
+
+
+class TestEvaluateTradeMath:
+    def test_long_setup_passes(self):
+        signal = _make_signal(Direction.LONG, 5000.0, 4996.0, 5008.0)
+        result = evaluate_trade_math(signal, 3.0, 10000.0, MES_SPEC, RISK_DEFAULTS)
+        assert result.check == ""
+        assert result.stop_ticks == pytest.approx(16.0)
+        assert result.rr_ratio == pytest.approx(2.0)
+        assert result.contracts > 0
+
+    def test_short_stop_on_wrong_side(self):
+        signal = _make_signal(Direction.SHORT, 5000.0, 4996.0, 4990.0)
+        result = evaluate_trade_math(signal, 3.0, 10000.0, MES_SPEC, RISK_DEFAULTS)
+        assert result.check == "STOP_VALIDATION_CHECK"
+        assert result.reason == "Short stop must be above entry price"
+
+    def test_matches_standalone_helpers(self):
+        rng = random.Random(7)
+        for _ in range(500):
+            direction = rng.choice([Direction.LONG, Direction.SHORT])
+            sign = 1 if direction == Direction.LONG else -1
+            entry = 5000.0 + 0.25 * rng.randint(-40, 40)
+            # Mostly tick-aligned stops, some not, some on the wrong side
+            stop = entry - sign * rng.choice([0.25 * rng.randint(-4, 60), rng.uniform(0.1, 8.0)])
+            target = rng.choice([None, entry + sign * 0.25 * rng.randint(0, 80)])
+            atr = rng.choice([0.0, rng.uniform(0.5, 6.0)])
+            equity = rng.choice([0.0, 500.0, 10000.0, 150000.0])
+            signal = _make_signal(direction, entry, stop, target)
+
+            result = evaluate_trade_math(signal, atr, equity, MES_SPEC, RISK_DEFAULTS)
+            assert (result.check, result.reason, result.contracts) == _reference(
+                signal, atr, equity, MES_SPEC, RISK_DEFAULTS
+            )
@@ -37,7 +37,7 @@ class TestSchedulerInit:
 
 
 class TestDailyResetJob:
-    def test_daily_reset_resets_tracker(self, daily_tracker, health_monitor, recorder):
+    async def test_daily_reset_resets_tracker(self, daily_tracker, health_monitor, recorder):
         daily_tracker.realized_pnl_today = -100.0
         daily_tracker.trades_today = 5
 
@@ -46,25 +46,25 @@ class TestDailyResetJob:
             health_monitor=health_monitor,
             trade_recorder=recorder,
         )
-        scheduler._daily_reset_job()
+        await scheduler._daily_reset_job()
 
         assert daily_tracker.realized_pnl_today == 0.0
         assert daily_tracker.trades_today == 0
 
-    def test_daily_reset_calls_generate_summary(self, daily_tracker, health_monitor):
+    async def test_daily_reset_calls_generate_summary(self, daily_tracker, health_monitor):
         recorder = MagicMock(spec=TradeRecorder)
         scheduler = TradingScheduler(
             daily_tracker=daily_tracker,
             health_monitor=health_monitor,
             trade_recorder=recorder,
         )
-        scheduler._daily_reset_job()
+        await scheduler._daily_reset_job()
         recorder.generate_daily_summary.assert_called_once()
         recorder.reset_daily.assert_called_once()
 
 
 class TestWeeklyResetJob:
-    def test_weekly_reset(self, daily_tracker, health_monitor):
+    async def test_weekly_reset(self, daily_tracker, health_monitor):
         daily_tracker.realized_pnl_week = -300.0
         daily_tracker.weekly_halted = True
 
@@ -72,7 +72,7 @@ class TestWeeklyResetJob:
             daily_tracker=daily_tracker,
             health_monitor=health_monitor,
         )
-        scheduler._weekly_reset_job()
+        await scheduler._weekly_reset_job()
 
         assert daily_tracker.realized_pnl_week == 0.0
         assert daily_tracker.weekly_halted is False
@@ -89,7 +89,7 @@ class TestHealthCheckJob:
 
 
 class TestEquitySnapshotJob:
-    def test_equity_snapshot_recorded(self, daily_tracker, health_monitor):
+    async def test_equity_snapshot_recorded(self, daily_tracker, health_monitor):
         snapshot = EquitySnapshot(equity=10050.0, unrealized_pnl=50.0)
         recorder = MagicMock(spec=TradeRecorder)
         getter = MagicMock(return_value=[snapshot])
@@ -100,18 +100,81 @@ class TestEquitySnapshotJob:
             trade_recorder=recorder,
             equity_getter=getter,
         )
-        scheduler._equity_snapshot_job()
+        await scheduler._equity_snapshot_job()
 
         getter.assert_called_once()
         recorder.record_equity_snapshot.assert_called_once_with(snapshot)
 
-    def test_no_getter_no_crash(self, daily_tracker, health_monitor):
+    async def test_no_getter_no_crash(self, daily_tracker, health_monitor):
         scheduler = TradingScheduler(
             daily_tracker=daily_tracker,
             health_monitor=health_monitor,
             equity_getter=None,
         )
-        scheduler._equity_snapshot_job()  # Should not raise
+        await scheduler._equity_snapshot_job()  # Should not raise
+
+
+class TestJournalFlushJob:
+    def test_flushes_recorder(self, daily_tracker):
+        recorder = MagicMock(spec=TradeRecorder)
+        scheduler = TradingScheduler(daily_tracker=daily_tracker, trade_recorder=recorder)
+        scheduler._journal_flush_job()
+        recorder.flush.assert_called_once()
+
+    def test_no_recorder_no_crash(self, daily_tracker):
+        scheduler = TradingScheduler(daily_tracker=daily_tracker)
+        scheduler._journal_flush_job()  # Should not raise
+
+
+class TestMarketDataFlushJob:
+    def test_runs_flush(self, daily_tracker):
+        flush = MagicMock()
+        scheduler = TradingScheduler(daily_tracker=daily_tracker, market_data_flush=flush)
+        scheduler._market_data_flush_job()
+        flush.assert_called_once()
+
+    def test_no_flush_no_crash(self, daily_tracker):
+        scheduler = TradingScheduler(daily_tracker=daily_tracker)
+        scheduler._market_data_flush_job()  # Should not raise
+
+
+class TestRiskEventFlushJob:
+    def test_runs_flush(self, daily_tracker):
+        flush = MagicMock()
+        scheduler = TradingScheduler(daily_tracker=daily_tracker, risk_event_flush=flush)
+        scheduler._risk_event_flush_job()
+        flush.assert_called_once()
+
+    def test_flush_failure_is_logged_not_raised(self, daily_tracker):
+        flush = MagicMock(side_effect=RuntimeError("db locked"))
+        scheduler = TradingScheduler(daily_tracker=daily_tracker, risk_event_flush=flush)
+        scheduler._risk_event_flush_job()  # Should not raise
+
+
+class TestSignalFlushJob:
+    def test_runs_flush(self, daily_tracker):
+        flush = MagicMock()
+        scheduler = TradingScheduler(daily_tracker=daily_tracker, signal_flush=flush)
+        scheduler._signal_flush_job()
+        flush.assert_called_once()
+
+    def test_flush_failure_is_logged_not_raised(self, daily_tracker):
+        flush = MagicMock(side_effect=RuntimeError("db locked"))
+        scheduler = TradingScheduler(daily_tracker=daily_tracker, signal_flush=flush)
+        scheduler._signal_flush_job()  # Should not raise
+
+
+class TestMarketDataDedupeJob:
+    def test_runs_dedupe(self, daily_tracker):
+        dedupe = MagicMock()
+        scheduler = TradingScheduler(daily_tracker=daily_tracker, market_data_dedupe=dedupe)
+        scheduler._market_data_dedupe_job()
+        dedupe.assert_called_once()
+
+    def test_dedupe_failure_is_logged_not_raised(self, daily_tracker):
+        dedupe = MagicMock(side_effect=RuntimeError("db locked"))
+        scheduler = TradingScheduler(daily_tracker=daily_tracker, market_data_dedupe=dedupe)
+        scheduler._market_data_dedupe_job()  # Should not raise
 
 
 class TestStartStop:
@@ -127,6 +190,34 @@ class TestStartStop:
         # APScheduler v3 async: shutdown completes but .running may lag
         # Just verify no error was raised
 
+    @pytest.mark.asyncio
+    async def test_jobs_coalesce_missed_runs(self, daily_tracker, health_monitor):
+        scheduler = TradingScheduler(
+            daily_tracker=daily_tracker,
+            health_monitor=health_monitor,
+            trade_recorder=MagicMock(flush_interval_s=1.0),
+            equity_getter=MagicMock(return_value=[]),
+            market_data_flush=MagicMock(),
+            market_data_dedupe=MagicMock(),
+            risk_event_flush=MagicMock(),
+            signal_flush=MagicMock(),
+        )
+        scheduler.start()
+        try:
+            for job_id, grace in [
+                ("health_check", 30), ("equity_snapshot", 30),
+                ("journal_flush", 30), ("risk_event_flush", 30),
+                ("signal_flush", 30), ("market_data_flush", 30),
+                ("market_data_dedupe", 2700),
+                ("daily_reset", 3600), ("weekly_reset", 3600),
+            ]:
+                job = scheduler.scheduler.get_job(job_id)
+                assert job.coalesce is True
+                assert job.max_instances == 1
+                assert job.misfire_grace_time == grace
+        finally:
+            scheduler.stop()
+
     def test_stop_when_not_running(self, daily_tracker, health_monitor):
         scheduler = TradingScheduler(
             daily_tracker=daily_tracker,
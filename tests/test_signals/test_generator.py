@@ -167,6 +167,7 @@ class TestSignalGenerator:
             sqlite_engine=sqlite_engine,
         )
         gen.on_bar(_make_bar(), _make_snapshot())
+        gen.flush()
 
         # Verify signal was written
         from src.core.database import SignalRow, get_session
@@ -177,6 +178,105 @@ class TestSignalGenerator:
         assert rows[0].strategy == "stub"
         session.close()
 
+    def test_signals_buffered_until_batch_full(self, sqlite_engine):
+        from src.core.database import SignalRow, get_session
+
+        strategy = StubStrategy(signal=_make_signal())
+        gen = SignalGenerator(
+            strategies=[strategy],
+            risk_manager=RiskManager(account_equity=10000.0),
+            sqlite_engine=sqlite_engine,
+            flush_every=3,
+            flush_interval_s=3600,
+        )
+
+        def count() -> int:
+            session = get_session(sqlite_engine)
+            try:
+                return session.query(SignalRow).count()
+            finally:
+                session.close()
+
+        gen.on_bar(_make_bar(), _make_snapshot())
+        gen.on_bar(_make_bar(), _make_snapshot())
+        assert count() == 0
+        gen.on_bar(_make_bar(), _make_snapshot())
+        assert count() == 3
+
+        gen.on_bar(_make_bar(), _make_snapshot())
+        gen.close()
+        assert count() == 4
+
+    def test_batch_insert_fills_columns_and_defaults(self, sqlite_engine):
+        from src.core.database import SignalRow, get_session
+
+        signal = _make_signal()
+        signal.market_context = _make_snapshot()
+        gen = SignalGenerator(
+            strategies=[StubStrategy(signal=signal)],
+            risk_manager=RiskManager(account_equity=10000.0),
+            sqlite_engine=sqlite_engine,
+        )
+        gen.on_bar(_make_bar(), _make_snapshot())
+        gen.on_bar(_make_bar(), _make_snapshot())
+        gen.close()
+
+        session = get_session(sqlite_engine)
+        rows = session.query(SignalRow).order_by(SignalRow.id).all()
+        assert [r.id for r in rows] == [1, 2]
+        for row in rows:
+            assert row.direction == "LONG"
+            assert row.executed is False
+            assert row.created_at is not None
+            assert row.market_context["bb_lower"] == 4990.0
+            assert isinstance(row.market_context["timestamp"], str)
+        session.close()
+
+    def test_market_context_dumped_once_per_snapshot(self):
+        signal = _make_signal()
+        assert signal.market_context_dict() is None
+
+        signal.market_context = _make_snapshot()
+        dumped = signal.market_context_dict()
+        assert signal.market_context_dict() is dumped
+        assert dumped == signal.market_context.model_dump(mode="json")
+
+        signal.market_context = _make_snapshot(close=5100.0)
+        assert signal.market_context_dict()["bb_lower"] == 5090.0
+
+    def test_writes_on_executor(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.core.database import SignalRow, get_session
+
+        # File database: each thread gets its own :memory: one
+        sqlite_engine = get_sqlite_engine(db_url=f"sqlite:///{tmp_path}/journal.db")
+        init_sqlite_db(sqlite_engine)
+        writer = ThreadPoolExecutor(max_workers=1)
+        gen = SignalGenerator(
+            strategies=[StubStrategy(signal=_make_signal())],
+            risk_manager=RiskManager(account_equity=10000.0),
+            sqlite_engine=sqlite_engine,
+            executor=writer,
+        )
+        gen.on_bar(_make_bar(), _make_snapshot())
+        gen.close()
+        writer.shutdown(wait=True)
+
+        session = get_session(sqlite_engine)
+        assert session.query(SignalRow).count() == 1
+        session.close()
+
+    def test_configures_wal_on_external_engine(self, tmp_path):
+        from sqlalchemy import create_engine, text
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'signals.db'}")
+        SignalGenerator(strategies=[], sqlite_engine=engine)
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        engine.dispose()
+
     def test_confidence_blended_with_confluence(self):
         """Signal confidence should be blended with confluence score."""
         signal = _make_signal(Direction.LONG, 5000.0)
@@ -189,3 +289,50 @@ class TestSignalGenerator:
 
         # After blending, confidence may differ from original
         assert len(results) == 1
+
+    def test_trending_regime_skips_strategies(self):
+        strategy = StubStrategy(signal=_make_signal())
+        strategy.generate_signal = MagicMock(return_value=_make_signal())
+        regime = MagicMock()
+        regime.state.signal_scaling = 0.0
+
+        gen = SignalGenerator(
+            strategies=[strategy],
+            risk_manager=RiskManager(account_equity=10000.0),
+            regime_detector=regime,
+        )
+        assert gen.on_bar(_make_bar(), _make_snapshot()) == []
+        assert gen.generate_signals(_make_bar(), _make_snapshot()) == []
+        strategy.generate_signal.assert_not_called()
+
+    def test_transitional_regime_scales_confidence(self):
+        regime = MagicMock()
+        regime.state.signal_scaling = 0.5
+        scaled = SignalGenerator(
+            strategies=[StubStrategy(signal=_make_signal())], regime_detector=regime,
+        ).generate_signals(_make_bar(), _make_snapshot())
+        unscaled = SignalGenerator(
+            strategies=[StubStrategy(signal=_make_signal())],
+        ).generate_signals(_make_bar(), _make_snapshot())
+        assert scaled[0].confidence == pytest.approx(unscaled[0].confidence * 0.5)
+
+    def test_confluence_scored_once_per_direction_and_price(self, monkeypatch):
+        import src.signals.generator as generator_module
+
+        calls = []
+        real = generator_module.direction_confluence
+
+        def counting(direction, price, snapshot):
+            calls.append((direction, price))
+            return real(direction, price, snapshot)
+
+        monkeypatch.setattr(generator_module, "direction_confluence", counting)
+        gen = SignalGenerator(strategies=[
+            StubStrategy(signal=_make_signal(Direction.LONG, 5000.0), name="a"),
+            StubStrategy(signal=_make_signal(Direction.LONG, 5000.0), name="b"),
+            StubStrategy(signal=_make_signal(Direction.LONG, 5001.0), name="c"),
+        ])
+        signals = gen.generate_signals(_make_bar(), _make_snapshot())
+
+        assert calls == [(Direction.LONG, 5000.0), (Direction.LONG, 5001.0)]
+        assert signals[0].confidence == signals[1].confidence
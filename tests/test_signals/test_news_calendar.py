@@ -1,6 +1,6 @@
 """Tests for economic event news calendar and blackout windows."""
 
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 
 import pytz
 import pytest
@@ -72,6 +72,20 @@ class TestEconomicEvent:
         assert event.is_blocked(ET.localize(datetime(2025, 1, 15, 9, 0))) is True
         assert event.is_blocked(ET.localize(datetime(2025, 1, 15, 9, 1))) is False
 
+    def test_naive_times_are_eastern(self):
+        event = EconomicEvent(name="CPI", event_time=datetime(2025, 1, 15, 8, 30), **CPI_BUFFER)
+        assert event.event_time == ET.localize(datetime(2025, 1, 15, 8, 30))
+        assert event.is_blocked(datetime(2025, 1, 15, 8, 15)) is True
+        # 8:10 AM CT = 9:10 AM ET, after the window
+        assert event.is_blocked(CT.localize(datetime(2025, 1, 15, 8, 10))) is False
+
+    def test_blackout_timestamps(self):
+        event_time = ET.localize(datetime(2025, 1, 29, 14, 0))
+        event = EconomicEvent(name="FOMC", event_time=event_time, **FOMC_BUFFER)
+        assert event.blackout_start_ts == event.blackout_start.timestamp()
+        assert event.blackout_end_ts == event.blackout_end.timestamp()
+        assert event.is_blocked_at(event_time.timestamp()) is True
+
 
 class TestNewsCalendar:
     def test_empty_calendar_not_blocked(self):
@@ -95,6 +109,50 @@ class TestNewsCalendar:
         blocked, _ = calendar.is_blocked(ET.localize(datetime(2025, 1, 29, 10, 0)))
         assert blocked is False
 
+    def test_blocked_by_earlier_overlapping_window(self):
+        """A long window still blocks after a later, shorter one has ended."""
+        calendar = NewsCalendar()
+        calendar.add_fomc(ET.localize(datetime(2025, 1, 29, 14, 0)))  # 13:30-15:00
+        calendar.add_event(EconomicEvent(
+            name="Speech", event_time=ET.localize(datetime(2025, 1, 29, 14, 10)),
+            pre_buffer_minutes=5, post_buffer_minutes=10,
+        ))  # 14:05-14:20
+
+        blocked, reason = calendar.is_blocked(ET.localize(datetime(2025, 1, 29, 14, 45)))
+        assert blocked is True
+        assert "FOMC" in reason
+
+    def test_matches_linear_scan(self):
+        import random
+
+        rng = random.Random(7)
+        base = ET.localize(datetime(2025, 1, 6, 8, 0))
+        events = [
+            EconomicEvent(
+                name=f"E{i}",
+                event_time=base + timedelta(minutes=rng.randrange(0, 5 * 24 * 60)),
+                pre_buffer_minutes=rng.randrange(0, 60),
+                post_buffer_minutes=rng.randrange(0, 120),
+            )
+            for i in range(200)
+        ]
+        calendar = NewsCalendar()
+        for event in events:
+            calendar.add_event(event)
+
+        for _ in range(500):
+            now = base + timedelta(minutes=rng.randrange(-60, 6 * 24 * 60))
+            blocked, reason = calendar.is_blocked(now)
+            covering = {e.name for e in events if e.is_blocked(now)}
+            assert blocked == bool(covering)
+            if blocked:
+                assert reason.split()[2] in covering
+
+        now = base + timedelta(days=2)
+        survivors = [e for e in events if e.blackout_end > now]
+        assert calendar.clear_past_events(now) == len(events) - len(survivors)
+        assert sorted(map(id, calendar.events)) == sorted(map(id, survivors))
+
     def test_next_event(self):
         calendar = NewsCalendar()
         fomc_time = ET.localize(datetime(2025, 1, 29, 14, 0))
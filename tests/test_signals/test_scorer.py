@@ -87,6 +87,22 @@ class TestScoreConfluence:
         score = score_confluence(signal, snapshot)
         assert 0.0 <= score <= 1.0
 
+    @pytest.mark.parametrize("direction, rsi, expected", [
+        (Direction.LONG, 35.0, 1.0),
+        (Direction.LONG, 45.0, 0.5),
+        (Direction.LONG, 45.5, 0.0),
+        (Direction.SHORT, 65.0, 1.0),
+        (Direction.SHORT, 55.0, 0.5),
+        (Direction.SHORT, 54.5, 0.0),
+    ])
+    def test_rsi_thresholds_mirror_by_direction(self, direction, rsi, expected):
+        signal = _make_signal(direction)
+        snapshot = _make_snapshot(
+            rsi_14=rsi, bb_lower=None, bb_upper=None, vwap=None,
+            ema_9=None, ema_21=None, keltner_lower=None, keltner_upper=None,
+        )
+        assert score_confluence(signal, snapshot) == expected
+
 
 class TestTimeOfDayAdjustment:
     def test_prime_hours_no_penalty(self):
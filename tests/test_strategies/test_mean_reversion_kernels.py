@@ -0,0 +1,48 @@
+"""Tests for the mean reversion predicate kernels."""
+
+import math
+
+from src.strategies._mean_reversion_kernels import LONG, SHORT, calc_confidence, check_entry
+
+NAN = math.nan
+
+
+def _entry(close, rsi, keltner_lower=4985.0, keltner_upper=5015.0, vwap=5000.0,
+           require_keltner=True, require_vwap=False):
+    return check_entry(
+        close, 4990.0, 5010.0, rsi, keltner_lower, keltner_upper, vwap,
+        0.0, 35.0, 65.0, require_keltner, require_vwap,
+    )
+
+
+class TestCheckEntry:
+    def test_long_and_short(self):
+        assert _entry(4990.0, 30.0) == LONG
+        assert _entry(5010.0, 70.0) == SHORT
+        assert _entry(5000.0, 50.0) == 0
+
+    def test_keltner_filter(self):
+        assert _entry(4980.0, 30.0) == 0
+        assert _entry(4980.0, 30.0, keltner_lower=NAN) == LONG
+        assert _entry(4980.0, 30.0, require_keltner=False) == LONG
+
+    def test_vwap_veto_does_not_fall_through(self):
+        # Below the lower band but above VWAP: vetoed, not checked as SHORT
+        assert _entry(4990.0, 30.0, vwap=4980.0, require_vwap=True) == 0
+        assert _entry(4990.0, 30.0, vwap=NAN, require_vwap=True) == LONG
+
+
+class TestCalcConfidence:
+    def test_missing_optional_inputs_add_nothing(self):
+        conf = calc_confidence(
+            LONG, 4990.0, 4990.0, 5010.0, 33.0, 3.0, NAN, NAN, NAN,
+            35.0, 65.0, 25.0, 75.0,
+        )
+        assert conf == 0.5
+
+    def test_bonuses_add_in_order(self):
+        conf = calc_confidence(
+            SHORT, 5011.0, 4990.0, 5010.0, 80.0, 3.0, 5000.0, 5002.0, 4998.0,
+            35.0, 65.0, 25.0, 75.0,
+        )
+        assert conf == 0.5 + 0.15 + 0.10 + 0.10 + 0.05